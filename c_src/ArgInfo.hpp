@@ -7,10 +7,13 @@ public:
     const char* name;
     bool outputarg;
     bool has_default;
+    // the converted value is stored and outlives the NIF call,
+    // e.g., it is assigned to a property or to a field of a struct
+    bool stored;
     // more fields may be added if necessary
 
-    ArgInfo(const char* name_, bool outputarg_, bool has_default_ = false) : 
-    name(name_), outputarg(outputarg_), has_default(has_default_) {}
+    ArgInfo(const char* name_, bool outputarg_, bool has_default_ = false, bool stored_ = false) : 
+    name(name_), outputarg(outputarg_), has_default(has_default_), stored(stored_) {}
 
 private:
     ArgInfo(const ArgInfo&) = delete;
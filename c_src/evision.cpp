@@ -39,6 +39,8 @@
 #include "erlcompat.hpp"
 #include "ArgInfo.hpp"
 #include "modules/evision_mat_api.h"
+#include "modules/evision_mat_allocator.h"
+#include "modules/evision_mat_memory.h"
 #include <map>
 
 #include <type_traits>  // std::enable_if
@@ -70,6 +72,10 @@ struct evision_res<cv::Mat *> {
     // function to be called to unref input data
     void (*in_unref)(void *, void *) = nullptr;
 
+    // bytes of data accounted by `evision_mat_res_account`
+    size_t bytes;
+    bool accounted;
+
     static ErlNifResourceType * type;
 };
 ErlNifResourceType * evision_res<cv::Mat *>::type = nullptr;
@@ -79,9 +85,12 @@ int alloc_resource(evision_res<cv::Mat *> **res) {
     evision_res<cv::Mat *> * tmp = (evision_res<cv::Mat *> *)enif_alloc_resource(evision_res<cv::Mat *>::type, sizeof(evision_res<cv::Mat *>));
 
     if (tmp != nullptr) {
+        tmp->val = nullptr;
         tmp->in_buf = nullptr;
         tmp->in_ref = nullptr;
         tmp->in_unref = nullptr;
+        tmp->bytes = 0;
+        tmp->accounted = false;
         *res = tmp;
 
         // 1: ok
@@ -92,6 +101,13 @@ int alloc_resource(evision_res<cv::Mat *> **res) {
     return 0;
 }
 
+// account the data of `res->val` to the live bytes of Mat resources
+static void evision_mat_res_account(ErlNifEnv *env, evision_res<cv::Mat *> * res) {
+    res->bytes = res->val->total() * res->val->elemSize();
+    res->accounted = true;
+    evision_mat_memory_acquire(env, res->bytes);
+}
+
 static bool isBindingsDebugEnabled()
 {
     static bool param_debug = cv::utils::getConfigurationParameterBool("OPENCV_EVISION_DEBUG", false);
@@ -168,11 +184,56 @@ static inline
 ERL_NIF_TERM evision_get_kw(ErlNifEnv *env, const std::map<std::string, ERL_NIF_TERM>& erl_terms, const std::string& key) {
     auto iter = erl_terms.find(key);
     if (iter == erl_terms.end()) {
-        return evision::nif::atom(env, "nil");
+        return evision::nif::atom_nil;
     }
     return iter->second;
 }
 
+#include "evision_generated_kw.h"
+
+// atoms of all keyword argument names, indexed by `evision_kw_*`
+static ERL_NIF_TERM evision_kw_atoms[evision_kw_count];
+
+static int evision_init_kw_atoms(ErlNifEnv *env) {
+    for (size_t i = 0; i < evision_kw_count; i++) {
+        evision_kw_atoms[i] = enif_make_atom(env, evision_kw_names[i]);
+    }
+    return true;
+}
+
+// Resolve keyword arguments in `opts` in a single pass.
+//
+// `kw_table` holds the `evision_kw_*` index of each keyword accepted by the caller, and
+// `kw_args[i]` is set to the value of keyword `kw_table[i]`, or `nil` if it is not given.
+// `num_kw_args` is set to the number of keyword arguments found in `opts`.
+static inline void evision_parse_kw(ErlNifEnv *env, ERL_NIF_TERM opts, const size_t * kw_table, size_t num_kw, ERL_NIF_TERM * kw_args, size_t& num_kw_args) {
+    for (size_t i = 0; i < num_kw; i++) {
+        kw_args[i] = evision::nif::atom_nil;
+    }
+
+    num_kw_args = 0;
+    ERL_NIF_TERM head, tail;
+    while (enif_get_list_cell(env, opts, &head, &tail)) {
+        int arity;
+        const ERL_NIF_TERM * kv = nullptr;
+        if (!enif_get_tuple(env, head, &arity, &kv)) {
+            return;
+        }
+
+        if (arity == 2 && enif_is_atom(env, kv[0])) {
+            num_kw_args++;
+            for (size_t i = 0; i < num_kw; i++) {
+                // atoms are immediate terms, so the same atom always has the same term value
+                if (kv[0] == evision_kw_atoms[kw_table[i]]) {
+                    kw_args[i] = kv[1];
+                    break;
+                }
+            }
+        }
+        opts = tail;
+    }
+}
+
 template<typename T> static
 bool evision_to(ErlNifEnv *env, ERL_NIF_TERM obj, T& p, const ArgInfo& info) { return Evision_Converter<T>::to(env, obj, p, info); }
 
@@ -190,11 +251,11 @@ ERL_NIF_TERM evision_from_as_map(ErlNifEnv *env, const T& src, ERL_NIF_TERM res_
     ERL_NIF_TERM keys[num_items];
     ERL_NIF_TERM values[num_items];
 
-    keys[item_index] = evision::nif::atom(env, "ref");
+    keys[item_index] = evision::nif::atom_ref;
     values[item_index] = res_term;
     item_index++;
 
-    keys[item_index] = evision::nif::atom(env, "class");
+    keys[item_index] = evision::nif::atom_class;
     values[item_index] = evision::nif::atom(env, class_name);
     item_index++;
 
@@ -216,11 +277,11 @@ ERL_NIF_TERM evision_from_as_map(ErlNifEnv *env, const cv::Ptr<cv::cuda::GpuMat>
     ERL_NIF_TERM keys[num_items];
     ERL_NIF_TERM values[num_items];
 
-    keys[item_index] = enif_make_atom(env, "ref");
+    keys[item_index] = evision::nif::atom_ref;
     values[item_index] = res_term;
     item_index++;
 
-    keys[item_index] = enif_make_atom(env, "class");
+    keys[item_index] = evision::nif::atom_class;
     values[item_index] = enif_make_atom(env, class_name);
     item_index++;
 
@@ -436,10 +497,19 @@ static bool evision_to(ErlNifEnv *env, ERL_NIF_TERM o, Mat& m, const ArgInfo& in
     evision_res<cv::Mat *> * in_res;
     if( enif_get_resource(env, o, evision_res<cv::Mat *>::type, (void **)&in_res) ) {
         if (in_res->val) {
-            // should we copy the matrix?
-            // probably yes so that the original matrix is not modified
-            // because erlang/elixir users would expect that the original matrix to be unchanged
-            in_res->val->copyTo(m);
+            if (info.outputarg || info.stored) {
+                // in/out and output arguments may be written to by OpenCV,
+                // and stored values (properties, fields of structs) may be written to
+                // by later calls or outlive a binary-backed matrix.
+                // copy the matrix so that the original matrix is not modified
+                // because erlang/elixir users would expect that the original matrix to be unchanged
+                in_res->val->copyTo(m);
+            } else {
+                // pure input arguments are read-only, borrow the matrix header
+                // and share the underlying data with the resource.
+                // the resource is kept alive by `o` for the duration of the NIF call
+                m = *in_res->val;
+            }
             return true;
         }
         return false;
@@ -507,6 +577,47 @@ static bool evision_to(ErlNifEnv *env, ERL_NIF_TERM o, cv::UMat& m, const ArgInf
     return false;
 }
 
+// kinds of terms, generated overloaded functions classify their keyword arguments with
+// `evision_term_kinds` once, and skip the variants whose arguments cannot be converted
+// from these kinds of terms before converting any argument
+enum {
+    EVISION_TERM_NIL = 1 << 0,
+    EVISION_TERM_NUMBER = 1 << 1,
+    EVISION_TERM_ATOM = 1 << 2,
+    EVISION_TERM_BINARY = 1 << 3,
+    EVISION_TERM_TUPLE = 1 << 4,
+    EVISION_TERM_LIST = 1 << 5,
+    EVISION_TERM_MAT = 1 << 6,
+    EVISION_TERM_UMAT = 1 << 7,
+    EVISION_TERM_OTHER = 1 << 8,
+};
+
+static inline void evision_term_kinds(ErlNifEnv *env, const ERL_NIF_TERM * terms, size_t num_terms, int * kinds) {
+    for (size_t i = 0; i < num_terms; i++) {
+        ERL_NIF_TERM term = terms[i];
+        void * res = nullptr;
+        if (term == evision::nif::atom_nil) {
+            kinds[i] = EVISION_TERM_NIL;
+        } else if (enif_is_number(env, term)) {
+            kinds[i] = EVISION_TERM_NUMBER;
+        } else if (enif_is_atom(env, term)) {
+            kinds[i] = EVISION_TERM_ATOM;
+        } else if (enif_is_binary(env, term)) {
+            kinds[i] = EVISION_TERM_BINARY;
+        } else if (enif_is_tuple(env, term)) {
+            kinds[i] = EVISION_TERM_TUPLE;
+        } else if (enif_is_list(env, term)) {
+            kinds[i] = EVISION_TERM_LIST;
+        } else if (enif_get_resource(env, term, evision_res<cv::Mat *>::type, &res)) {
+            kinds[i] = EVISION_TERM_MAT;
+        } else if (enif_get_resource(env, term, evision_res<cv::UMat *>::type, &res)) {
+            kinds[i] = EVISION_TERM_UMAT;
+        } else {
+            kinds[i] = EVISION_TERM_OTHER;
+        }
+    }
+}
+
 template<typename _Tp, int m, int n>
 bool evision_to(ErlNifEnv *env, ERL_NIF_TERM o, Matx<_Tp, m, n>& mx, const ArgInfo& info)
 {
@@ -542,19 +653,75 @@ ERL_NIF_TERM evision_from(ErlNifEnv *env, const Mat& m)
 
     evision_res<cv::Mat *> * res;
     if (alloc_resource(&res)) {
-        res->val = new cv::Mat();
-        // should we copy the matrix?
-        // probably no, because all input matrice are copied when calling `evision_to`
-        // and this function returns the output/result matrix, which should already be a new matrix
-        *res->val = m;
+        res->val = evision_mat_header_new();
+        if (res->val == nullptr) {
+            enif_release_resource(res);
+            return evision::nif::error(env, "out of memory");
+        }
+        if (m.u == nullptr) {
+            // the matrix does not own its data, e.g., it was borrowed from a
+            // binary-backed Mat by `evision_to`, and the data would not outlive
+            // the resource it was borrowed from. therefore we have to copy it
+            *res->val = m.clone();
+        } else {
+            // no need to copy here, the reference counter of the data is increased
+            *res->val = m;
+        }
     } else {
         return evision::nif::error(env, "out of memory");
     }
 
+    evision_mat_res_account(env, res);
     ERL_NIF_TERM ret = enif_make_resource(env, res);
     enif_release_resource(res);
 
-    return _evision_make_mat_resource_into_map(env, m, ret);
+    return _evision_make_mat_resource_into_map(env, *res->val, ret);
+}
+
+static void _evision_mat_resource_unref(void *, void * parent) {
+    enif_release_resource(parent);
+}
+
+// `view` shares its data with the Mat resource `parent`, e.g., a ROI of it.
+//
+// Mats allocated by OpenCV are kept alive by their reference counter, otherwise
+// (e.g., binary-backed Mats) the returned resource keeps a reference to the parent
+// resource so that the data outlives the view.
+static ERL_NIF_TERM evision_from_view(ErlNifEnv *env, const Mat& view, evision_res<cv::Mat *> * parent)
+{
+    if (view.u != nullptr || !view.data || parent == nullptr) {
+        return evision_from(env, view);
+    }
+
+    evision_res<cv::Mat *> * res;
+    if (alloc_resource(&res)) {
+        res->val = evision_mat_header_new(view);
+        if (res->val == nullptr) {
+            enif_release_resource(res);
+            return evision::nif::error(env, "out of memory");
+        }
+        enif_keep_resource(parent);
+        res->in_buf = view.data;
+        res->in_ref = parent;
+        res->in_unref = _evision_mat_resource_unref;
+    } else {
+        return evision::nif::error(env, "out of memory");
+    }
+
+    evision_mat_res_account(env, res);
+    ERL_NIF_TERM ret = enif_make_resource(env, res);
+    enif_release_resource(res);
+
+    return _evision_make_mat_resource_into_map(env, *res->val, ret);
+}
+
+static ERL_NIF_TERM evision_from_view(ErlNifEnv *env, const Mat& view, ERL_NIF_TERM parent_term)
+{
+    evision_res<cv::Mat *> * parent = nullptr;
+    if (!enif_get_resource(env, parent_term, evision_res<cv::Mat *>::type, (void **)&parent)) {
+        parent = nullptr;
+    }
+    return evision_from_view(env, view, parent);
 }
 
 template<typename _Tp, int m, int n>
@@ -569,7 +736,7 @@ struct Evision_Converter< cv::Ptr<T> >
     static ERL_NIF_TERM from(ErlNifEnv *env, const cv::Ptr<T>& p)
     {
         if (!p) {
-            return evision::nif::atom(env, "nil");
+            return evision::nif::atom_nil;
         }
 
         return evision_from(env, *p);
@@ -694,8 +861,7 @@ ERL_NIF_TERM evision_from(ErlNifEnv *env, const Scalar& src)
 template<>
 ERL_NIF_TERM evision_from(ErlNifEnv *env, const bool& value)
 {
-    if (value) return evision::nif::atom(env, "true");
-    return evision::nif::atom(env, "false");
+    return value ? evision::nif::atom_true : evision::nif::atom_false;
 }
 
 template<>
@@ -707,11 +873,8 @@ bool evision_to(ErlNifEnv *env, ERL_NIF_TERM obj, bool& value, const ArgInfo& in
 
     if (enif_is_atom(env, obj))
     {
-        std::string boolean_val;
-        if (evision::nif::get_atom(env, obj, boolean_val)) {
-            value = (boolean_val == "true");
-            return true;
-        }
+        value = (obj == evision::nif::atom_true);
+        return true;
     }
     else if (enif_is_number(env, obj)) {
         double f64;
@@ -1935,8 +2098,7 @@ template<> inline ERL_NIF_TERM evision_from_generic_vec(ErlNifEnv *env, const st
     for (size_t i = 0; i < n; i++)
     {
         bool elem = value[i];
-        if (elem) arr[i] = evision::nif::atom(env, "true");
-        else arr[i] = evision::nif::atom(env, "false");
+        arr[i] = elem ? evision::nif::atom_true : evision::nif::atom_false;
     }
     ERL_NIF_TERM ret = enif_make_list_from_array(env, arr, n);
     free(arr);
@@ -2208,7 +2370,7 @@ static ERL_NIF_TERM evisionCreateButton(ErlNifEnv* env, int argc, const ERL_NIF_
 
 //    const char* keywords[] = {"buttonName", "onChange", "userData", "buttonType", "initialButtonState", NULL};
 //    ERL_NIF_TERM on_change;
-//    ERL_NIF_TERM userdata = evision::nif::atom(env, "nil");
+//    ERL_NIF_TERM userdata = evision::nif::atom_nil;
 //    char* button_name;
 //    int button_type = 0;
 //    int initial_button_state = 0;
@@ -2286,8 +2448,10 @@ static int convert_to_char(ErlNifEnv *env, ERL_NIF_TERM o, char *dst, const ArgI
 #include "modules/evision_mat.h"
 #include "modules/evision_highgui.h"
 #include "modules/evision_imdecode.h"
+#include "modules/evision_imencode.h"
 #include "modules/evision_backend/backend.h"
 #include "modules/evision_videocapture.h"
+#include "modules/evision_videocapture_stream.h"
 
 /************************************************************************/
 
@@ -2295,8 +2459,12 @@ static int convert_to_char(ErlNifEnv *env, ERL_NIF_TERM o, char *dst, const ArgI
 
 static void destruct_Mat(ErlNifEnv *env, void *args) {
     evision_res<cv::Mat *> * res = (evision_res<cv::Mat *> *)args;
+    if (res->accounted) {
+        evision_mat_memory_release(res->bytes);
+        res->accounted = false;
+    }
     if (res->val) {
-        delete res->val;
+        evision_mat_header_delete(res->val);
         res->val = nullptr;
     }
 
@@ -2313,12 +2481,21 @@ on_load(ErlNifEnv* env, void**, ERL_NIF_TERM)
 {
     ErlNifResourceType *rt;
 
+    if (!evision::nif::init_atoms(env)) return -1;
+    if (!evision_init_kw_atoms(env)) return -1;
+    if (!evision_init_mat_atoms(env)) return -1;
+
 #define CV_ERL_TYPE(WNAME, NAME, STORAGE, _1, BASE, CONSTRUCTOR, _2) CV_ERL_TYPE_INIT_DYNAMIC(WNAME, NAME, STORAGE, return -1)
 #include "evision_generated_types.h"
 #undef CV_ERL_TYPE
     rt = enif_open_resource_type(env, "evision", "Evision.Mat.t", destruct_Mat, ERL_NIF_RT_CREATE, NULL);
     if (!rt) return -1;
     evision_res<cv::Mat *>::type = rt;
+    if (!evision_init_chunked_jobs(env)) return -1;
+#ifdef HAVE_OPENCV_VIDEO
+    if (!evision_init_videocapture_streams(env)) return -1;
+    if (!evision_init_videocapture_pollers(env)) return -1;
+#endif
     return 0;
 }
 
@@ -169,7 +169,7 @@ ERL_NIF_TERM evision_from(ErlNifEnv *env, const dnn::DictValue &dv)
     if (dv.isReal()) return evision_from<float>(env, dv);
     if (dv.isString()) return evision_from<String>(env, dv);
     CV_Error(Error::StsNotImplemented, "Unknown value type");
-    return evision::nif::atom(env, "nil");
+    return evision::nif::atom_nil;
 }
 
 template<>
@@ -201,7 +201,7 @@ ERL_NIF_TERM evision_from(ErlNifEnv *env, const dnn::LayerParams& lp)
     } else {
         enif_free((void *)keys);
         enif_free((void *)values);
-        return evision::nif::atom(env, "nil");
+        return evision::nif::atom_nil;
     }
 }
 
@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_abs, evision_cv_mat_abs, 1
 // @evision nif: def mat_abs(_opts \\ []), do: :erlang.nif_error("Mat::abs not loaded")
@@ -15,14 +16,11 @@ static ERL_NIF_TERM evision_cv_mat_abs(ErlNifEnv *env, int argc, const ERL_NIF_T
 
     {
         Mat img;
-        Mat ret;
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
-            int error_flag = false;
-            ERRWRAP2(ret = Mat(cv::abs(img)), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_abs", argv, {img}, [](const std::vector<Mat>& in, Mat& ret) {
+                ret = cv::abs(in[0]);
+            });
         }
     }
 
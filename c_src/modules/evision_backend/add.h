@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 #include "../evision_mat_utils.hpp"
 
 // @evision c: mat_add, evision_cv_mat_add, 1
@@ -21,12 +22,9 @@ static ERL_NIF_TERM evision_cv_mat_add(ErlNifEnv *env, int argc, const ERL_NIF_T
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "r"), r, ArgInfo("r", 0))) {
-            Mat ret;
-            int error_flag = false;
-            ERRWRAP2(cv::add(l, r, ret, cv::noArray(), -1), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_add", argv, {l, r}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::add(in[0], in[1], ret, cv::noArray(), -1);
+            });
         }
     }
 
@@ -56,12 +54,9 @@ static ERL_NIF_TERM evision_cv_mat_add_typed(ErlNifEnv *env, int argc, const ERL
             int type;
             if (!get_binary_type(t, l, 0, type)) return evision::nif::error(env, "not implemented for the given type");
             
-            Mat ret;
-            int error_flag = false;
-            ERRWRAP2(cv::add(lhs, rhs, ret, cv::noArray(), type), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_add_typed", argv, {lhs, rhs}, [type](const std::vector<Mat>& in, Mat& ret) {
+                cv::add(in[0], in[1], ret, cv::noArray(), type);
+            });
         }
     }
 
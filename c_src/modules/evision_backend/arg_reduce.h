@@ -0,0 +1,88 @@
+#ifndef EVISION_BACKEND_ARG_REDUCE_H
+#define EVISION_BACKEND_ARG_REDUCE_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+// @evision c: mat_arg_reduce,evision_cv_mat_arg_reduce,1
+// @evision nif: def mat_arg_reduce(_opts \\ []), do: :erlang.nif_error("Mat::arg_reduce not loaded")
+static ERL_NIF_TERM evision_cv_mat_arg_reduce(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::vector<int> shape;
+    int axis = -1;
+    std::string op;
+    bool last_index = false;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shape"), shape, ArgInfo("shape", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "axis"), axis, ArgInfo("axis", 0, true)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "op"), op, ArgInfo("op", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "last_index"), last_index, ArgInfo("last_index", 0, true))) {
+        if (op != "max" && op != "min") {
+            return evision::nif::error(env, "arg_reduce failed: invalid option value for op. Valid values are :max and :min");
+        }
+
+        if (!nd_continuous(img, shape)) {
+            return evision::nif::error(env, "arg_reduce failed: cannot treated matrix as the request shape");
+        }
+
+        // a negative axis reduces the flattened matrix
+        std::vector<int> reduced_shape;
+        int outer = 1, len = 1, inner = 1;
+        if (axis < 0) {
+            len = (int)nd_num_elements(shape);
+            reduced_shape.push_back(1);
+        } else if (axis < (int)shape.size()) {
+            for (int i = 0; i < axis; i++) outer *= shape[i];
+            for (int i = axis + 1; i < (int)shape.size(); i++) inner *= shape[i];
+            len = shape[axis];
+            reduced_shape = shape;
+            reduced_shape[axis] = 1;
+        } else {
+            return evision::nif::error(env, "arg_reduce failed: axis out of range");
+        }
+
+        int error_flag = false;
+        Mat values;
+        Mat flat(1, (int)nd_num_elements(shape), img.depth(), img.data);
+        ERRWRAP2(flat.convertTo(values, CV_64F), env, error_flag, error_term);
+        if (error_flag) return error_term;
+
+        bool is_max = op == "max";
+        Mat ret(1, outer * inner, CV_32S);
+        const double * src = (const double *)values.data;
+        int32_t * dst = (int32_t *)ret.data;
+        for (int o = 0; o < outer; o++) {
+            const double * block = src + (size_t)o * len * inner;
+            for (int i = 0; i < inner; i++) {
+                double best = block[i];
+                int32_t index = 0;
+                for (int l = 1; l < len; l++) {
+                    double v = block[(size_t)l * inner + i];
+                    if ((is_max ? v > best : v < best) || (last_index && v == best)) {
+                        best = v;
+                        index = l;
+                    }
+                }
+                dst[(size_t)o * inner + i] = index;
+            }
+        }
+
+        ERRWRAP2(ret = ret.reshape(1, reduced_shape), env, error_flag, error_term);
+        if (!error_flag) {
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_ARG_REDUCE_H
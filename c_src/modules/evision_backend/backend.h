@@ -3,28 +3,38 @@
 
 #include "abs.h"
 #include "add.h"
+#include "arg_reduce.h"
 #include "bitwise_and.h"
 #include "bitwise_not.h"
 #include "bitwise_or.h"
 #include "bitwise_xor.h"
 #include "broadcast.h"
 #include "ceil.h"
+#include "chunked.h"
 #include "clip.h"
 #include "cmp.h"
+#include "concatenate.h"
 #include "divide.h"
+#include "elementwise_math.h"
 #include "expm1.h"
 #include "eye.h"
 #include "floor.h"
 #include "from_binary.h"
+#include "fused_elementwise.h"
+#include "gather.h"
 #include "logical_and.h"
 #include "logical_or.h"
 #include "logical_xor.h"
 #include "matrix_multiply.h"
 #include "multiply.h"
 #include "negate.h"
+#include "pad.h"
+#include "put_slice.h"
+#include "reduce.h"
 #include "reshape.h"
 #include "round.h"
 #include "sign.h"
+#include "slice.h"
 #include "subtract.h"
 #include "to_batched.h"
 #include "to_binary.h"
@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_bitwise_not, evision_cv_mat_bitwise_not, 1
 // @evision nif: def mat_bitwise_not(_opts \\ []), do: :erlang.nif_error("Mat::bitwise_not not loaded")
@@ -17,13 +18,9 @@ static ERL_NIF_TERM evision_cv_mat_bitwise_not(ErlNifEnv *env, int argc, const E
         Mat img;
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
-            Mat ret;
-
-            int error_flag = false;
-            ERRWRAP2(ret = Mat(~img), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_bitwise_not", argv, {img}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::bitwise_not(in[0], ret);
+            });
         }
     }
 
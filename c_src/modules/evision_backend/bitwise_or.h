@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_bitwise_or, evision_cv_mat_bitwise_or, 1
 // @evision nif: def mat_bitwise_or(_opts \\ []), do: :erlang.nif_error("Mat::bitwise_or not loaded")
@@ -19,13 +20,9 @@ static ERL_NIF_TERM evision_cv_mat_bitwise_or(ErlNifEnv *env, int argc, const ER
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "r"), r, ArgInfo("r", 0))) {
-            Mat ret;
-            
-            int error_flag = false;
-            ERRWRAP2(cv::bitwise_or(l, r, ret), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_bitwise_or", argv, {l, r}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::bitwise_or(in[0], in[1], ret);
+            });
         }
     }
 
@@ -3,57 +3,45 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
-
-static void broadcast(
-    Mat &img,
-    void *& dst_data,
-    void *& tmp_data,
-    std::vector<int>& src_shape,
-    std::vector<int>& to_shape,
-    size_t elem_size
-)
-{
-    size_t ndims = src_shape.size();
-    size_t subgroup_bytes = src_shape[ndims - 1] * elem_size;
-    size_t num_subgroups = 1;
-    for (size_t i = 0; i < ndims - 1; ++i) {
-        num_subgroups *= src_shape[i];
-    }
-
-    if (img.isContinuous()) {
-        memcpy(dst_data, img.data, num_subgroups * subgroup_bytes);
-    } else {
-        Mat tmp = img.clone();
-        memcpy(dst_data, tmp.data, num_subgroups * subgroup_bytes);
-    }
-
-    for (int64_t dim = ndims - 1; dim >= 0; --dim) {
-        size_t elem_per_subgroup = src_shape[dim];
-        size_t elem_per_group = to_shape[dim];
-        size_t num_groups = num_subgroups / elem_per_subgroup;
-        if (num_subgroups == 1) {
-            num_groups = 1;
+#include "chunked.h"
+#include "nd_copy.h"
+
+/// Copy rows [begin, end) of the broadcasted array
+///
+/// A row is the run of elements along the last axis. Axes being broadcasted have a
+/// source step of 0, so that the source offset of each row is computed directly
+/// from its index and rows can be copied in any order.
+/// @param src_steps distance in bytes between two adjacent source elements along each axis
+/// @param to_shape shape of the broadcasted array
+static void broadcast_rows(const uint8_t * src, const std::vector<size_t>& src_steps,
+                           uint8_t * dst, const std::vector<int>& to_shape,
+                           size_t elem_size, size_t begin, size_t end) {
+    size_t ndims = to_shape.size();
+    size_t row_len = to_shape[ndims - 1];
+    size_t row_bytes = row_len * elem_size;
+    size_t last_step = src_steps[ndims - 1];
+
+    for (size_t row = begin; row < end; row++) {
+        size_t src_offset = 0;
+        size_t rest = row;
+        for (int64_t axis = (int64_t)ndims - 2; axis >= 0; axis--) {
+            src_offset += (rest % to_shape[axis]) * src_steps[axis];
+            rest /= to_shape[axis];
         }
-        size_t group_bytes = subgroup_bytes * num_subgroups / elem_per_group;
-
-        if (elem_per_subgroup == 1) {
-            size_t copy_times = elem_per_group;
-            group_bytes = subgroup_bytes * num_subgroups * copy_times / num_groups;
 
-            for (size_t subgroup = 0; subgroup < num_subgroups; ++subgroup) {
-                void * subgroup_start = (void *)((uint64_t)(uint64_t *)dst_data + subgroup_bytes * subgroup);
-                for (size_t i = 0; i < copy_times; ++i) {
-                    void * tmp_data_start = (void *)((uint64_t)(uint64_t *)tmp_data + subgroup_bytes * i + group_bytes * subgroup);
-                    memcpy(tmp_data_start, subgroup_start, subgroup_bytes);
-                }
+        uint8_t * dst_row = dst + row * row_bytes;
+        if (last_step != 0) {
+            memcpy(dst_row, src + src_offset, row_bytes);
+        } else if (row_len > 0) {
+            // repeat the element, doubling the copied run each time
+            memcpy(dst_row, src + src_offset, elem_size);
+            size_t filled = elem_size;
+            while (filled < row_bytes) {
+                size_t n = std::min(filled, row_bytes - filled);
+                memcpy(dst_row + filled, dst_row, n);
+                filled += n;
             }
-            std::swap(tmp_data, dst_data);
-            subgroup_bytes = group_bytes;
-        } else if (elem_per_subgroup == elem_per_group) {
-            subgroup_bytes = subgroup_bytes * num_subgroups / num_groups;
         }
-
-        num_subgroups = num_groups;
     }
 }
 
@@ -104,34 +92,43 @@ static ERL_NIF_TERM evision_cv_mat_broadcast_to(ErlNifEnv *env, int argc, const
                 }
             }
 
-            // calculate number of elements in the new shape
-            const size_t elem_size = img.elemSize();
-            size_t count_new_elem = 1;
-            for (int64_t i = 0; i < ndims; i++) {
-                count_new_elem *= to_shape[i];
+            if (ndims == 0) {
+                return evision::nif::error(env, "cannot broadcast to specified shape");
+            }
+            if (!img.isContinuous()) {
+                img = img.clone();
             }
 
-            // allocate memory
-            void * dst_data = (void *)enif_alloc(elem_size * count_new_elem);
-            if (dst_data == nullptr) {
-                return evision::nif::error(env, "cannot broadcast to specified shape, out of memory");
+            // the source data is an array of `src_shape` that does not move
+            // along the axes being broadcasted
+            const size_t elem_size = img.elemSize1();
+            if (nd_num_elements(src_shape) != img.total() * img.channels()) {
+                return evision::nif::error(env, "cannot broadcast to specified shape");
             }
-            void * tmp_data = (void *)enif_alloc(elem_size * count_new_elem);
-            if (tmp_data == nullptr) {
-                enif_free((void *)dst_data);
-                dst_data = nullptr;
-                return evision::nif::error(env, "cannot broadcast to specified shape, out of memory");
+            std::vector<size_t> src_steps = nd_steps(src_shape, elem_size);
+            for (int64_t i = 0; i < ndims; i++) {
+                if (src_shape[i] == 1) src_steps[i] = 0;
             }
 
-            // broadcast
-            broadcast(img, dst_data, tmp_data, src_shape, to_shape, elem_size);
-
             int type = img.type() & CV_MAT_DEPTH_MASK;
-            Mat result = Mat((int)ndims, to_shape.data(), type, dst_data);
-            result = result.clone();
-            enif_free((void *)dst_data);
-            enif_free((void *)tmp_data);
-            return evision_from(env, result);
+            Mat result;
+            int error_flag = false;
+            ERRWRAP2(result = Mat((int)ndims, to_shape.data(), type), env, error_flag, error_term);
+            if (error_flag) return error_term;
+
+            size_t row_bytes = std::max((size_t)1, to_shape[ndims - 1] * elem_size);
+            evision_chunked_job job;
+            job.name = "mat_broadcast_to";
+            job.next = 0;
+            job.total = nd_num_elements(to_shape) / std::max(to_shape[ndims - 1], 1);
+            job.grain = std::max((size_t)1, (size_t)EVISION_CHUNK_GRAIN_BYTES / row_bytes);
+            job.run = [=](ErlNifEnv *, ERL_NIF_TERM&, size_t begin, size_t end) {
+                broadcast_rows(img.data, src_steps, result.data, to_shape, elem_size, begin, end);
+            };
+            job.finish = [=](ErlNifEnv *env, ERL_NIF_TERM) {
+                return evision_from(env, result);
+            };
+            return evision_chunked_schedule(env, argv, job);
         }
     }
 
@@ -0,0 +1,215 @@
+#ifndef EVISION_BACKEND_CHUNKED_H
+#define EVISION_BACKEND_CHUNKED_H
+
+#include <chrono>
+#include <functional>
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+
+// wall time a chunked job may keep a dirty scheduler before it yields to other queued jobs
+#define EVISION_CHUNK_TIMESLICE_US 10000
+// element-wise jobs touching fewer bytes than this run in one go
+#define EVISION_CHUNK_MIN_BYTES (16 * 1024 * 1024)
+// bytes processed between two checks of the elapsed time
+#define EVISION_CHUNK_GRAIN_BYTES (1024 * 1024)
+
+/// A long-running job split into `total` units of work.
+///
+/// The job runs on the calling dirty scheduler for at most `EVISION_CHUNK_TIMESLICE_US`,
+/// then the rest of it is rescheduled with `enif_schedule_nif`, which puts it at the back
+/// of the dirty CPU run queue so that calls queued behind it get their turn.
+struct evision_chunked_job {
+    // name of the NIF that created the job, used when rescheduling
+    const char * name;
+    // units in [next, total) are still to be done
+    size_t next;
+    size_t total;
+    // number of units to run between two checks of the elapsed time
+    size_t grain;
+    // runs units in [begin, end)
+    //
+    // terms that have to outlive a time slice can be accumulated in `acc`, which
+    // is passed on to the next slice as an argument of the rescheduled NIF
+    std::function<void(ErlNifEnv *env, ERL_NIF_TERM& acc, size_t begin, size_t end)> run;
+    // makes the result once all units are done
+    std::function<ERL_NIF_TERM(ErlNifEnv *env, ERL_NIF_TERM acc)> finish;
+};
+
+static void destruct_chunked_job(ErlNifEnv *env, void *args) {
+    evision_res<evision_chunked_job *> * res = (evision_res<evision_chunked_job *> *)args;
+    if (res->val) {
+        delete res->val;
+        res->val = nullptr;
+    }
+}
+
+static int evision_init_chunked_jobs(ErlNifEnv *env) {
+    ErlNifResourceType * rt = enif_open_resource_type(env, "evision", "Evision.ChunkedJob.t", destruct_chunked_job, ERL_NIF_RT_CREATE, NULL);
+    if (!rt) return 0;
+    evision_res<evision_chunked_job *>::type = rt;
+    return 1;
+}
+
+/// Run units of `job` until all of them are done or the time slice is used up
+/// @return true if all units are done
+static bool evision_chunked_run_slice(ErlNifEnv *env, evision_chunked_job& job, ERL_NIF_TERM& acc) {
+    auto start = std::chrono::steady_clock::now();
+    while (job.next < job.total) {
+        size_t end = std::min(job.total, job.next + job.grain);
+        job.run(env, acc, job.next, end);
+        job.next = end;
+
+        auto elapsed = std::chrono::steady_clock::now() - start;
+        if (std::chrono::duration_cast<std::chrono::microseconds>(elapsed).count() >= EVISION_CHUNK_TIMESLICE_US) {
+            break;
+        }
+    }
+    return job.next >= job.total;
+}
+
+// argv[0]: the job resource
+// argv[1]: the arguments of the NIF that created the job, which keep borrowed input matrices alive
+// argv[2]: acc
+static ERL_NIF_TERM evision_chunked_continue(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    evision_res<evision_chunked_job *> * res;
+    if (argc != 3 || !enif_get_resource(env, argv[0], evision_res<evision_chunked_job *>::type, (void **)&res) || res->val == nullptr) {
+        return enif_make_badarg(env);
+    }
+
+    evision_chunked_job * job = res->val;
+    ERL_NIF_TERM acc = argv[2];
+    ERL_NIF_TERM error_term = 0;
+    int error_flag = false;
+    bool done = false;
+    ERRWRAP2(done = evision_chunked_run_slice(env, *job, acc), env, error_flag, error_term);
+    if (!error_flag && !done) {
+        ERL_NIF_TERM next_argv[3] = {argv[0], argv[1], acc};
+        return enif_schedule_nif(env, job->name, ERL_NIF_DIRTY_JOB_CPU_BOUND, evision_chunked_continue, 3, next_argv);
+    }
+
+    ERL_NIF_TERM ret = error_term;
+    if (!error_flag) {
+        ERRWRAP2(ret = job->finish(env, acc), env, error_flag, error_term);
+        if (error_flag) ret = error_term;
+    }
+
+    // release the matrices held by the job now instead of when the resource is garbage collected
+    delete res->val;
+    res->val = nullptr;
+    return ret;
+}
+
+/// Run `job` from a dirty CPU NIF, yielding the scheduler between time slices
+/// @param argv arguments of the calling NIF
+static ERL_NIF_TERM evision_chunked_schedule(ErlNifEnv *env, const ERL_NIF_TERM argv[], evision_chunked_job& job) {
+    ERL_NIF_TERM acc = enif_make_list(env, 0);
+    ERL_NIF_TERM error_term = 0;
+    int error_flag = false;
+    bool done = false;
+
+    // the first slice runs inline, so that small jobs never allocate a resource
+    ERRWRAP2(done = evision_chunked_run_slice(env, job, acc), env, error_flag, error_term);
+    if (error_flag) return error_term;
+    if (done) {
+        ERL_NIF_TERM ret = 0;
+        ERRWRAP2(ret = job.finish(env, acc), env, error_flag, error_term);
+        return error_flag ? error_term : ret;
+    }
+
+    evision_res<evision_chunked_job *> * res;
+    if (!alloc_resource(&res)) {
+        return evision::nif::error(env, "out of memory");
+    }
+    res->val = new evision_chunked_job(std::move(job));
+    ERL_NIF_TERM job_term = enif_make_resource(env, res);
+    enif_release_resource(res);
+
+    ERL_NIF_TERM next_argv[3] = {job_term, argv[0], acc};
+    return enif_schedule_nif(env, res->val->name, ERL_NIF_DIRTY_JOB_CPU_BOUND, evision_chunked_continue, 3, next_argv);
+}
+
+/// Run the element-wise operation `op(inputs, ret)` a few elements at a time
+///
+/// Inputs are either scalars, i.e., at most 4 elements, which are passed to `op` as they are,
+/// or matrices that have the same number of elements as the largest input, which are passed
+/// in slices. Operations on small or non-continuous inputs run in one go.
+/// @param name name of the calling NIF
+/// @param argv arguments of the calling NIF
+template <typename Op>
+static ERL_NIF_TERM evision_chunked_elementwise(ErlNifEnv *env, const char *name, const ERL_NIF_TERM argv[],
+                                                const std::vector<cv::Mat>& inputs, Op op) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    int error_flag = false;
+
+    size_t ref = 0;
+    for (size_t i = 1; i < inputs.size(); i++) {
+        if (inputs[i].total() > inputs[ref].total()) ref = i;
+    }
+    const Mat& ref_mat = inputs[ref];
+    size_t total = ref_mat.total();
+
+    std::vector<bool> sliced(inputs.size());
+    bool chunked = total * ref_mat.elemSize() >= EVISION_CHUNK_MIN_BYTES;
+    size_t max_elem_size = 1;
+    for (size_t i = 0; chunked && i < inputs.size(); i++) {
+        sliced[i] = inputs[i].total() * inputs[i].channels() > 4;
+        if (sliced[i] && (!inputs[i].isContinuous() || inputs[i].total() != total || inputs[i].channels() != ref_mat.channels())) {
+            chunked = false;
+        }
+        max_elem_size = std::max(max_elem_size, inputs[i].elemSize());
+    }
+
+    if (!chunked) {
+        Mat ret;
+        ERRWRAP2(op(inputs, ret), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        return evision_from(env, ret);
+    }
+
+    auto slice = [=](size_t begin, size_t end) {
+        std::vector<Mat> chunk(inputs.size());
+        for (size_t i = 0; i < inputs.size(); i++) {
+            if (sliced[i]) {
+                chunk[i] = Mat(1, (int)(end - begin), inputs[i].type(), inputs[i].data + begin * inputs[i].elemSize());
+            } else {
+                chunk[i] = inputs[i];
+            }
+        }
+        return chunk;
+    };
+
+    // the first grain tells the type of the output
+    size_t grain = std::max((size_t)1, (size_t)EVISION_CHUNK_GRAIN_BYTES / max_elem_size);
+    size_t first_end = std::min(total, grain);
+    Mat first;
+    Mat ret;
+    ERRWRAP2({
+        op(slice(0, first_end), first);
+        CV_Assert(first.total() == first_end && first.isContinuous());
+        ret = Mat(ref_mat.dims, ref_mat.size.p, first.type());
+        memcpy(ret.data, first.data, first_end * first.elemSize());
+    }, env, error_flag, error_term);
+    if (error_flag) return error_term;
+
+    evision_chunked_job job;
+    job.name = name;
+    job.next = first_end;
+    job.total = total;
+    job.grain = grain;
+    job.run = [=](ErlNifEnv *, ERL_NIF_TERM&, size_t begin, size_t end) {
+        uchar * expected = ret.data + begin * ret.elemSize();
+        Mat dst(1, (int)(end - begin), ret.type(), expected);
+        op(slice(begin, end), dst);
+        if (dst.data != expected) {
+            CV_Assert(dst.total() == end - begin && dst.type() == ret.type());
+            dst.copyTo(Mat(1, (int)(end - begin), ret.type(), expected));
+        }
+    };
+    job.finish = [=](ErlNifEnv *env, ERL_NIF_TERM) {
+        return evision_from(env, ret);
+    };
+    return evision_chunked_schedule(env, argv, job);
+}
+
+#endif // EVISION_BACKEND_CHUNKED_H
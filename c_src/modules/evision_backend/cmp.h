@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_cmp, evision_cv_mat_cmp, 1
 // @evision nif: def mat_cmp(_opts \\ []), do: :erlang.nif_error("Mat::greater not loaded")
@@ -34,15 +35,10 @@ static ERL_NIF_TERM evision_cv_mat_cmp(ErlNifEnv *env, int argc, const ERL_NIF_T
                 return evision::nif::error(env, "not implemented for the requested compare type, only 'eq', 'gt', 'ge', 'lt', 'le' and 'ne' are supported.");
             }
 
-            Mat ret;
-
-            ERRWRAP2(cv::compare(l, r, ret, cmpop), env, error_flag, error_term);
-            if (!error_flag) {
-                ERRWRAP2(ret = ret / 255, env, error_flag, error_term);
-                if (!error_flag) {
-                    return evision_from(env, ret);
-                }
-            }
+            return evision_chunked_elementwise(env, "mat_cmp", argv, {l, r}, [cmpop](const std::vector<Mat>& in, Mat& ret) {
+                cv::compare(in[0], in[1], ret, cmpop);
+                ret = ret / 255;
+            });
         }
     }
 
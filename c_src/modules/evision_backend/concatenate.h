@@ -0,0 +1,72 @@
+#ifndef EVISION_BACKEND_CONCATENATE_H
+#define EVISION_BACKEND_CONCATENATE_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+// @evision c: mat_concatenate,evision_cv_mat_concatenate,1
+// @evision nif: def mat_concatenate(_opts \\ []), do: :erlang.nif_error("Mat::concatenate not loaded")
+static ERL_NIF_TERM evision_cv_mat_concatenate(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    std::vector<Mat> mats;
+    std::vector<std::vector<int>> shapes;
+    int axis = 0;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "mats"), mats, ArgInfo("mats", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shapes"), shapes, ArgInfo("shapes", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "axis"), axis, ArgInfo("axis", 0))) {
+        if (mats.size() == 0 || mats.size() != shapes.size()) {
+            return evision::nif::error(env, "concatenate failed: expecting a non-empty list of matrices and their shapes");
+        }
+
+        std::vector<int> out_shape = shapes[0];
+        int ndims = (int)out_shape.size();
+        if (axis < 0 || axis >= ndims) {
+            return evision::nif::error(env, "concatenate failed: axis out of range");
+        }
+        out_shape[axis] = 0;
+        for (size_t i = 0; i < mats.size(); i++) {
+            if (mats[i].depth() != mats[0].depth()) {
+                return evision::nif::error(env, "concatenate failed: all matrices should have the same type");
+            }
+            if ((int)shapes[i].size() != ndims) {
+                return evision::nif::error(env, "concatenate failed: all matrices should have the same rank");
+            }
+            for (int d = 0; d < ndims; d++) {
+                if (d != axis && shapes[i][d] != shapes[0][d]) {
+                    return evision::nif::error(env, "concatenate failed: shapes should only differ in the concatenating axis");
+                }
+            }
+            if (!nd_continuous(mats[i], shapes[i])) {
+                return evision::nif::error(env, "concatenate failed: cannot treated matrix as the request shape");
+            }
+            out_shape[axis] += shapes[i][axis];
+        }
+
+        int error_flag = false;
+        Mat ret;
+        ERRWRAP2(ret = Mat(ndims, out_shape.data(), mats[0].depth()), env, error_flag, error_term);
+        if (!error_flag) {
+            // each input is copied into its own block of the output along `axis`
+            size_t elem_size = ret.elemSize1();
+            std::vector<size_t> dst_steps = nd_steps(out_shape, elem_size);
+            size_t dst_offset = 0;
+            for (size_t i = 0; i < mats.size(); i++) {
+                nd_copy(mats[i].data, nd_steps(shapes[i], elem_size), ret.data + dst_offset, dst_steps, shapes[i], elem_size);
+                dst_offset += shapes[i][axis] * dst_steps[axis];
+            }
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_CONCATENATE_H
@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_divide, evision_cv_mat_divide, 1
 // @evision nif: def mat_divide(_opts \\ []), do: :erlang.nif_error("Mat::divide not loaded")
@@ -20,12 +21,9 @@ static ERL_NIF_TERM evision_cv_mat_divide(ErlNifEnv *env, int argc, const ERL_NI
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "r"), r, ArgInfo("r", 0))) {
-            Mat ret;
-
-            ERRWRAP2(cv::divide(l, r, ret, 1, -1), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_divide", argv, {l, r}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::divide(in[0], in[1], ret, 1, -1);
+            });
         }
     }
 
@@ -54,9 +52,9 @@ static ERL_NIF_TERM evision_cv_mat_divide_typed(ErlNifEnv *env, int argc, const
             evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0))) {
             int type;
             if (!get_binary_type(t, l, 0, type)) return evision::nif::error(env, "not implemented for the given type");
-            Mat ret;
-            cv::divide(lhs, rhs, ret, 1, type);
-            return evision_from(env, ret);
+            return evision_chunked_elementwise(env, "mat_divide_typed", argv, {lhs, rhs}, [type](const std::vector<Mat>& in, Mat& ret) {
+                cv::divide(in[0], in[1], ret, 1, type);
+            });
         }
     }
 
@@ -0,0 +1,153 @@
+#ifndef EVISION_BACKEND_ELEMENTWISE_MATH_H
+#define EVISION_BACKEND_ELEMENTWISE_MATH_H
+
+#include <cmath>
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+
+typedef double (*elementwise_math_func)(double);
+
+static double elementwise_log1p(double x) { return std::log1p(x); }
+static double elementwise_sin(double x) { return std::sin(x); }
+static double elementwise_cos(double x) { return std::cos(x); }
+static double elementwise_tan(double x) { return std::tan(x); }
+static double elementwise_sinh(double x) { return std::sinh(x); }
+static double elementwise_cosh(double x) { return std::cosh(x); }
+static double elementwise_tanh(double x) { return std::tanh(x); }
+static double elementwise_asin(double x) { return std::asin(x); }
+static double elementwise_acos(double x) { return std::acos(x); }
+static double elementwise_atan(double x) { return std::atan(x); }
+static double elementwise_asinh(double x) { return std::asinh(x); }
+static double elementwise_acosh(double x) { return std::acosh(x); }
+static double elementwise_atanh(double x) { return std::atanh(x); }
+static double elementwise_cbrt(double x) { return std::cbrt(x); }
+static double elementwise_erf(double x) { return std::erf(x); }
+static double elementwise_erfc(double x) { return std::erfc(x); }
+
+static elementwise_math_func get_elementwise_math_func(const std::string& op) {
+    static const std::map<std::string, elementwise_math_func> funcs = {
+        {"log1p", elementwise_log1p},
+        {"sin", elementwise_sin},
+        {"cos", elementwise_cos},
+        {"tan", elementwise_tan},
+        {"sinh", elementwise_sinh},
+        {"cosh", elementwise_cosh},
+        {"tanh", elementwise_tanh},
+        {"asin", elementwise_asin},
+        {"acos", elementwise_acos},
+        {"atan", elementwise_atan},
+        {"asinh", elementwise_asinh},
+        {"acosh", elementwise_acosh},
+        {"atanh", elementwise_atanh},
+        {"cbrt", elementwise_cbrt},
+        {"erf", elementwise_erf},
+        {"erfc", elementwise_erfc},
+    };
+    auto func = funcs.find(op);
+    if (func == funcs.end()) return nullptr;
+    return func->second;
+}
+
+/// Compute `op` on each element of a continuous CV_64F matrix in place
+static bool elementwise_math(cv::Mat& values, const std::string& op) {
+    if (op == "sqrt") {
+        cv::sqrt(values, values);
+    } else if (op == "rsqrt") {
+        cv::sqrt(values, values);
+        cv::divide(1.0, values, values);
+    } else if (op == "sigmoid") {
+        cv::exp(-values, values);
+        cv::add(values, 1.0, values);
+        cv::divide(1.0, values, values);
+    } else {
+        elementwise_math_func func = get_elementwise_math_func(op);
+        if (func == nullptr) return false;
+        double * data = (double *)values.data;
+        size_t num_elem = values.total() * values.channels();
+        for (size_t i = 0; i < num_elem; i++) {
+            data[i] = func(data[i]);
+        }
+    }
+    return true;
+}
+
+// @evision c: mat_elementwise_math,evision_cv_mat_elementwise_math,1
+// @evision nif: def mat_elementwise_math(_opts \\ []), do: :erlang.nif_error("Mat::elementwise_math not loaded")
+static ERL_NIF_TERM evision_cv_mat_elementwise_math(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::string op;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "op"), op, ArgInfo("op", 0))) {
+        int error_flag = false;
+        bool valid_op = true;
+        Mat values, ret;
+        ERRWRAP2(img.convertTo(values, CV_64F), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        ERRWRAP2(valid_op = elementwise_math(values, op), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        if (!valid_op) {
+            return evision::nif::error(env, "elementwise_math failed: unknown op");
+        }
+
+        // the result has the same type as the input unless the input is an integer matrix
+        int depth = img.depth() == CV_32F ? CV_32F : CV_64F;
+        ERRWRAP2(values.convertTo(ret, depth), env, error_flag, error_term);
+        if (!error_flag) {
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+// @evision c: mat_pow,evision_cv_mat_pow,1
+// @evision nif: def mat_pow(_opts \\ []), do: :erlang.nif_error("Mat::pow not loaded")
+static ERL_NIF_TERM evision_cv_mat_pow(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat l;
+    Mat r;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "r"), r, ArgInfo("r", 0))) {
+        size_t num_elem = l.total() * l.channels();
+        if (num_elem != r.total() * r.channels()) {
+            return evision::nif::error(env, "pow failed: base and exponent should have the same number of elements");
+        }
+
+        int error_flag = false;
+        Mat base, exponent, ret;
+        ERRWRAP2(l.convertTo(base, CV_64F), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        ERRWRAP2(r.convertTo(exponent, CV_64F), env, error_flag, error_term);
+        if (error_flag) return error_term;
+
+        double * b = (double *)base.data;
+        const double * e = (const double *)exponent.data;
+        for (size_t i = 0; i < num_elem; i++) {
+            b[i] = std::pow(b[i], e[i]);
+        }
+
+        ERRWRAP2(base.convertTo(ret, l.depth()), env, error_flag, error_term);
+        if (!error_flag) {
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_ELEMENTWISE_MATH_H
@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_expm1, evision_cv_mat_expm1, 1
 // @evision nif: def mat_expm1(_opts \\ []), do: :erlang.nif_error("Mat::expm1 not loaded")
@@ -18,17 +19,10 @@ static ERL_NIF_TERM evision_cv_mat_expm1(ErlNifEnv *env, int argc, const ERL_NIF
         Mat img;
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
-            Mat ret;
-
-            ERRWRAP2(cv::exp(img, ret), env, error_flag, error_term);
-            if (!error_flag) {
-                ERRWRAP2(ret = Mat(ret - 1), env, error_flag, error_term);
-                if (!error_flag) {
-                    return evision_from(env, ret);
-                }
-            }
-            cv::exp(img, ret);
-            return evision_from(env, Mat(ret - 1));
+            return evision_chunked_elementwise(env, "mat_expm1", argv, {img}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::exp(in[0], ret);
+                ret = ret - 1;
+            });
         }
     }
 
@@ -5,7 +5,7 @@
 #include "../../ArgInfo.hpp"
 #include "../evision_mat_utils.hpp"
 
-// @evision c: mat_from_binary,evision_cv_mat_from_binary,1
+// @evision c: mat_from_binary,evision_cv_mat_from_binary,1,normal
 // @evision nif: def mat_from_binary(_opts \\ []), do: :erlang.nif_error("Mat::from_binary not loaded")
 static ERL_NIF_TERM evision_cv_mat_from_binary(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -53,7 +53,13 @@ static ERL_NIF_TERM evision_cv_mat_from_binary(ErlNifEnv *env, int argc, const E
                     // 	which means that no data is copied. This operation is very efficient and can be used
                     // 	to process external data using OpenCV functions. The external data is not automatically
                     // 	deallocated, so you should take care of it.
-                    res->val = new Mat(img_rows, img_cols, type, (void *)res->in_buf);
+                    res->val = evision_mat_header_new(img_rows, img_cols, type, (void *)res->in_buf);
+                    if (res->val == nullptr) {
+                        enif_release_resource(res);
+                        return evision::nif::error(env, "no memory");
+                    }
+
+                    evision_mat_res_account(env, res);
 
                     // transfer ownership to ERTS
                     ERL_NIF_TERM term = enif_make_resource(env, res);
@@ -74,7 +80,7 @@ static ERL_NIF_TERM evision_cv_mat_from_binary(ErlNifEnv *env, int argc, const E
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_from_binary_by_shape,evision_cv_mat_from_binary_by_shape,1
+// @evision c: mat_from_binary_by_shape,evision_cv_mat_from_binary_by_shape,1,normal
 // @evision nif: def mat_from_binary_by_shape(_opts \\ []), do: :erlang.nif_error("Mat::from_binary_by_shape not loaded")
 static ERL_NIF_TERM evision_cv_mat_from_binary_by_shape(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -120,9 +126,15 @@ static ERL_NIF_TERM evision_cv_mat_from_binary_by_shape(ErlNifEnv *env, int argc
                     // 	which means that no data is copied. This operation is very efficient and can be used
                     // 	to process external data using OpenCV functions. The external data is not automatically
                     // 	deallocated, so you should take care of it.
-                    res->val = new Mat(ndims, sizes, type, (void *)res->in_buf);
+                    res->val = evision_mat_header_new(ndims, sizes, type, (void *)res->in_buf);
 
                     enif_free((void *)sizes);
+                    if (res->val == nullptr) {
+                        enif_release_resource(res);
+                        return evision::nif::error(env, "no memory");
+                    }
+
+                    evision_mat_res_account(env, res);
 
                     // transfer ownership to ERTS
                     ERL_NIF_TERM term = enif_make_resource(env, res);
@@ -0,0 +1,271 @@
+#ifndef EVISION_BACKEND_FUSED_ELEMENTWISE_H
+#define EVISION_BACKEND_FUSED_ELEMENTWISE_H
+
+#include <cmath>
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "chunked.h"
+
+// number of elements evaluated at a time, small enough to keep the whole stack in L1
+#define EVISION_FUSED_BLOCK_SIZE 1024
+
+enum fused_op_code {
+    FUSED_INPUT,
+    FUSED_CONST,
+    FUSED_NEGATE,
+    FUSED_ABS,
+    FUSED_EXP,
+    FUSED_LOG,
+    FUSED_SQRT,
+    FUSED_ADD,
+    FUSED_SUBTRACT,
+    FUSED_MULTIPLY,
+    FUSED_DIVIDE,
+    FUSED_MIN,
+    FUSED_MAX,
+    FUSED_POW,
+    FUSED_CLIP,
+};
+
+struct fused_instruction {
+    fused_op_code code;
+    int arity;
+    double arg;
+};
+
+/// Compile a postfix expression into a program
+/// @param ops operation of each instruction
+/// @param args for `input`, the index of the input matrix; for `const`, the constant value; ignored otherwise
+/// @param max_depth maximum number of values on the stack when running the program
+static bool fused_compile(const std::vector<std::string>& ops, const std::vector<double>& args, size_t num_inputs,
+                          std::vector<fused_instruction>& program, int& max_depth, std::string& error) {
+    static const std::map<std::string, std::pair<fused_op_code, int>> op_table = {
+        {"input", {FUSED_INPUT, 0}},
+        {"const", {FUSED_CONST, 0}},
+        {"negate", {FUSED_NEGATE, 1}},
+        {"abs", {FUSED_ABS, 1}},
+        {"exp", {FUSED_EXP, 1}},
+        {"log", {FUSED_LOG, 1}},
+        {"sqrt", {FUSED_SQRT, 1}},
+        {"add", {FUSED_ADD, 2}},
+        {"subtract", {FUSED_SUBTRACT, 2}},
+        {"multiply", {FUSED_MULTIPLY, 2}},
+        {"divide", {FUSED_DIVIDE, 2}},
+        {"min", {FUSED_MIN, 2}},
+        {"max", {FUSED_MAX, 2}},
+        {"pow", {FUSED_POW, 2}},
+        {"clip", {FUSED_CLIP, 3}},
+    };
+
+    if (ops.size() != args.size()) {
+        error = "ops and args should have the same length";
+        return false;
+    }
+
+    int depth = 0;
+    max_depth = 0;
+    program.clear();
+    for (size_t i = 0; i < ops.size(); i++) {
+        auto op = op_table.find(ops[i]);
+        if (op == op_table.end()) {
+            error = "unknown op: " + ops[i];
+            return false;
+        }
+
+        fused_instruction instruction{op->second.first, op->second.second, args[i]};
+        if (instruction.code == FUSED_INPUT && (args[i] < 0 || args[i] >= num_inputs)) {
+            error = "input index out of range";
+            return false;
+        }
+        if (depth < instruction.arity) {
+            error = "not enough operands for " + ops[i];
+            return false;
+        }
+
+        depth += (instruction.arity == 0) ? 1 : 1 - instruction.arity;
+        max_depth = std::max(max_depth, depth);
+        program.push_back(instruction);
+    }
+
+    if (depth != 1) {
+        error = "the expression should evaluate to exactly one value";
+        return false;
+    }
+    return true;
+}
+
+template <typename T>
+static void fused_load(const uchar * data, bool broadcast, size_t start, size_t n, double * dst) {
+    const T * src = (const T *)data;
+    if (broadcast) {
+        std::fill(dst, dst + n, (double)src[0]);
+    } else {
+        src += start;
+        for (size_t i = 0; i < n; i++) {
+            dst[i] = (double)src[i];
+        }
+    }
+}
+
+static void fused_load(const cv::Mat& mat, bool broadcast, size_t start, size_t n, double * dst) {
+    switch (mat.depth()) {
+        case CV_8U: fused_load<uchar>(mat.data, broadcast, start, n, dst); break;
+        case CV_8S: fused_load<schar>(mat.data, broadcast, start, n, dst); break;
+        case CV_16U: fused_load<ushort>(mat.data, broadcast, start, n, dst); break;
+        case CV_16S: fused_load<short>(mat.data, broadcast, start, n, dst); break;
+        case CV_32S: fused_load<int>(mat.data, broadcast, start, n, dst); break;
+        case CV_32F: fused_load<float>(mat.data, broadcast, start, n, dst); break;
+        case CV_64F: fused_load<double>(mat.data, broadcast, start, n, dst); break;
+    }
+}
+
+template <typename T>
+static void fused_store(const double * src, size_t start, size_t n, uchar * data) {
+    T * dst = (T *)data + start;
+    for (size_t i = 0; i < n; i++) {
+        dst[i] = cv::saturate_cast<T>(src[i]);
+    }
+}
+
+static void fused_store(const double * src, size_t start, size_t n, cv::Mat& mat) {
+    switch (mat.depth()) {
+        case CV_8U: fused_store<uchar>(src, start, n, mat.data); break;
+        case CV_8S: fused_store<schar>(src, start, n, mat.data); break;
+        case CV_16U: fused_store<ushort>(src, start, n, mat.data); break;
+        case CV_16S: fused_store<short>(src, start, n, mat.data); break;
+        case CV_32S: fused_store<int>(src, start, n, mat.data); break;
+        case CV_32F: fused_store<float>(src, start, n, mat.data); break;
+        case CV_64F: fused_store<double>(src, start, n, mat.data); break;
+    }
+}
+
+/// Run `program` on elements [start, start + n) of the inputs, leaving the result at the bottom of `stack`
+static void fused_run(const std::vector<fused_instruction>& program, const std::vector<cv::Mat>& inputs,
+                      const std::vector<bool>& broadcast, size_t start, size_t n, double * stack) {
+    const size_t bs = EVISION_FUSED_BLOCK_SIZE;
+    int top = 0;
+    for (auto& instruction : program) {
+        double * x = stack + (size_t)(top - instruction.arity) * bs;
+        double * y = x + bs;
+        double * z = y + bs;
+        switch (instruction.code) {
+            case FUSED_INPUT: {
+                int index = (int)instruction.arg;
+                fused_load(inputs[index], broadcast[index], start, n, x);
+                break;
+            }
+            case FUSED_CONST: std::fill(x, x + n, instruction.arg); break;
+            case FUSED_NEGATE: for (size_t i = 0; i < n; i++) x[i] = -x[i]; break;
+            case FUSED_ABS: for (size_t i = 0; i < n; i++) x[i] = std::abs(x[i]); break;
+            case FUSED_EXP: for (size_t i = 0; i < n; i++) x[i] = std::exp(x[i]); break;
+            case FUSED_LOG: for (size_t i = 0; i < n; i++) x[i] = std::log(x[i]); break;
+            case FUSED_SQRT: for (size_t i = 0; i < n; i++) x[i] = std::sqrt(x[i]); break;
+            case FUSED_ADD: for (size_t i = 0; i < n; i++) x[i] += y[i]; break;
+            case FUSED_SUBTRACT: for (size_t i = 0; i < n; i++) x[i] -= y[i]; break;
+            case FUSED_MULTIPLY: for (size_t i = 0; i < n; i++) x[i] *= y[i]; break;
+            case FUSED_DIVIDE: for (size_t i = 0; i < n; i++) x[i] /= y[i]; break;
+            case FUSED_MIN: for (size_t i = 0; i < n; i++) x[i] = std::min(x[i], y[i]); break;
+            case FUSED_MAX: for (size_t i = 0; i < n; i++) x[i] = std::max(x[i], y[i]); break;
+            case FUSED_POW: for (size_t i = 0; i < n; i++) x[i] = std::pow(x[i], y[i]); break;
+            case FUSED_CLIP: for (size_t i = 0; i < n; i++) x[i] = std::min(std::max(x[i], y[i]), z[i]); break;
+        }
+        top += (instruction.arity == 0) ? 1 : 1 - instruction.arity;
+    }
+}
+
+// @evision c: mat_fused_elementwise,evision_cv_mat_fused_elementwise,1
+// @evision nif: def mat_fused_elementwise(_opts \\ []), do: :erlang.nif_error("Mat::fused_elementwise not loaded")
+static ERL_NIF_TERM evision_cv_mat_fused_elementwise(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    std::vector<Mat> inputs;
+    std::vector<std::string> ops;
+    std::vector<double> args;
+    std::string t;
+    int l = 0;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "inputs"), inputs, ArgInfo("inputs", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "ops"), ops, ArgInfo("ops", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "args"), args, ArgInfo("args", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "t"), t, ArgInfo("t", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0))) {
+        int depth;
+        if (!get_binary_type(t, l, 0, depth)) {
+            return evision::nif::error(env, "fused_elementwise failed: unsupported target type");
+        }
+        if (inputs.size() == 0) {
+            return evision::nif::error(env, "fused_elementwise failed: expecting at least one input matrix");
+        }
+
+        std::vector<fused_instruction> program;
+        int max_depth = 0;
+        std::string error;
+        if (!fused_compile(ops, args, inputs.size(), program, max_depth, error)) {
+            return evision::nif::error(env, ("fused_elementwise failed: " + error).c_str());
+        }
+
+        // the output has the shape of the first input that is not a single element,
+        // single element inputs are broadcasted
+        int ref = 0;
+        for (size_t i = 0; i < inputs.size(); i++) {
+            if (inputs[i].total() * inputs[i].channels() > 1) {
+                ref = (int)i;
+                break;
+            }
+        }
+        size_t total = inputs[ref].total() * inputs[ref].channels();
+        std::vector<bool> broadcast(inputs.size());
+        for (size_t i = 0; i < inputs.size(); i++) {
+            if (inputs[i].depth() == CV_16F) {
+                return evision::nif::error(env, "fused_elementwise failed: unsupported input type");
+            }
+            if (!inputs[i].isContinuous()) {
+                inputs[i] = inputs[i].clone();
+            }
+            size_t num_elem = inputs[i].total() * inputs[i].channels();
+            if (num_elem != total && num_elem != 1) {
+                return evision::nif::error(env, "fused_elementwise failed: inputs should have the same number of elements");
+            }
+            broadcast[i] = (num_elem == 1 && total != 1);
+        }
+
+        int error_flag = false;
+        Mat ret;
+        ERRWRAP2(ret = Mat(inputs[ref].dims, inputs[ref].size.p, CV_MAKETYPE(depth, inputs[ref].channels())), env, error_flag, error_term);
+        if (error_flag) return error_term;
+
+        // blocks are evaluated in parallel, a few grains at a time so that huge
+        // matrices do not hold the dirty scheduler for the whole evaluation
+        const size_t bs = EVISION_FUSED_BLOCK_SIZE;
+        evision_chunked_job job;
+        job.name = "mat_fused_elementwise";
+        job.next = 0;
+        job.total = (total + bs - 1) / bs;
+        job.grain = std::max((size_t)1, (size_t)EVISION_CHUNK_GRAIN_BYTES / (bs * sizeof(double)) * cv::getNumThreads());
+        job.run = [=](ErlNifEnv *, ERL_NIF_TERM&, size_t begin, size_t end) {
+            cv::parallel_for_(cv::Range((int)begin, (int)end), [&](const cv::Range& range) {
+                std::vector<double> stack((size_t)max_depth * bs);
+                Mat out = ret;
+                for (int block = range.start; block < range.end; block++) {
+                    size_t start = (size_t)block * bs;
+                    size_t n = std::min(bs, total - start);
+                    fused_run(program, inputs, broadcast, start, n, stack.data());
+                    fused_store(stack.data(), start, n, out);
+                }
+            });
+        };
+        job.finish = [=](ErlNifEnv *env, ERL_NIF_TERM) {
+            return evision_from(env, ret);
+        };
+        return evision_chunked_schedule(env, argv, job);
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_FUSED_ELEMENTWISE_H
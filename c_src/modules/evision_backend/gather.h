@@ -0,0 +1,67 @@
+#ifndef EVISION_BACKEND_GATHER_H
+#define EVISION_BACKEND_GATHER_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+// @evision c: mat_gather,evision_cv_mat_gather,1
+// @evision nif: def mat_gather(_opts \\ []), do: :erlang.nif_error("Mat::gather not loaded")
+static ERL_NIF_TERM evision_cv_mat_gather(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::vector<int> shape;
+    Mat indices;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shape"), shape, ArgInfo("shape", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "indices"), indices, ArgInfo("indices", 0))) {
+        if (!nd_continuous(img, shape)) {
+            return evision::nif::error(env, "gather failed: cannot treated matrix as the request shape");
+        }
+
+        // indices are read as rows of `ndims` coordinates
+        size_t ndims = shape.size();
+        int error_flag = false;
+        Mat coords;
+        ERRWRAP2(indices.convertTo(coords, CV_32S), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        if (!coords.isContinuous()) {
+            coords = coords.clone();
+        }
+        size_t num_coords = coords.total() * coords.channels();
+        if (ndims == 0 || num_coords % ndims != 0) {
+            return evision::nif::error(env, "gather failed: the last dimension of indices should be the rank of the matrix");
+        }
+        int num_elem = (int)(num_coords / ndims);
+
+        size_t elem_size = img.elemSize1();
+        std::vector<size_t> steps = nd_steps(shape, elem_size);
+        Mat ret;
+        ERRWRAP2(ret = Mat(1, num_elem, img.depth()), env, error_flag, error_term);
+        if (error_flag) return error_term;
+
+        const int32_t * index = (const int32_t *)coords.data;
+        for (int n = 0; n < num_elem; n++, index += ndims) {
+            size_t offset = 0;
+            for (size_t i = 0; i < ndims; i++) {
+                if (index[i] < 0 || index[i] >= shape[i]) {
+                    return evision::nif::error(env, "gather failed: index out of bounds");
+                }
+                offset += index[i] * steps[i];
+            }
+            memcpy(ret.data + n * elem_size, img.data + offset, elem_size);
+        }
+        return evision_from(env, ret);
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_GATHER_H
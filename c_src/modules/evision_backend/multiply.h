@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_multiply, evision_cv_mat_multiply, 1
 // @evision nif: def mat_multiply(_opts \\ []), do: :erlang.nif_error("Mat::multiply not loaded")
@@ -19,13 +20,9 @@ static ERL_NIF_TERM evision_cv_mat_multiply(ErlNifEnv *env, int argc, const ERL_
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "r"), r, ArgInfo("r", 0))) {
-            Mat ret;
-
-            int error_flag = false;
-            ERRWRAP2(cv::multiply(l, r, ret, 1, -1), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_multiply", argv, {l, r}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::multiply(in[0], in[1], ret, 1, -1);
+            });
         }
     }
 
@@ -54,9 +51,9 @@ static ERL_NIF_TERM evision_cv_mat_multiply_typed(ErlNifEnv *env, int argc, cons
             evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0))) {
             int type;
             if (!get_binary_type(t, l, 0, type)) return evision::nif::error(env, "not implemented for the given type");
-            Mat ret;
-            cv::multiply(lhs, rhs, ret, 1, type);
-            return evision_from(env, ret);
+            return evision_chunked_elementwise(env, "mat_multiply_typed", argv, {lhs, rhs}, [type](const std::vector<Mat>& in, Mat& ret) {
+                cv::multiply(in[0], in[1], ret, 1, type);
+            });
         }
     }
 
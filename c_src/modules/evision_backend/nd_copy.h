@@ -0,0 +1,80 @@
+#ifndef EVISION_BACKEND_ND_COPY_H
+#define EVISION_BACKEND_ND_COPY_H
+
+#include <cstring>
+#include <vector>
+
+/// Distance in bytes between two adjacent elements along each axis of a continuous N-d array
+/// @param shape shape of the array
+/// @param elem_size element size in bytes
+static std::vector<size_t> nd_steps(const std::vector<int>& shape, size_t elem_size) {
+    std::vector<size_t> steps(shape.size());
+    size_t step = elem_size;
+    for (int64_t i = (int64_t)shape.size() - 1; i >= 0; i--) {
+        steps[i] = step;
+        step *= shape[i];
+    }
+    return steps;
+}
+
+/// Number of elements of an N-d array
+static size_t nd_num_elements(const std::vector<int>& shape) {
+    size_t num_elem = 1;
+    for (auto& dim : shape) {
+        num_elem *= dim;
+    }
+    return num_elem;
+}
+
+/// Makes the data of `mat` continuous and checks that it can be treated as an array of `shape`
+/// @return true if `mat` has the same number of elements as `shape`
+static bool nd_continuous(cv::Mat& mat, const std::vector<int>& shape) {
+    if (!mat.isContinuous()) {
+        mat = mat.clone();
+    }
+    return nd_num_elements(shape) == mat.total() * mat.channels();
+}
+
+/// Copy an N-d block of elements
+/// @param src starting address of the block in the source array
+/// @param src_steps distance in bytes between two adjacent source elements along each axis
+/// @param dst starting address of the block in the destination array
+/// @param dst_steps distance in bytes between two adjacent destination elements along each axis
+/// @param lengths number of elements to copy along each axis
+/// @param elem_size element size in bytes
+static void nd_copy(const uint8_t * src, const std::vector<size_t>& src_steps,
+                    uint8_t * dst, const std::vector<size_t>& dst_steps,
+                    const std::vector<int>& lengths, size_t elem_size) {
+    size_t ndims = lengths.size();
+    for (size_t i = 0; i < ndims; i++) {
+        if (lengths[i] <= 0) return;
+    }
+
+    // copy whole rows at once if both sides are contiguous along the last axis
+    size_t iter_dims = ndims;
+    size_t bytes = elem_size;
+    if (ndims > 0 && src_steps[ndims - 1] == elem_size && dst_steps[ndims - 1] == elem_size) {
+        iter_dims = ndims - 1;
+        bytes = elem_size * lengths[ndims - 1];
+    }
+
+    std::vector<int> index(iter_dims, 0);
+    while (true) {
+        size_t src_offset = 0;
+        size_t dst_offset = 0;
+        for (size_t i = 0; i < iter_dims; i++) {
+            src_offset += index[i] * src_steps[i];
+            dst_offset += index[i] * dst_steps[i];
+        }
+        memcpy(dst + dst_offset, src + src_offset, bytes);
+
+        int64_t axis = (int64_t)iter_dims - 1;
+        for (; axis >= 0; axis--) {
+            if (++index[axis] < lengths[axis]) break;
+            index[axis] = 0;
+        }
+        if (axis < 0) break;
+    }
+}
+
+#endif // EVISION_BACKEND_ND_COPY_H
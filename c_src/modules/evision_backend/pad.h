@@ -0,0 +1,94 @@
+#ifndef EVISION_BACKEND_PAD_H
+#define EVISION_BACKEND_PAD_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+// @evision c: mat_pad,evision_cv_mat_pad,1
+// @evision nif: def mat_pad(_opts \\ []), do: :erlang.nif_error("Mat::pad not loaded")
+static ERL_NIF_TERM evision_cv_mat_pad(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::vector<int> shape;
+    double value = 0;
+    std::vector<int> lo;
+    std::vector<int> hi;
+    std::vector<int> interior;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shape"), shape, ArgInfo("shape", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "value"), value, ArgInfo("value", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "lo"), lo, ArgInfo("lo", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "hi"), hi, ArgInfo("hi", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "interior"), interior, ArgInfo("interior", 0))) {
+        size_t ndims = shape.size();
+        if (lo.size() != ndims || hi.size() != ndims || interior.size() != ndims) {
+            return evision::nif::error(env, "pad failed: padding config should have the same rank as the matrix");
+        }
+
+        if (!nd_continuous(img, shape)) {
+            return evision::nif::error(env, "pad failed: cannot treated matrix as the request shape");
+        }
+
+        // pad with the non-negative part of lo and hi first,
+        // negative padding is then applied by cropping the padded matrix
+        std::vector<int> padded_shape(ndims);
+        std::vector<int> crop_start(ndims);
+        std::vector<int> crop_shape(ndims);
+        bool need_crop = false;
+        for (size_t i = 0; i < ndims; i++) {
+            if (interior[i] < 0) {
+                return evision::nif::error(env, "pad failed: interior padding should be non-negative");
+            }
+            padded_shape[i] = std::max(lo[i], 0) + std::max(hi[i], 0) + shape[i] + (shape[i] - 1) * interior[i];
+            crop_start[i] = std::max(-lo[i], 0);
+            crop_shape[i] = padded_shape[i] - crop_start[i] - std::max(-hi[i], 0);
+            if (crop_shape[i] <= 0) {
+                return evision::nif::error(env, "pad failed: negative padding removes the whole dimension");
+            }
+            need_crop = need_crop || crop_shape[i] != padded_shape[i];
+        }
+
+        size_t elem_size = img.elemSize1();
+        std::vector<size_t> padded_steps = nd_steps(padded_shape, elem_size);
+        std::vector<size_t> dst_steps(ndims);
+        size_t dst_offset = 0;
+        for (size_t i = 0; i < ndims; i++) {
+            dst_offset += std::max(lo[i], 0) * padded_steps[i];
+            dst_steps[i] = padded_steps[i] * (interior[i] + 1);
+        }
+
+        int error_flag = false;
+        Mat padded;
+        ERRWRAP2(padded = Mat((int)ndims, padded_shape.data(), img.depth()), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        ERRWRAP2(padded.setTo(Scalar(value)), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        nd_copy(img.data, nd_steps(shape, elem_size), padded.data + dst_offset, dst_steps, shape, elem_size);
+
+        if (!need_crop) {
+            return evision_from(env, padded);
+        }
+
+        Mat ret;
+        ERRWRAP2(ret = Mat((int)ndims, crop_shape.data(), img.depth()), env, error_flag, error_term);
+        if (error_flag) return error_term;
+        size_t src_offset = 0;
+        for (size_t i = 0; i < ndims; i++) {
+            src_offset += crop_start[i] * padded_steps[i];
+        }
+        nd_copy(padded.data + src_offset, padded_steps, ret.data, nd_steps(crop_shape, elem_size), crop_shape, elem_size);
+        return evision_from(env, ret);
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_PAD_H
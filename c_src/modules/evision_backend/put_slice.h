@@ -0,0 +1,63 @@
+#ifndef EVISION_BACKEND_PUT_SLICE_H
+#define EVISION_BACKEND_PUT_SLICE_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+// @evision c: mat_put_slice,evision_cv_mat_put_slice,1
+// @evision nif: def mat_put_slice(_opts \\ []), do: :erlang.nif_error("Mat::put_slice not loaded")
+static ERL_NIF_TERM evision_cv_mat_put_slice(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::vector<int> shape;
+    std::vector<int> start;
+    Mat slice;
+    std::vector<int> slice_shape;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shape"), shape, ArgInfo("shape", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "start"), start, ArgInfo("start", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "slice"), slice, ArgInfo("slice", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "slice_shape"), slice_shape, ArgInfo("slice_shape", 0))) {
+        size_t ndims = shape.size();
+        if (start.size() != ndims || slice_shape.size() != ndims) {
+            return evision::nif::error(env, "put_slice failed: start and slice should have the same rank as the matrix");
+        }
+        if (img.depth() != slice.depth()) {
+            return evision::nif::error(env, "put_slice failed: slice should have the same type as the matrix");
+        }
+
+        if (!nd_continuous(img, shape) || !nd_continuous(slice, slice_shape)) {
+            return evision::nif::error(env, "put_slice failed: cannot treated matrix as the request shape");
+        }
+
+        size_t elem_size = img.elemSize1();
+        std::vector<size_t> steps = nd_steps(shape, elem_size);
+        size_t dst_offset = 0;
+        for (size_t i = 0; i < ndims; i++) {
+            if (start[i] < 0 || start[i] + slice_shape[i] > shape[i]) {
+                return evision::nif::error(env, "put_slice failed: slice is out of bounds");
+            }
+            dst_offset += start[i] * steps[i];
+        }
+
+        int error_flag = false;
+        Mat ret;
+        ERRWRAP2(ret = img.clone(), env, error_flag, error_term);
+        if (!error_flag) {
+            nd_copy(slice.data, nd_steps(slice_shape, elem_size), ret.data + dst_offset, steps, slice_shape, elem_size);
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_PUT_SLICE_H
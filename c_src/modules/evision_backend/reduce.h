@@ -0,0 +1,134 @@
+#ifndef EVISION_BACKEND_REDUCE_H
+#define EVISION_BACKEND_REDUCE_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+#define EVISION_REDUCE_PRODUCT -1
+
+/// Reduce one axis of a continuous CV_64F array
+/// @param values values of the array, reshaped to (outer, len, inner)
+/// @param out reduced values, (outer, inner)
+static void reduce_axis(const cv::Mat& values, cv::Mat& out, int outer, int len, int inner, int op) {
+    out = cv::Mat(outer, inner, CV_64F);
+    if (op == EVISION_REDUCE_PRODUCT) {
+        const double * src = (const double *)values.data;
+        double * dst = (double *)out.data;
+        for (int o = 0; o < outer; o++) {
+            double * row = dst + (size_t)o * inner;
+            const double * block = src + (size_t)o * len * inner;
+            std::fill(row, row + inner, 1.0);
+            for (int l = 0; l < len; l++) {
+                for (int i = 0; i < inner; i++) {
+                    row[i] *= block[(size_t)l * inner + i];
+                }
+            }
+        }
+    } else if (inner == 1) {
+        cv::Mat src(outer, len, CV_64F, values.data);
+        cv::Mat reduced;
+        cv::reduce(src, reduced, 1, op, CV_64F);
+        out = reduced.reshape(1, outer);
+    } else {
+        for (int o = 0; o < outer; o++) {
+            cv::Mat block(len, inner, CV_64F, values.data + (size_t)o * len * inner * sizeof(double));
+            cv::Mat row = out.row(o);
+            cv::reduce(block, row, 0, op, CV_64F);
+        }
+    }
+}
+
+// @evision c: mat_reduce,evision_cv_mat_reduce,1
+// @evision nif: def mat_reduce(_opts \\ []), do: :erlang.nif_error("Mat::reduce not loaded")
+static ERL_NIF_TERM evision_cv_mat_reduce(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::vector<int> shape;
+    std::vector<int> axes;
+    std::string op;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shape"), shape, ArgInfo("shape", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "axes"), axes, ArgInfo("axes", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "op"), op, ArgInfo("op", 0))) {
+        int reduce_op;
+        if (op == "sum") {
+            reduce_op = REDUCE_SUM;
+        } else if (op == "product") {
+            reduce_op = EVISION_REDUCE_PRODUCT;
+        } else if (op == "max" || op == "any") {
+            reduce_op = REDUCE_MAX;
+        } else if (op == "min" || op == "all") {
+            reduce_op = REDUCE_MIN;
+        } else {
+            return evision::nif::error(env, "reduce failed: invalid option value for op. Valid values are :sum, :product, :max, :min, :all and :any");
+        }
+
+        if (!nd_continuous(img, shape)) {
+            return evision::nif::error(env, "reduce failed: cannot treated matrix as the request shape");
+        }
+
+        int ndims = (int)shape.size();
+        std::vector<bool> reduce_axes(ndims, false);
+        for (auto& axis : axes) {
+            if (axis < 0 || axis >= ndims) {
+                return evision::nif::error(env, "reduce failed: axis out of range");
+            }
+            reduce_axes[axis] = true;
+        }
+
+        int error_flag = false;
+        Mat values;
+        Mat flat(1, (int)nd_num_elements(shape), img.depth(), img.data);
+        if (op == "all" || op == "any") {
+            // all and any work on the truth value of each element
+            Mat mask;
+            ERRWRAP2(cv::compare(flat, 0, mask, CMP_NE), env, error_flag, error_term);
+            if (error_flag) return error_term;
+            mask.convertTo(values, CV_64F, 1.0 / 255);
+        } else {
+            ERRWRAP2(flat.convertTo(values, CV_64F), env, error_flag, error_term);
+            if (error_flag) return error_term;
+        }
+
+        // reduced axes are kept with size 1
+        std::vector<int> reduced_shape = shape;
+        for (int axis = 0; axis < ndims; axis++) {
+            if (!reduce_axes[axis] || reduced_shape[axis] == 1) continue;
+
+            int outer = 1, inner = 1;
+            for (int i = 0; i < axis; i++) outer *= reduced_shape[i];
+            for (int i = axis + 1; i < ndims; i++) inner *= reduced_shape[i];
+
+            Mat reduced;
+            ERRWRAP2(reduce_axis(values, reduced, outer, reduced_shape[axis], inner, reduce_op), env, error_flag, error_term);
+            if (error_flag) return error_term;
+            values = reduced;
+            reduced_shape[axis] = 1;
+        }
+
+        Mat ret;
+        if (op == "max" || op == "min") {
+            values.convertTo(ret, img.depth());
+        } else if (op == "all" || op == "any") {
+            values.convertTo(ret, CV_8U);
+        } else {
+            ret = values;
+        }
+        ERRWRAP2(ret = ret.reshape(1, reduced_shape), env, error_flag, error_term);
+        if (!error_flag) {
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_REDUCE_H
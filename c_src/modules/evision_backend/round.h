@@ -16,7 +16,7 @@ static ERL_NIF_TERM evision_cv_mat_round(ErlNifEnv *env, int argc, const ERL_NIF
     {
         Mat img;
 
-        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 1))) {
             int type = img.type();
             uint8_t depth = type & CV_MAT_DEPTH_MASK;
             if (depth == CV_32F) {
@@ -17,7 +17,7 @@ static ERL_NIF_TERM evision_cv_mat_sign(ErlNifEnv *env, int argc, const ERL_NIF_
     {
         Mat img;
 
-        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 1))) {
             ERRWRAP2(img.setTo(1, img > 0), env, error_flag, error_term);
             if (!error_flag) {
                 ERRWRAP2(img.setTo(0, img == 0), env, error_flag, error_term);
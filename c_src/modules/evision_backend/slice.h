@@ -0,0 +1,64 @@
+#ifndef EVISION_BACKEND_SLICE_H
+#define EVISION_BACKEND_SLICE_H
+
+#include <erl_nif.h>
+#include "../../ArgInfo.hpp"
+#include "nd_copy.h"
+
+// @evision c: mat_slice,evision_cv_mat_slice,1
+// @evision nif: def mat_slice(_opts \\ []), do: :erlang.nif_error("Mat::slice not loaded")
+static ERL_NIF_TERM evision_cv_mat_slice(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    Mat img;
+    std::vector<int> shape;
+    std::vector<int> start;
+    std::vector<int> lengths;
+    std::vector<int> strides;
+
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "shape"), shape, ArgInfo("shape", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "start"), start, ArgInfo("start", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "lengths"), lengths, ArgInfo("lengths", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "strides"), strides, ArgInfo("strides", 0))) {
+        size_t ndims = shape.size();
+        if (start.size() != ndims || lengths.size() != ndims || strides.size() != ndims) {
+            return evision::nif::error(env, "slice failed: start, lengths and strides should have the same rank as the matrix");
+        }
+
+        if (!nd_continuous(img, shape)) {
+            return evision::nif::error(env, "slice failed: cannot treated matrix as the request shape");
+        }
+
+        size_t elem_size = img.elemSize1();
+        std::vector<size_t> steps = nd_steps(shape, elem_size);
+        std::vector<size_t> src_steps(ndims);
+        std::vector<int> out_shape(ndims);
+        const uint8_t * src = img.data;
+        for (size_t i = 0; i < ndims; i++) {
+            if (start[i] < 0 || lengths[i] <= 0 || strides[i] <= 0 || start[i] + lengths[i] > shape[i]) {
+                return evision::nif::error(env, "slice failed: slice is out of bounds");
+            }
+            src += start[i] * steps[i];
+            src_steps[i] = steps[i] * strides[i];
+            out_shape[i] = (lengths[i] + strides[i] - 1) / strides[i];
+        }
+
+        int error_flag = false;
+        Mat ret;
+        ERRWRAP2(ret = Mat((int)ndims, out_shape.data(), img.depth()), env, error_flag, error_term);
+        if (!error_flag) {
+            nd_copy(src, src_steps, ret.data, nd_steps(out_shape, elem_size), out_shape, elem_size);
+            return evision_from(env, ret);
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_BACKEND_SLICE_H
@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_subtract, evision_cv_mat_subtract, 1
 // @evision nif: def mat_subtract(_opts \\ []), do: :erlang.nif_error("Mat::subtract not loaded")
@@ -19,13 +20,9 @@ static ERL_NIF_TERM evision_cv_mat_subtract(ErlNifEnv *env, int argc, const ERL_
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "r"), r, ArgInfo("r", 0))) {
-            Mat ret;
-
-            int error_flag = false;
-            ERRWRAP2(cv::subtract(l, r, ret, cv::noArray(), -1), env, error_flag, error_term);
-            if (!error_flag) {
-                return evision_from(env, ret);
-            }
+            return evision_chunked_elementwise(env, "mat_subtract", argv, {l, r}, [](const std::vector<Mat>& in, Mat& ret) {
+                cv::subtract(in[0], in[1], ret, cv::noArray(), -1);
+            });
         }
     }
 
@@ -54,9 +51,9 @@ static ERL_NIF_TERM evision_cv_mat_subtract_typed(ErlNifEnv *env, int argc, cons
             evision_to_safe(env, evision_get_kw(env, erl_terms, "l"), l, ArgInfo("l", 0))) {
             int type;
             if (!get_binary_type(t, l, 0, type)) return evision::nif::error(env, "not implemented for the given type");
-            Mat ret;
-            cv::subtract(lhs, rhs, ret, cv::noArray(), type);
-            return evision_from(env, ret);
+            return evision_chunked_elementwise(env, "mat_subtract_typed", argv, {lhs, rhs}, [type](const std::vector<Mat>& in, Mat& ret) {
+                cv::subtract(in[0], in[1], ret, cv::noArray(), type);
+            });
         }
     }
 
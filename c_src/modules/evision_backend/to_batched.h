@@ -3,6 +3,7 @@
 
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
+#include "chunked.h"
 
 // @evision c: mat_to_batched,evision_cv_mat_to_batched,1
 // @evision nif: def mat_to_batched(_opts \\ []), do: :erlang.nif_error("Mat::to_batched not loaded")
@@ -26,6 +27,11 @@ static ERL_NIF_TERM evision_cv_mat_to_batched(ErlNifEnv *env, int argc, const ER
             return evision::nif::error(env, "to_batched failed: invalid option value for leftover. Valid values are :repeat and :discard");
         }
 
+        // the data of img must be continuous
+        if (!img.isContinuous()) {
+            img = img.clone();
+        }
+
         size_t mat_num_elem = img.total();
         size_t as_shape_num_elem = 1;
         for (size_t i = 0; i < as_shape.size(); i++) {
@@ -47,41 +53,65 @@ static ERL_NIF_TERM evision_cv_mat_to_batched(ErlNifEnv *env, int argc, const ER
             }
         }
 
-        ERL_NIF_TERM * batches = (ERL_NIF_TERM * )enif_alloc(sizeof(ERL_NIF_TERM) * num_batches);
-        char * data = (char *)img.data;
-        // skip the first (batches)
-        int ndims = (int)as_shape.size();
-        as_shape[0] = (int)batch_size;
-        int * sizes = (int *)as_shape.data();
+        // full batches are views of `shaped` that keep the input resource alive,
+        // so no data is copied for them
+        Mat shaped;
+        int error_flag = false;
+        ERRWRAP2(shaped = img.reshape(0, as_shape), env, error_flag, error_term);
+        if (error_flag) return error_term;
 
-        // deal with full batches
-        char * offset_data = data;
-        for (size_t i = 0; i < num_full_batches; i++) {
-            Mat mat = Mat(ndims, sizes, img.type(), offset_data);
-            batches[i] = evision_from(env, mat.clone());
-            offset_data += batch_bytes;
+        evision_res<cv::Mat *> * parent = nullptr;
+        if (!enif_get_resource(env, evision_get_kw(env, erl_terms, "img"), evision_res<cv::Mat *>::type, (void **)&parent)) {
+            parent = nullptr;
         }
+
         // deal with leftover
+        Mat leftover_mat;
         if (num_batches != num_full_batches) {
-            char * last_batch_data = (char *)enif_alloc(batch_bytes);
+            // skip the first (batches)
+            int ndims = (int)as_shape.size();
+            as_shape[0] = (int)batch_size;
+            leftover_mat = Mat(ndims, as_shape.data(), img.type());
 
             // copy leftover first
+            const char * data = (const char *)img.data;
             uint64_t leftover_bytes = slice_size * remainder;
-            memcpy(last_batch_data, offset_data, leftover_bytes);
+            memcpy(leftover_mat.data, data + num_full_batches * batch_bytes, leftover_bytes);
 
             // repeat from the beginning
-            uint64_t repeat_bytes = batch_bytes - leftover_bytes;
-
-            memcpy(last_batch_data + leftover_bytes, data, repeat_bytes);
-            Mat mat = Mat(ndims, sizes, img.type(), last_batch_data);
-            batches[num_batches - 1] = evision_from(env, mat.clone());
-            enif_free(last_batch_data);
+            uint64_t total_bytes = slice_size * (num_full_batches * batch_size + remainder);
+            for (uint64_t offset = leftover_bytes; offset < batch_bytes;) {
+                uint64_t repeat_bytes = std::min(batch_bytes - offset, total_bytes);
+                memcpy(leftover_mat.data + offset, data, repeat_bytes);
+                offset += repeat_bytes;
+            }
         }
 
-        ERL_NIF_TERM ret = enif_make_list_from_array(env, batches, num_batches);
-        enif_free(batches);
-
-        return ret;
+        // batches are consed onto `acc` from the last one, which gives the list in order.
+        // the parent resource is kept alive by the arguments passed on to each slice
+        evision_chunked_job job;
+        job.name = "mat_to_batched";
+        job.next = 0;
+        job.total = num_batches;
+        job.grain = 1024;
+        job.run = [=](ErlNifEnv *env, ERL_NIF_TERM& acc, size_t begin, size_t end) {
+            std::vector<cv::Range> ranges(shaped.dims, cv::Range::all());
+            for (size_t u = begin; u < end; u++) {
+                size_t i = num_batches - 1 - u;
+                ERL_NIF_TERM batch;
+                if (i >= num_full_batches) {
+                    batch = evision_from(env, leftover_mat);
+                } else {
+                    ranges[0] = cv::Range((int)(i * batch_size), (int)((i + 1) * batch_size));
+                    batch = evision_from_view(env, shaped(ranges), parent);
+                }
+                acc = enif_make_list_cell(env, batch, acc);
+            }
+        };
+        job.finish = [](ErlNifEnv *, ERL_NIF_TERM acc) {
+            return acc;
+        };
+        return evision_chunked_schedule(env, argv, job);
     }
 
     if (error_term != 0) return error_term;
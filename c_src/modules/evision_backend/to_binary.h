@@ -4,7 +4,39 @@
 #include <erl_nif.h>
 #include "../../ArgInfo.hpp"
 
-// @evision c: mat_to_binary,evision_cv_mat_to_binary,1
+// copies a non-continuous Mat, e.g., a view of a ROI, into a new binary
+//
+// this may take a while for large Mats, so it runs on a dirty CPU scheduler,
+// see `evision_cv_mat_to_binary`
+static ERL_NIF_TERM evision_cv_mat_to_binary_copy(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    bool error_flag = false;
+
+    evision_res<cv::Mat *> * res;
+    if (!enif_get_resource(env, argv[0], evision_res<cv::Mat *>::type, (void **)&res)) {
+        return enif_make_badarg(env);
+    }
+
+    size_t bin_size = res->val->total() * res->val->elemSize();
+    ErlNifBinary bin;
+    if (!enif_alloc_binary(bin_size, &bin)) {
+        return evision::nif::error(env, "out of memory");
+    }
+    // wrap the binary in a Mat header of the same shape and type,
+    // so that copyTo writes into it directly instead of allocating a new Mat
+    ERRWRAP2({
+        cv::Mat continuous(res->val->dims, res->val->size.p, res->val->type(), bin.data);
+        res->val->copyTo(continuous);
+    }, env, error_flag, error_term);
+    if (error_flag) {
+        enif_release_binary(&bin);
+        return error_term;
+    }
+    return enif_make_binary(env, &bin);
+}
+
+// @evision c: mat_to_binary,evision_cv_mat_to_binary,1,normal
 // @evision nif: def mat_to_binary(_opts \\ []), do: :erlang.nif_error("Mat::to_binary not loaded")
 static ERL_NIF_TERM evision_cv_mat_to_binary(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -17,7 +49,14 @@ static ERL_NIF_TERM evision_cv_mat_to_binary(ErlNifEnv *env, int argc, const ERL
         // const char *keywords[] = {"img", NULL};
         // zero-copy to_binary
         evision_res<cv::Mat *> * res;
-        if( enif_get_resource(env, evision_get_kw(env, erl_terms, "img"), evision_res<cv::Mat *>::type, (void **)&res) ) {
+        ERL_NIF_TERM img = evision_get_kw(env, erl_terms, "img");
+        if( enif_get_resource(env, img, evision_res<cv::Mat *>::type, (void **)&res) ) {
+            if (!res->val->isContinuous()) {
+                // e.g., a view of a ROI, its data has to be copied,
+                // which is not cheap enough for a normal scheduler
+                ERL_NIF_TERM copy_argv[] = {img};
+                return enif_schedule_nif(env, "mat_to_binary", ERL_NIF_DIRTY_JOB_CPU_BOUND, evision_cv_mat_to_binary_copy, 1, copy_argv);
+            }
             size_t bin_size = res->val->total() * res->val->elemSize();
             ERL_NIF_TERM out_bin_term = enif_make_resource_binary(env, res, res->val->data, bin_size);
             return out_bin_term;
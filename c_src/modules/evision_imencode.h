@@ -0,0 +1,201 @@
+#ifdef HAVE_OPENCV_IMGCODECS
+
+#ifndef EVISION_OPENCV_IMENCODE_H
+#define EVISION_OPENCV_IMENCODE_H
+
+// @evision enable_with: imgcodecs
+
+#include <algorithm>
+#include <cctype>
+#include <erl_nif.h>
+#include "../nif_utils.hpp"
+
+// scratch buffers larger than this are released after use instead of being kept for the next frame
+#define EVISION_ENCODE_SCRATCH_MAX_BYTES (64 * 1024 * 1024)
+
+/// Encoder parameters resolved from `ext`, `quality` and `params`
+///
+/// The last resolved format is kept per thread, as frames served to clients
+/// are usually encoded with the same extension and quality over and over.
+struct evision_encode_format {
+    std::string ext;
+    int quality = -1;
+    std::vector<int> extra;
+    // `extra` followed by the quality parameter of the format, if any
+    std::vector<int> params;
+};
+
+/// Resolve the encoder parameters of `ext`, reusing the ones of the last call on this thread
+/// @return false if `quality` is not supported by the format
+static bool evision_encode_resolve_format(const std::string& ext, int quality, const std::vector<int>& extra, const evision_encode_format *& format) {
+    static thread_local evision_encode_format cached;
+    if (!cached.ext.empty() && cached.ext == ext && cached.quality == quality && cached.extra == extra) {
+        format = &cached;
+        return true;
+    }
+
+    std::string lower = ext;
+    std::transform(lower.begin(), lower.end(), lower.begin(), [](unsigned char c) { return std::tolower(c); });
+
+    std::vector<int> params = extra;
+    if (quality >= 0) {
+        if (lower == ".jpg" || lower == ".jpeg" || lower == ".jpe") {
+            params.push_back(cv::IMWRITE_JPEG_QUALITY);
+        } else if (lower == ".webp") {
+            params.push_back(cv::IMWRITE_WEBP_QUALITY);
+        } else {
+            return false;
+        }
+        params.push_back(quality);
+    }
+
+    cached.ext = ext;
+    cached.quality = quality;
+    cached.extra = extra;
+    cached.params = std::move(params);
+    format = &cached;
+    return true;
+}
+
+/// Encode `img` into a new binary
+///
+/// `cv::imencode` writes into a per thread scratch buffer whose capacity is kept between
+/// calls, so that the encoded data is only copied once, into a binary of the exact size.
+/// @return false if the binary cannot be allocated
+static bool evision_encode_to_binary(const cv::Mat& img, const evision_encode_format& format, ErlNifBinary& binary) {
+    static thread_local std::vector<uchar> scratch;
+    scratch.clear();
+    bool ok = cv::imencode(format.ext, img, scratch, format.params);
+    bool allocated = ok && enif_alloc_binary(scratch.size(), &binary);
+    if (allocated) {
+        memcpy(binary.data, scratch.data(), scratch.size());
+    }
+    if (scratch.capacity() > EVISION_ENCODE_SCRATCH_MAX_BYTES) {
+        std::vector<uchar>().swap(scratch);
+    }
+    if (!ok) {
+        CV_Error(cv::Error::StsError, "imencode failed");
+    }
+    return allocated;
+}
+
+/// Parse the common arguments of `imencode_binary` and `imencode_binary_batch`
+static bool evision_encode_parse_format(ErlNifEnv *env, std::map<std::string, ERL_NIF_TERM>& erl_terms, const evision_encode_format *& format, ERL_NIF_TERM& error_term) {
+    std::string ext;
+    int quality = -1;
+    std::vector<int> params;
+    ERL_NIF_TERM quality_term = evision_get_kw(env, erl_terms, "quality");
+    bool has_quality = !evision::nif::check_nil(env, quality_term);
+
+    if (!evision_to_safe(env, evision_get_kw(env, erl_terms, "ext"), ext, ArgInfo("ext", 0)) ||
+        !evision_to_safe(env, evision_get_kw(env, erl_terms, "params"), params, ArgInfo("params", 0, true)) ||
+        (has_quality && !evision_to_safe(env, quality_term, quality, ArgInfo("quality", 0)))) {
+        return false;
+    }
+    if (has_quality && quality < 0) {
+        error_term = evision::nif::error(env, "quality should not be negative");
+        return false;
+    }
+    if (!evision_encode_resolve_format(ext, quality, params, format)) {
+        error_term = evision::nif::error(env, "quality is only supported by .jpg, .jpeg, .jpe and .webp");
+        return false;
+    }
+    return true;
+}
+
+// @evision c: imencode_binary,evision_cv_imencode_binary,1
+// @evision nif: def imencode_binary(_opts \\ []), do: :erlang.nif_error("imencode_binary not loaded")
+static ERL_NIF_TERM evision_cv_imencode_binary(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        Mat img;
+        const evision_encode_format * format = nullptr;
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+            evision_encode_parse_format(env, erl_terms, format, error_term)) {
+            int error_flag = false;
+            ErlNifBinary binary;
+            bool allocated = false;
+            ERRWRAP2(allocated = evision_encode_to_binary(img, *format, binary), env, error_flag, error_term);
+            if (!error_flag) {
+                if (!allocated) return evision::nif::error(env, "out of memory");
+                return enif_make_binary(env, &binary);
+            }
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+// @evision c: imencode_binary_batch,evision_cv_imencode_binary_batch,1
+// @evision nif: def imencode_binary_batch(_opts \\ []), do: :erlang.nif_error("imencode_binary_batch not loaded")
+static ERL_NIF_TERM evision_cv_imencode_binary_batch(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        std::vector<Mat> imgs;
+        const evision_encode_format * format = nullptr;
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "imgs"), imgs, ArgInfo("imgs", 0)) &&
+            evision_encode_parse_format(env, erl_terms, format, error_term)) {
+            const int batch_size = static_cast<int>(imgs.size());
+            std::vector<ErlNifBinary> binaries(batch_size);
+            // not `std::vector<bool>`, items are set from different threads
+            std::vector<char> allocated(batch_size, false);
+            std::vector<std::string> batch_errors(batch_size);
+            int error_flag = false;
+
+            // each item reports its own error, so that no exception crosses the threads of `parallel_for_`
+            ERRWRAP2(cv::parallel_for_(cv::Range(0, batch_size), [&](const cv::Range& batch_range) {
+                for (int batch_index = batch_range.start; batch_index < batch_range.end; batch_index++) {
+                    try {
+                        if (evision_encode_to_binary(imgs[batch_index], *format, binaries[batch_index])) {
+                            allocated[batch_index] = true;
+                        } else {
+                            batch_errors[batch_index] = "out of memory";
+                        }
+                    } catch (const cv::Exception &e) {
+                        batch_errors[batch_index] = e.msg;
+                    } catch (const std::exception &e) {
+                        batch_errors[batch_index] = e.what();
+                    } catch (...) {
+                        batch_errors[batch_index] = "Unknown C++ exception from OpenCV code";
+                    }
+                }
+            }), env, error_flag, error_term);
+
+            std::string batch_error;
+            for (int batch_index = 0; batch_index < batch_size && batch_error.empty(); batch_index++) {
+                batch_error = batch_errors[batch_index];
+            }
+            if (error_flag || !batch_error.empty()) {
+                for (int batch_index = 0; batch_index < batch_size; batch_index++) {
+                    if (allocated[batch_index]) enif_release_binary(&binaries[batch_index]);
+                }
+                if (!error_flag) error_term = evision::nif::error(env, batch_error.c_str());
+                return error_term;
+            }
+
+            ERL_NIF_TERM ret = enif_make_list(env, 0);
+            for (int batch_index = batch_size - 1; batch_index >= 0; batch_index--) {
+                ret = enif_make_list_cell(env, enif_make_binary(env, &binaries[batch_index]), ret);
+            }
+            return ret;
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+#endif // EVISION_OPENCV_IMENCODE_H
+
+#endif // HAVE_OPENCV_IMGCODECS
@@ -15,26 +15,33 @@
 #include "evision_mat_utils.hpp"
 #include "evision_backend/backend.h"
 #include "evision_mat_api.h"
+#include "evision_mat_allocator.h"
+#include "evision_mat_memory.h"
 
 using namespace evision::nif;
 
-// @evision c: mat_empty,evision_cv_mat_empty,0
+// @evision c: mat_empty,evision_cv_mat_empty,0,normal
 // @evision nif: def mat_empty(), do: :erlang.nif_error("Mat::empty not loaded")
 static ERL_NIF_TERM evision_cv_mat_empty(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     evision_res<cv::Mat *> * res;
     if (alloc_resource(&res)) {
-        res->val = new cv::Mat();
+        res->val = evision_mat_header_new();
+        if (res->val == nullptr) {
+            enif_release_resource(res);
+            return evision::nif::error(env, "out of memory");
+        }
     } else {
         return evision::nif::error(env, "out of memory");
     }
 
+    evision_mat_res_account(env, res);
     ERL_NIF_TERM ret = enif_make_resource(env, res);
     enif_release_resource(res);
 
     return _evision_make_mat_resource_into_map(env, *res->val, ret);
 }
 
-// @evision c: mat_type,evision_cv_mat_type,1
+// @evision c: mat_type,evision_cv_mat_type,1,normal
 // @evision nif: def mat_type(_opts \\ []), do: :erlang.nif_error("Mat::type not loaded")
 static ERL_NIF_TERM evision_cv_mat_type(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -87,7 +94,7 @@ static ERL_NIF_TERM evision_cv_mat_as_type(ErlNifEnv *env, int argc, const ERL_N
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_shape,evision_cv_mat_shape,1
+// @evision c: mat_shape,evision_cv_mat_shape,1,normal
 // @evision nif: def mat_shape(_opts \\ []), do: :erlang.nif_error("Mat::shape not loaded")
 static ERL_NIF_TERM evision_cv_mat_shape(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -121,7 +128,10 @@ static ERL_NIF_TERM evision_cv_mat_roi(ErlNifEnv *env, int argc, const ERL_NIF_T
 
     int error_flag = false;
     Mat img;
-    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "mat"), img, ArgInfo("mat", 0)))
+    // when `view` is true, the returned Mat shares the data with `mat`
+    bool view = false;
+    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "mat"), img, ArgInfo("mat", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "view"), view, ArgInfo("view", 0, true)))
     {
         {
             // Mat operator()( const Rect& roi ) const;
@@ -131,6 +141,7 @@ static ERL_NIF_TERM evision_cv_mat_roi(ErlNifEnv *env, int argc, const ERL_NIF_T
                 Mat ret;
                 ERRWRAP2(ret = img(rect), env, error_flag, error_term);
                 if (!error_flag) {
+                    if (view) return evision_from_view(env, ret, evision_get_kw(env, erl_terms, "mat"));
                     return evision_from(env, ret.clone());
                 }
             }
@@ -146,6 +157,7 @@ static ERL_NIF_TERM evision_cv_mat_roi(ErlNifEnv *env, int argc, const ERL_NIF_T
                 Mat ret;
                 ERRWRAP2(ret = img(rowRange, colRange), env, error_flag, error_term);
                 if (!error_flag) {
+                    if (view) return evision_from_view(env, ret, evision_get_kw(env, erl_terms, "mat"));
                     return evision_from(env, ret.clone());
                 }
             }
@@ -157,6 +169,8 @@ static ERL_NIF_TERM evision_cv_mat_roi(ErlNifEnv *env, int argc, const ERL_NIF_T
             if (erl_terms.find("ranges") != erl_terms.end() &&
                 evision_to_safe(env, evision_get_kw(env, erl_terms, "ranges"), ranges, ArgInfo("ranges", 0))) {
                 Mat ret;
+                // whether `ret` shares the data with `img`
+                bool is_view = false;
                 int dims = img.size.dims();
                 if ((int)ranges.size() == dims + 1) {
                     int img_channels = img.channels();
@@ -185,7 +199,7 @@ static ERL_NIF_TERM evision_cv_mat_roi(ErlNifEnv *env, int argc, const ERL_NIF_T
 
                     if (last.start == 0 && last.end == img_channels) {
                         ERRWRAP2(ret = img(ranges), env, error_flag, error_term);
-                        ret = ret.clone();
+                        is_view = true;
                     } else {
                         // because we are taking channel in [start, end)
                         // if start == end, we would still have 1 channel to extract
@@ -208,11 +222,13 @@ static ERL_NIF_TERM evision_cv_mat_roi(ErlNifEnv *env, int argc, const ERL_NIF_T
                     }
                 } else {
                     ERRWRAP2(ret = img(ranges), env, error_flag, error_term);
-                    ret = ret.clone();
+                    is_view = true;
                 }
 
                 if (!error_flag) {
-                    return evision_from(env, ret);
+                    if (!is_view) return evision_from(env, ret);
+                    if (view) return evision_from_view(env, ret, evision_get_kw(env, erl_terms, "mat"));
+                    return evision_from(env, ret.clone());
                 }
             }
         }
@@ -266,7 +282,7 @@ static ERL_NIF_TERM evision_cv_mat_update_roi(ErlNifEnv *env, int argc, const ER
     if (erl_terms.find("mat") != erl_terms.end() &&
         erl_terms.find("with_mat") != erl_terms.end() &&
         erl_terms.find("ranges") != erl_terms.end() &&
-        evision_to_safe(env, evision_get_kw(env, erl_terms, "mat"), mat, ArgInfo("mat", 0)) &&
+        evision_to_safe(env, evision_get_kw(env, erl_terms, "mat"), mat, ArgInfo("mat", 1)) &&
         evision_to_safe(env, evision_get_kw(env, erl_terms, "with_mat"), with_mat, ArgInfo("with_mat", 0)) &&
         evision_to_safe(env, evision_get_kw(env, erl_terms, "ranges"), ranges, ArgInfo("ranges", 0)))
     {
@@ -314,8 +330,8 @@ static ERL_NIF_TERM evision_cv_mat_clone(ErlNifEnv *env, int argc, const ERL_NIF
 
         // const char *keywords[] = {"img", NULL};
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
-            // no need to do clone here as `evision_to_safe` will copy the data to img.
-            return evision_from(env, img);
+            // `img` is borrowed from the input resource by `evision_to_safe`
+            return evision_from(env, img.clone());
         }
     }
 
@@ -457,7 +473,7 @@ static ERL_NIF_TERM evision_cv_mat_full(ErlNifEnv *env, int argc, const ERL_NIF_
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_at, evision_cv_mat_at, 1
+// @evision c: mat_at, evision_cv_mat_at, 1,normal
 // @evision nif: def mat_at(_opts \\ []), do: :erlang.nif_error("Mat::at not loaded")
 static ERL_NIF_TERM evision_cv_mat_at(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -476,38 +492,51 @@ static ERL_NIF_TERM evision_cv_mat_at(ErlNifEnv *env, int argc, const ERL_NIF_TE
             int type = img.type();
             uint8_t depth = type & CV_MAT_DEPTH_MASK;
 
+            // `pos` is the index of the element as if `img` were continuous
+            const uint8_t * elem = img.data + pos * img.elemSize1();
+            if (!img.isContinuous()) {
+                size_t channels = img.channels();
+                size_t index = pos / channels;
+                size_t offset = (pos % channels) * img.elemSize1();
+                for (int d = img.dims - 1; d >= 0; d--) {
+                    offset += (index % img.size[d]) * img.step[d];
+                    index /= img.size[d];
+                }
+                elem = img.data + offset;
+            }
+
             int i32;
             double f64;
             type = -1;
 
             switch ( depth ) {
                 case CV_8U: {
-                    i32 = ((uint8_t *)img.data)[pos]; type = 0;
+                    i32 = *(uint8_t *)elem; type = 0;
                     break;
                 }
                 case CV_16U: {
-                    i32 = ((uint16_t *)img.data)[pos]; type = 0;
+                    i32 = *(uint16_t *)elem; type = 0;
                     break;
                 }
                 case CV_8S: {
-                    i32 = ((int8_t *)img.data)[pos]; type = 0;
+                    i32 = *(int8_t *)elem; type = 0;
                     break;
                 }
                 case CV_16S: {
-                    i32 = ((int16_t *)img.data)[pos]; type = 0;
+                    i32 = *(int16_t *)elem; type = 0;
                     break;
                 }
                 case CV_32S: {
-                    i32 = ((int32_t *)img.data)[pos]; type = 0;
+                    i32 = *(int32_t *)elem; type = 0;
                     break;
                 }
 
                 case CV_32F: {
-                    f64 = ((float *)img.data)[pos]; type = 1;
+                    f64 = *(float *)elem; type = 1;
                     break;
                 }
                 case CV_64F: {
-                    f64 = ((double *)img.data)[pos]; type = 1;
+                    f64 = *(double *)elem; type = 1;
                     break;
                 }
             }
@@ -543,7 +572,7 @@ static ERL_NIF_TERM evision_cv_mat_set_to(ErlNifEnv *env, int argc, const ERL_NI
         double value;
         Mat mask;
 
-        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 1)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "value"), value, ArgInfo("value", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "mask"), mask, ArgInfo("mask", 0))) {
             img.setTo(value, mask);
@@ -578,7 +607,7 @@ static ERL_NIF_TERM evision_cv_mat_dot(ErlNifEnv *env, int argc, const ERL_NIF_T
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_channels, evision_cv_mat_channels, 1
+// @evision c: mat_channels, evision_cv_mat_channels, 1,normal
 // @evision nif: def mat_channels(_opts \\ []), do: :erlang.nif_error("Mat::channels not loaded")
 static ERL_NIF_TERM evision_cv_mat_channels(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -600,7 +629,7 @@ static ERL_NIF_TERM evision_cv_mat_channels(ErlNifEnv *env, int argc, const ERL_
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_depth, evision_cv_mat_depth, 1
+// @evision c: mat_depth, evision_cv_mat_depth, 1,normal
 // @evision nif: def mat_depth(_opts \\ []), do: :erlang.nif_error("Mat::depth not loaded")
 static ERL_NIF_TERM evision_cv_mat_depth(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -622,7 +651,7 @@ static ERL_NIF_TERM evision_cv_mat_depth(ErlNifEnv *env, int argc, const ERL_NIF
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_isSubmatrix, evision_cv_mat_isSubmatrix, 1
+// @evision c: mat_isSubmatrix, evision_cv_mat_isSubmatrix, 1,normal
 // @evision nif: def mat_isSubmatrix(_opts \\ []), do: :erlang.nif_error("Mat::isSubmatrix not loaded")
 static ERL_NIF_TERM evision_cv_mat_isSubmatrix(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -637,9 +666,9 @@ static ERL_NIF_TERM evision_cv_mat_isSubmatrix(ErlNifEnv *env, int argc, const E
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
             bool isSubmatrix = img.isSubmatrix();
             if (isSubmatrix) {
-                return evision::nif::atom(env, "true");
+                return evision::nif::atom_true;
             } else {
-                return evision::nif::atom(env, "false");
+                return evision::nif::atom_false;
             }
         }
     }
@@ -648,7 +677,7 @@ static ERL_NIF_TERM evision_cv_mat_isSubmatrix(ErlNifEnv *env, int argc, const E
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_isContinuous, evision_cv_mat_isContinuous, 1
+// @evision c: mat_isContinuous, evision_cv_mat_isContinuous, 1,normal
 // @evision nif: def mat_isContinuous(_opts \\ []), do: :erlang.nif_error("Mat::isContinuous not loaded")
 static ERL_NIF_TERM evision_cv_mat_isContinuous(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -663,9 +692,9 @@ static ERL_NIF_TERM evision_cv_mat_isContinuous(ErlNifEnv *env, int argc, const
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0))) {
             bool isContinuous = img.isContinuous();
             if (isContinuous) {
-                return evision::nif::atom(env, "true");
+                return evision::nif::atom_true;
             } else {
-                return evision::nif::atom(env, "false");
+                return evision::nif::atom_false;
             }
         }
     }
@@ -674,7 +703,7 @@ static ERL_NIF_TERM evision_cv_mat_isContinuous(ErlNifEnv *env, int argc, const
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_total, evision_cv_mat_total, 1
+// @evision c: mat_total, evision_cv_mat_total, 1,normal
 // @evision nif: def mat_total(_opts \\ []), do: :erlang.nif_error("Mat::total not loaded")
 static ERL_NIF_TERM evision_cv_mat_total(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -706,7 +735,7 @@ static ERL_NIF_TERM evision_cv_mat_total(ErlNifEnv *env, int argc, const ERL_NIF
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_elemSize, evision_cv_mat_elemSize, 1
+// @evision c: mat_elemSize, evision_cv_mat_elemSize, 1,normal
 // @evision nif: def mat_elemSize(_opts \\ []), do: :erlang.nif_error("Mat::elemSize not loaded")
 static ERL_NIF_TERM evision_cv_mat_elemSize(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -727,7 +756,7 @@ static ERL_NIF_TERM evision_cv_mat_elemSize(ErlNifEnv *env, int argc, const ERL_
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_elemSize1, evision_cv_mat_elemSize1, 1
+// @evision c: mat_elemSize1, evision_cv_mat_elemSize1, 1,normal
 // @evision nif: def mat_elemSize1(_opts \\ []), do: :erlang.nif_error("Mat::elemSize1 not loaded")
 static ERL_NIF_TERM evision_cv_mat_elemSize1(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -748,7 +777,7 @@ static ERL_NIF_TERM evision_cv_mat_elemSize1(ErlNifEnv *env, int argc, const ERL
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_raw_type, evision_cv_mat_raw_type, 1
+// @evision c: mat_raw_type, evision_cv_mat_raw_type, 1,normal
 // @evision nif: def mat_raw_type(_opts \\ []), do: :erlang.nif_error("Mat::raw_type not loaded")
 static ERL_NIF_TERM evision_cv_mat_raw_type(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -769,7 +798,7 @@ static ERL_NIF_TERM evision_cv_mat_raw_type(ErlNifEnv *env, int argc, const ERL_
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_dims, evision_cv_mat_dims, 1
+// @evision c: mat_dims, evision_cv_mat_dims, 1,normal
 // @evision nif: def mat_dims(_opts \\ []), do: :erlang.nif_error("Mat::dims not loaded")
 static ERL_NIF_TERM evision_cv_mat_dims(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -790,7 +819,7 @@ static ERL_NIF_TERM evision_cv_mat_dims(ErlNifEnv *env, int argc, const ERL_NIF_
     else return enif_make_badarg(env);
 }
 
-// @evision c: mat_size, evision_cv_mat_size, 1
+// @evision c: mat_size, evision_cv_mat_size, 1,normal
 // @evision nif: def mat_size(_opts \\ []), do: :erlang.nif_error("Mat::size not loaded")
 static ERL_NIF_TERM evision_cv_mat_size(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
     using namespace cv;
@@ -829,8 +858,18 @@ static ERL_NIF_TERM evision_cv_mat_as_shape(ErlNifEnv *env, int argc, const ERL_
 
         if (evision_to_safe(env, evision_get_kw(env, erl_terms, "img"), img, ArgInfo("img", 0)) &&
             evision_to_safe(env, evision_get_kw(env, erl_terms, "as_shape"), as_shape, ArgInfo("as_shape", 0))) {
-            Mat ret = Mat((int)as_shape.size(), as_shape.data(), img.depth(), img.data);
-            return evision_from(env, ret.clone());
+            // a continuous Mat only needs a new header that shares the same data (and refcount),
+            // otherwise the data is copied into a continuous Mat first
+            Mat ret;
+            int error_flag = false;
+            if (img.isContinuous()) {
+                ERRWRAP2(ret = img.reshape(1, as_shape), env, error_flag, error_term);
+            } else {
+                ERRWRAP2(ret = img.clone().reshape(1, as_shape), env, error_flag, error_term);
+            }
+            if (!error_flag) {
+                return evision_from(env, ret);
+            }
         }
     }
 
@@ -854,6 +893,11 @@ static ERL_NIF_TERM evision_cv_mat_last_dim_as_channel(ErlNifEnv *env, int argc,
             if ((src.type() == CV_8S || src.type() == CV_8U || src.type() == CV_16F \
                 || src.type() == CV_16S || src.type() == CV_16U || src.type() == CV_32S \
                 || src.type() == CV_32F || src.type() == CV_64F)) {
+                // the data of src must be continuous
+                if (!src.isContinuous()) {
+                    src = src.clone();
+                }
+
                 int ndims = src.size.dims();
                 if (ndims <= 1) {
                     return evision::nif::error(env, "image only has 1 dimension");
@@ -876,4 +920,89 @@ static ERL_NIF_TERM evision_cv_mat_last_dim_as_channel(ErlNifEnv *env, int argc,
     else return enif_make_badarg(env);
 }
 
+// @evision c: mat_set_allocator, evision_cv_mat_set_allocator, 1, normal
+// @evision nif: def mat_set_allocator(_opts \\ []), do: :erlang.nif_error("Mat::set_allocator not loaded")
+static ERL_NIF_TERM evision_cv_mat_set_allocator(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        std::string allocator;
+        uint64_t max_cached_bytes = EVISION_POOL_DEFAULT_MAX_CACHED_BYTES;
+
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "allocator"), allocator, ArgInfo("allocator", 0)) &&
+            evision_to_safe(env, evision_get_kw(env, erl_terms, "max_cached_bytes"), max_cached_bytes, ArgInfo("max_cached_bytes", 0, true))) {
+            if (allocator == "pooled") {
+                evision_pool_allocator()->set_max_cached_bytes((size_t)max_cached_bytes);
+                Mat::setDefaultAllocator(evision_pool_allocator());
+            } else if (allocator == "default") {
+                // buffers still in use go back to the pool when they are freed,
+                // the pool then frees them as it no longer caches anything
+                Mat::setDefaultAllocator(nullptr);
+                evision_pool_allocator()->trim();
+            } else {
+                return evision::nif::error(env, "set_allocator failed: invalid allocator. Valid values are :pooled and :default");
+            }
+            return evision::nif::atom_ok;
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+// @evision c: mat_memory_stats, evision_cv_mat_memory_stats, 0, normal
+// @evision nif: def mat_memory_stats(), do: :erlang.nif_error("Mat::memory_stats not loaded")
+static ERL_NIF_TERM evision_cv_mat_memory_stats(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    size_t high_water = evision_mat_high_water.load();
+    ERL_NIF_TERM keys[] = {
+        enif_make_atom(env, "live_bytes"),
+        enif_make_atom(env, "live_mats"),
+        enif_make_atom(env, "peak_bytes"),
+        enif_make_atom(env, "high_water_mark"),
+        enif_make_atom(env, "pool_cached_bytes"),
+    };
+    ERL_NIF_TERM values[] = {
+        enif_make_uint64(env, evision_mat_live_bytes.load()),
+        enif_make_uint64(env, evision_mat_live_count.load()),
+        enif_make_uint64(env, evision_mat_peak_bytes.load()),
+        high_water == 0 ? evision::nif::atom_nil : enif_make_uint64(env, high_water),
+        enif_make_uint64(env, evision_pool_allocator()->get_cached_bytes()),
+    };
+
+    ERL_NIF_TERM ret;
+    enif_make_map_from_arrays(env, keys, values, sizeof(keys) / sizeof(keys[0]), &ret);
+    return ret;
+}
+
+// @evision c: mat_set_memory_high_water, evision_cv_mat_set_memory_high_water, 1, normal
+// @evision nif: def mat_set_memory_high_water(_opts \\ []), do: :erlang.nif_error("Mat::set_memory_high_water not loaded")
+static ERL_NIF_TERM evision_cv_mat_set_memory_high_water(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        uint64_t bytes = 0;
+        ErlNifPid pid;
+        enif_self(env, &pid);
+
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "bytes"), bytes, ArgInfo("bytes", 0, true))) {
+            if (bytes != 0 && !enif_get_local_pid(env, evision_get_kw(env, erl_terms, "pid"), &pid)) {
+                return evision::nif::error(env, "set_memory_high_water failed: expecting a local pid to notify");
+            }
+            evision_mat_memory_set_high_water((size_t)bytes, pid);
+            return evision::nif::atom_ok;
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
 #endif // EVISION_OPENCV_MAT_H
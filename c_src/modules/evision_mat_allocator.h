@@ -0,0 +1,203 @@
+#ifndef EVISION_MAT_ALLOCATOR_H
+#define EVISION_MAT_ALLOCATOR_H
+
+#include <map>
+#include <mutex>
+#include <new>
+#include <utility>
+#include <vector>
+#include <erl_nif.h>
+#include <opencv2/core.hpp>
+
+// number of `cv::Mat` headers allocated at a time by `evision_mat_header_new`
+#define EVISION_MAT_HEADER_SLAB_SIZE 256
+// buffers smaller than this are not pooled, the BEAM's allocators handle them well enough
+#define EVISION_POOL_MIN_BYTES 4096
+// buffers larger than this are not pooled
+#define EVISION_POOL_MAX_BYTES ((size_t)1 << 32)
+// default upper bound of the total size of idle buffers kept by the pool
+#define EVISION_POOL_DEFAULT_MAX_CACHED_BYTES ((size_t)256 << 20)
+
+// `cv::Mat` headers of Mat resources are allocated from slabs of
+// `EVISION_MAT_HEADER_SLAB_SIZE` headers and recycled through a free list.
+// slabs are never returned to the system, so the memory they hold is bounded
+// by the peak number of live Mat resources.
+union evision_mat_header_slot {
+    evision_mat_header_slot * next;
+    alignas(cv::Mat) unsigned char mat[sizeof(cv::Mat)];
+};
+
+static std::mutex evision_mat_header_mutex;
+static evision_mat_header_slot * evision_mat_header_free_list = nullptr;
+
+/// Construct a `cv::Mat` in a recycled header slot
+/// @return nullptr if out of memory
+template <typename... Args>
+static cv::Mat * evision_mat_header_new(Args&&... args) {
+    evision_mat_header_slot * slot = nullptr;
+    {
+        std::lock_guard<std::mutex> lock(evision_mat_header_mutex);
+        if (evision_mat_header_free_list == nullptr) {
+            evision_mat_header_slot * slab = (evision_mat_header_slot *)enif_alloc(sizeof(evision_mat_header_slot) * EVISION_MAT_HEADER_SLAB_SIZE);
+            if (slab == nullptr) return nullptr;
+            for (size_t i = 0; i < EVISION_MAT_HEADER_SLAB_SIZE - 1; i++) {
+                slab[i].next = &slab[i + 1];
+            }
+            slab[EVISION_MAT_HEADER_SLAB_SIZE - 1].next = nullptr;
+            evision_mat_header_free_list = slab;
+        }
+        slot = evision_mat_header_free_list;
+        evision_mat_header_free_list = slot->next;
+    }
+    return new (slot->mat) cv::Mat(std::forward<Args>(args)...);
+}
+
+/// Destroy a `cv::Mat` created by `evision_mat_header_new` and recycle its slot
+static void evision_mat_header_delete(cv::Mat * mat) {
+    if (mat == nullptr) return;
+    mat->~Mat();
+
+    evision_mat_header_slot * slot = (evision_mat_header_slot *)(void *)mat;
+    std::lock_guard<std::mutex> lock(evision_mat_header_mutex);
+    slot->next = evision_mat_header_free_list;
+    evision_mat_header_free_list = slot;
+}
+
+/// A `cv::MatAllocator` that allocates with `enif_alloc` and keeps freed buffers
+/// in per size class free lists for reuse.
+///
+/// Size classes are spaced by a quarter of a power of two, so that a buffer is at
+/// most 25% larger than requested, and repeated allocations of the same size,
+/// e.g., frames of a video, are served from the pool.
+class EvisionPoolAllocator : public cv::MatAllocator {
+public:
+    cv::UMatData * allocate(int dims, const int * sizes, int type, void * data0, size_t * step,
+                            cv::AccessFlag, cv::UMatUsageFlags) const CV_OVERRIDE {
+        size_t total = CV_ELEM_SIZE(type);
+        for (int i = dims - 1; i >= 0; i--) {
+            if (step) {
+                if (data0 && step[i] != CV_AUTOSTEP) {
+                    CV_Assert(total <= step[i]);
+                    total = step[i];
+                } else {
+                    step[i] = total;
+                }
+            }
+            total *= sizes[i];
+        }
+
+        cv::UMatData * u = new cv::UMatData(this);
+        u->size = total;
+        if (data0) {
+            u->data = u->origdata = (uchar *)data0;
+            u->flags |= cv::UMatData::USER_ALLOCATED;
+        } else {
+            void * raw = acquire(total);
+            if (raw == nullptr) {
+                delete u;
+                CV_Error_(cv::Error::StsNoMem, ("Failed to allocate %zu bytes", total));
+            }
+            u->origdata = (uchar *)raw;
+            u->data = cv::alignPtr((uchar *)raw, CV_MALLOC_ALIGN);
+        }
+        return u;
+    }
+
+    bool allocate(cv::UMatData * u, cv::AccessFlag, cv::UMatUsageFlags) const CV_OVERRIDE {
+        return u != nullptr;
+    }
+
+    void deallocate(cv::UMatData * u) const CV_OVERRIDE {
+        if (!u) return;
+        CV_Assert(u->urefcount == 0);
+        CV_Assert(u->refcount == 0);
+        if (!(u->flags & cv::UMatData::USER_ALLOCATED)) {
+            release(u->origdata, u->size);
+            u->origdata = nullptr;
+        }
+        delete u;
+    }
+
+    /// Set the upper bound of the total size of idle buffers, evicting buffers above it
+    void set_max_cached_bytes(size_t bytes) {
+        std::lock_guard<std::mutex> lock(mutex);
+        max_cached_bytes = bytes;
+        evict();
+    }
+
+    /// Free all idle buffers
+    void trim() {
+        set_max_cached_bytes(0);
+    }
+
+    /// Total size of idle buffers kept for reuse
+    size_t get_cached_bytes() const {
+        std::lock_guard<std::mutex> lock(mutex);
+        return cached_bytes;
+    }
+
+private:
+    mutable std::mutex mutex;
+    // idle buffers, keyed by size class
+    mutable std::map<size_t, std::vector<void *>> free_lists;
+    mutable size_t cached_bytes = 0;
+    size_t max_cached_bytes = EVISION_POOL_DEFAULT_MAX_CACHED_BYTES;
+
+    /// Size of the class that `size` bytes fall into, or 0 if such buffers are not pooled
+    static size_t size_class(size_t size) {
+        if (size < EVISION_POOL_MIN_BYTES || size > EVISION_POOL_MAX_BYTES) return 0;
+        size_t quarter = EVISION_POOL_MIN_BYTES / 4;
+        while ((quarter << 3) <= size) quarter <<= 1;
+        return (size + quarter - 1) / quarter * quarter;
+    }
+
+    void * acquire(size_t size) const {
+        size_t cls = size_class(size);
+        if (cls != 0) {
+            std::lock_guard<std::mutex> lock(mutex);
+            auto it = free_lists.find(cls);
+            if (it != free_lists.end() && !it->second.empty()) {
+                void * raw = it->second.back();
+                it->second.pop_back();
+                cached_bytes -= cls;
+                return raw;
+            }
+        } else {
+            cls = size;
+        }
+        return enif_alloc(cls + CV_MALLOC_ALIGN);
+    }
+
+    void release(void * raw, size_t size) const {
+        size_t cls = size_class(size);
+        if (cls != 0) {
+            std::lock_guard<std::mutex> lock(mutex);
+            if (cached_bytes + cls <= max_cached_bytes) {
+                free_lists[cls].push_back(raw);
+                cached_bytes += cls;
+                return;
+            }
+        }
+        enif_free(raw);
+    }
+
+    /// Free idle buffers, largest first, until they fit in `max_cached_bytes`
+    void evict() const {
+        for (auto it = free_lists.rbegin(); it != free_lists.rend() && cached_bytes > max_cached_bytes; ++it) {
+            while (!it->second.empty() && cached_bytes > max_cached_bytes) {
+                enif_free(it->second.back());
+                it->second.pop_back();
+                cached_bytes -= it->first;
+            }
+        }
+    }
+};
+
+/// The pool allocator, it lives as long as the NIF library because buffers
+/// allocated by it may outlive switching back to OpenCV's allocator
+static EvisionPoolAllocator * evision_pool_allocator() {
+    static EvisionPoolAllocator * allocator = new EvisionPoolAllocator();
+    return allocator;
+}
+
+#endif // EVISION_MAT_ALLOCATOR_H
@@ -3,20 +3,57 @@
 
 #include <erl_nif.h>
 
+// keys of the maps of `Evision.Mat`, in the order used by `_evision_make_mat_resource_into_map`
+enum {
+    EVISION_MAT_KEY_CHANNELS,
+    EVISION_MAT_KEY_DIMS,
+    EVISION_MAT_KEY_TYPE,
+    EVISION_MAT_KEY_RAW_TYPE,
+    EVISION_MAT_KEY_SHAPE,
+    EVISION_MAT_KEY_REF,
+    EVISION_MAT_KEY_CLASS,
+    EVISION_MAT_NUM_KEYS
+};
+
+// atoms are shared by all environments, so they are interned once in `on_load`
+static ERL_NIF_TERM evision_mat_keys[EVISION_MAT_NUM_KEYS];
+static ERL_NIF_TERM evision_mat_class_name;
+// `t` and `bits` of the `{t, bits}` type of each CV depth
+static ERL_NIF_TERM evision_mat_type_atoms[CV_DEPTH_MAX];
+static unsigned evision_mat_type_bits[CV_DEPTH_MAX];
+static ERL_NIF_TERM evision_mat_user_type_atom;
+
+static int evision_init_mat_atoms(ErlNifEnv *env) {
+    static const char * key_names[EVISION_MAT_NUM_KEYS] = {
+        "channels", "dims", "type", "raw_type", "shape", "ref", "class"
+    };
+    for (int i = 0; i < EVISION_MAT_NUM_KEYS; i++) {
+        evision_mat_keys[i] = enif_make_atom(env, key_names[i]);
+    }
+    evision_mat_class_name = enif_make_atom(env, "Elixir.Evision.Mat");
+    evision_mat_user_type_atom = enif_make_atom(env, "user");
+
+    ERL_NIF_TERM u = enif_make_atom(env, "u");
+    ERL_NIF_TERM s = enif_make_atom(env, "s");
+    ERL_NIF_TERM f = enif_make_atom(env, "f");
+    for (int depth = 0; depth < CV_DEPTH_MAX; depth++) {
+        evision_mat_type_atoms[depth] = evision_mat_user_type_atom;
+        evision_mat_type_bits[depth] = depth;
+    }
+    evision_mat_type_atoms[CV_8U] = u;  evision_mat_type_bits[CV_8U] = 8;
+    evision_mat_type_atoms[CV_8S] = s;  evision_mat_type_bits[CV_8S] = 8;
+    evision_mat_type_atoms[CV_16U] = u; evision_mat_type_bits[CV_16U] = 16;
+    evision_mat_type_atoms[CV_16S] = s; evision_mat_type_bits[CV_16S] = 16;
+    evision_mat_type_atoms[CV_32S] = s; evision_mat_type_bits[CV_32S] = 32;
+    evision_mat_type_atoms[CV_32F] = f; evision_mat_type_bits[CV_32F] = 32;
+    evision_mat_type_atoms[CV_64F] = f; evision_mat_type_bits[CV_64F] = 64;
+    evision_mat_type_atoms[CV_16F] = f; evision_mat_type_bits[CV_16F] = 16;
+    return true;
+}
+
 static ERL_NIF_TERM __evision_get_mat_type(ErlNifEnv *env, int type) {
     uint8_t depth = type & CV_MAT_DEPTH_MASK;
-
-    switch ( depth ) {
-        case CV_8U:  return enif_make_tuple2(env, evision::nif::atom(env, "u"), enif_make_uint64(env, 8));
-        case CV_8S:  return enif_make_tuple2(env, evision::nif::atom(env, "s"), enif_make_uint64(env, 8));
-        case CV_16U: return enif_make_tuple2(env, evision::nif::atom(env, "u"), enif_make_uint64(env, 16));
-        case CV_16S: return enif_make_tuple2(env, evision::nif::atom(env, "s"), enif_make_uint64(env, 16));
-        case CV_32S: return enif_make_tuple2(env, evision::nif::atom(env, "s"), enif_make_uint64(env, 32));
-        case CV_32F: return enif_make_tuple2(env, evision::nif::atom(env, "f"), enif_make_uint64(env, 32));
-        case CV_64F: return enif_make_tuple2(env, evision::nif::atom(env, "f"), enif_make_uint64(env, 64));
-        case CV_16F: return enif_make_tuple2(env, evision::nif::atom(env, "f"), enif_make_uint64(env, 16));
-        default:     return enif_make_tuple2(env, evision::nif::atom(env, "user"), enif_make_uint64(env, depth));
-    }
+    return enif_make_tuple2(env, evision_mat_type_atoms[depth], enif_make_uint(env, evision_mat_type_bits[depth]));
 }
 
 static ERL_NIF_TERM _evision_get_mat_type(ErlNifEnv *env, const cv::Mat& img) {
@@ -28,63 +65,30 @@ static ERL_NIF_TERM _evision_get_mat_shape(ErlNifEnv *env, const cv::Mat& img) {
     cv::MatSize size = img.size;
     int channels = img.channels();
     int dims = size.dims();
-    int include_channels = 0;
-    if (!(img.type() == CV_8S || img.type() == CV_8U || img.type() == CV_16F \
-        || img.type() == CV_16S || img.type() == CV_16U || img.type() == CV_32S \
-        || img.type() == CV_32F || img.type() == CV_64F)) {
-        dims += 1;
-        include_channels = 1;
-    }
-    ERL_NIF_TERM* shape = (ERL_NIF_TERM *)enif_alloc(sizeof(ERL_NIF_TERM) * dims);
+    ERL_NIF_TERM shape[CV_MAX_DIM + 1];
 
-    for (int i = 0; i < size.dims(); i++) {
+    for (int i = 0; i < dims; i++) {
         shape[i] = enif_make_int(env, size[i]);
     }
-    if (include_channels) {
-        shape[dims - 1] = enif_make_int(env, channels);
+    // channels are the last dimension of multi-channel matrices
+    if (channels > 1) {
+        shape[dims++] = enif_make_int(env, channels);
     }
-    ERL_NIF_TERM ret = enif_make_tuple_from_array(env, shape, dims);
-    enif_free(shape);
-    return ret;
+    return enif_make_tuple_from_array(env, shape, dims);
 }
 
 static ERL_NIF_TERM _evision_make_mat_resource_into_map(ErlNifEnv *env, const cv::Mat& m, ERL_NIF_TERM res_term) {
-    const size_t num_items = 7;
-    size_t item_index = 0;
-
-    ERL_NIF_TERM keys[num_items];
-    ERL_NIF_TERM values[num_items];
-
-    keys[item_index] = evision::nif::atom(env, "channels");
-    values[item_index] = enif_make_int(env, m.channels());
-    item_index++;
-
-    keys[item_index] = evision::nif::atom(env, "dims");
-    values[item_index] = enif_make_int(env, m.dims);
-    item_index++;
-
-    keys[item_index] = evision::nif::atom(env, "type");
-    values[item_index] = _evision_get_mat_type(env, m);
-    item_index++;
-
-    keys[item_index] = evision::nif::atom(env, "raw_type");
-    values[item_index] = enif_make_int(env, m.type());
-    item_index++;
-
-    keys[item_index] = evision::nif::atom(env, "shape");
-    values[item_index] = _evision_get_mat_shape(env, m);
-    item_index++;
-
-    keys[item_index] = evision::nif::atom(env, "ref");
-    values[item_index] = res_term;
-    item_index++;
-
-    keys[item_index] = evision::nif::atom(env, "class");
-    values[item_index] = evision::nif::atom(env, "Elixir.Evision.Mat");
-    item_index++;
+    ERL_NIF_TERM values[EVISION_MAT_NUM_KEYS];
+    values[EVISION_MAT_KEY_CHANNELS] = enif_make_int(env, m.channels());
+    values[EVISION_MAT_KEY_DIMS] = enif_make_int(env, m.dims);
+    values[EVISION_MAT_KEY_TYPE] = _evision_get_mat_type(env, m);
+    values[EVISION_MAT_KEY_RAW_TYPE] = enif_make_int(env, m.type());
+    values[EVISION_MAT_KEY_SHAPE] = _evision_get_mat_shape(env, m);
+    values[EVISION_MAT_KEY_REF] = res_term;
+    values[EVISION_MAT_KEY_CLASS] = evision_mat_class_name;
 
     ERL_NIF_TERM map;
-    if (enif_make_map_from_arrays(env, keys, values, item_index, &map)) {
+    if (enif_make_map_from_arrays(env, evision_mat_keys, values, EVISION_MAT_NUM_KEYS, &map)) {
         return map;
     } else {
         return evision::nif::atom(env, "error when making map from arrays");
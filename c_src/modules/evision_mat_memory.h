@@ -0,0 +1,73 @@
+#ifndef EVISION_MAT_MEMORY_H
+#define EVISION_MAT_MEMORY_H
+
+#include <atomic>
+#include <mutex>
+#include <erl_nif.h>
+
+// the VM only sees the size of the resource struct of an `Evision.Mat`, so the
+// bytes of data referenced by live Mat resources, i.e., the sum of their
+// `total() * elemSize()`, are accounted here. matrices that share data, e.g.,
+// ROIs, are counted once per resource.
+static std::atomic<size_t> evision_mat_live_bytes{0};
+static std::atomic<size_t> evision_mat_live_count{0};
+static std::atomic<size_t> evision_mat_peak_bytes{0};
+
+// a message is sent to `evision_mat_high_water_pid` once live bytes go above
+// the high-water mark, and once more only after they went back below it.
+// 0 disables the high-water mark
+static std::atomic<size_t> evision_mat_high_water{0};
+static std::atomic<bool> evision_mat_high_water_signalled{false};
+static std::mutex evision_mat_high_water_mutex;
+static ErlNifPid evision_mat_high_water_pid;
+
+/// Account `bytes` of a new Mat resource
+/// @param env environment of the calling NIF, or nullptr
+static void evision_mat_memory_acquire(ErlNifEnv *env, size_t bytes) {
+    size_t live = evision_mat_live_bytes.fetch_add(bytes) + bytes;
+    evision_mat_live_count++;
+
+    size_t peak = evision_mat_peak_bytes.load();
+    while (live > peak && !evision_mat_peak_bytes.compare_exchange_weak(peak, live)) {}
+
+    size_t high_water = evision_mat_high_water.load();
+    if (high_water == 0 || live <= high_water || evision_mat_high_water_signalled.exchange(true)) {
+        return;
+    }
+
+    ErlNifPid pid;
+    {
+        std::lock_guard<std::mutex> lock(evision_mat_high_water_mutex);
+        pid = evision_mat_high_water_pid;
+    }
+    ErlNifEnv * msg_env = enif_alloc_env();
+    ERL_NIF_TERM msg = enif_make_tuple2(msg_env,
+        enif_make_atom(msg_env, "evision_memory_high_water"),
+        enif_make_uint64(msg_env, live));
+    // `caller_env` has to be NULL on threads not created by ERTS
+    enif_send(enif_thread_type() == ERL_NIF_THR_UNDEFINED ? nullptr : env, &pid, msg_env, msg);
+    enif_free_env(msg_env);
+}
+
+/// Release `bytes` of a Mat resource being destructed
+static void evision_mat_memory_release(size_t bytes) {
+    size_t live = evision_mat_live_bytes.fetch_sub(bytes) - bytes;
+    evision_mat_live_count--;
+
+    size_t high_water = evision_mat_high_water.load();
+    if (high_water == 0 || live <= high_water) {
+        evision_mat_high_water_signalled.store(false);
+    }
+}
+
+/// Set the high-water mark, 0 disables it
+static void evision_mat_memory_set_high_water(size_t bytes, const ErlNifPid& pid) {
+    {
+        std::lock_guard<std::mutex> lock(evision_mat_high_water_mutex);
+        evision_mat_high_water_pid = pid;
+    }
+    evision_mat_high_water_signalled.store(false);
+    evision_mat_high_water.store(bytes);
+}
+
+#endif // EVISION_MAT_MEMORY_H
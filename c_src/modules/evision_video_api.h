@@ -24,18 +24,18 @@ ERL_NIF_TERM evision_from_as_map(ErlNifEnv *env, const cv::Ptr<cv::VideoCapture>
     item_index++;
 
     keys[item_index] = evision::nif::atom(env, "isOpened");
-    values[item_index] = evision::nif::atom(env, cap->isOpened() ? "true" : "false");
+    values[item_index] = cap->isOpened() ? evision::nif::atom_true : evision::nif::atom_false;
     item_index++;
 
     keys[item_index] = evision::nif::atom(env, "frame_count");
     values[item_index] = enif_make_double(env, cap->get(cv::CAP_PROP_FRAME_COUNT));
     item_index++;
 
-    keys[item_index] = evision::nif::atom(env, "ref");
+    keys[item_index] = evision::nif::atom_ref;
     values[item_index] = res_term;
     item_index++;
 
-    keys[item_index] = evision::nif::atom(env, "class");
+    keys[item_index] = evision::nif::atom_class;
     values[item_index] = evision::nif::atom(env, class_name);
     item_index++;
 
@@ -5,6 +5,12 @@
 #ifndef EVISION_VIDEOCAPTURE_H
 #define EVISION_VIDEOCAPTURE_H
 
+#include <condition_variable>
+#include <memory>
+#include <mutex>
+#include <system_error>
+#include <thread>
+
 // @evision c: videoCapture_waitAny,evision_cv_videoCapture_waitAny,1
 // @evision nif: def videoCapture_waitAny(_opts \\ []), do: :erlang.nif_error("videoCapture::waitAny not loaded")
 static ERL_NIF_TERM evision_cv_videoCapture_waitAny(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[])
@@ -27,6 +33,7 @@ static ERL_NIF_TERM evision_cv_videoCapture_waitAny(ErlNifEnv *env, int argc, co
         int error_flag = false;
         size_t n = ptr_streams.size();
         std::vector<cv::VideoCapture> streams;
+        streams.reserve(n);
         for (size_t i = 0; i < n; i++) {
             auto& ptr = ptr_streams[i];
             streams.emplace_back(*ptr.get());
@@ -38,7 +45,7 @@ static ERL_NIF_TERM evision_cv_videoCapture_waitAny(ErlNifEnv *env, int argc, co
                 // code_ret_1_tuple_except_bool
                 return evision_from(env, readyIndex);
             } else {
-                return evision::nif::atom(env, "false");
+                return evision::nif::atom_false;
             };
         }
     }
@@ -47,6 +54,229 @@ static ERL_NIF_TERM evision_cv_videoCapture_waitAny(ErlNifEnv *env, int argc, co
     else return enif_make_badarg(env);
 }
 
+// longest time a poller thread spends in `cv::VideoCapture::waitAny` before checking if it was stopped
+#define EVISION_POLLER_SLICE_NS 100000000LL
+
+/// A thread waiting on a fixed set of video captures with `cv::VideoCapture::waitAny`
+///
+/// The set of captures is converted once when the poller is created. Each call to
+/// `videoCapture_poller_arm` makes the thread wait once, after which the owner receives
+/// `{:evision_videocapture_ready, ref, ready_indices}`, with no index on timeout.
+/// Captures should only be read by the owner between such a message and the next arm.
+///
+/// The poller is shared by its resource and its thread, so that the resource destructor
+/// does not have to wait for the thread to return from `cv::VideoCapture::waitAny`.
+struct evision_videocapture_poller {
+    std::vector<cv::VideoCapture> streams;
+    ErlNifPid owner;
+    // identifies the poller in messages, the resource itself cannot be put in a
+    // message by the thread as the resource may be being destructed
+    ErlNifEnv * ref_env = nullptr;
+    ERL_NIF_TERM ref;
+    std::thread thread;
+    // held while joining `thread`, as the poller may be stopped by several processes at once
+    std::mutex join_mutex;
+
+    std::mutex mutex;
+    std::condition_variable armed_cv;
+    bool armed = false;
+    bool stopped = false;
+    int64 timeout_ns = 0;
+
+    ~evision_videocapture_poller() {
+        if (ref_env) enif_free_env(ref_env);
+    }
+};
+
+static void evision_videocapture_poller_run(std::shared_ptr<evision_videocapture_poller> poller) {
+    while (true) {
+        int64 timeout_ns;
+        {
+            std::unique_lock<std::mutex> lock(poller->mutex);
+            poller->armed_cv.wait(lock, [&poller] { return poller->armed || poller->stopped; });
+            if (poller->stopped) return;
+            timeout_ns = poller->timeout_ns;
+        }
+
+        // wait in slices so that stopping the poller does not wait for the whole timeout
+        std::vector<int> ready;
+        std::string error;
+        int64 remaining = timeout_ns;
+        do {
+            int64 slice = (remaining > 0 && remaining < EVISION_POLLER_SLICE_NS) ? remaining : EVISION_POLLER_SLICE_NS;
+            try {
+                cv::VideoCapture::waitAny(poller->streams, ready, slice);
+            } catch (const std::exception &e) {
+                error = e.what();
+                break;
+            }
+            remaining -= slice;
+            std::lock_guard<std::mutex> lock(poller->mutex);
+            if (poller->stopped) return;
+        } while (ready.empty() && (timeout_ns <= 0 || remaining > 0));
+
+        {
+            std::lock_guard<std::mutex> lock(poller->mutex);
+            poller->armed = false;
+            if (poller->stopped) return;
+        }
+
+        ErlNifEnv * msg_env = enif_alloc_env();
+        ERL_NIF_TERM result = error.empty() ? evision_from(msg_env, ready) : evision::nif::error(msg_env, error.c_str());
+        ERL_NIF_TERM msg = enif_make_tuple3(msg_env,
+            enif_make_atom(msg_env, "evision_videocapture_ready"),
+            enif_make_copy(msg_env, poller->ref),
+            result);
+        enif_send(nullptr, &poller->owner, msg_env, msg);
+        enif_free_env(msg_env);
+    }
+}
+
+/// Ask the thread to stop, it exits within one slice of `EVISION_POLLER_SLICE_NS`
+static void evision_videocapture_poller_signal_stop(evision_videocapture_poller * poller) {
+    {
+        std::lock_guard<std::mutex> lock(poller->mutex);
+        poller->stopped = true;
+    }
+    poller->armed_cv.notify_all();
+}
+
+static void evision_videocapture_poller_stop(evision_videocapture_poller * poller) {
+    evision_videocapture_poller_signal_stop(poller);
+    std::lock_guard<std::mutex> lock(poller->join_mutex);
+    if (poller->thread.joinable()) {
+        poller->thread.join();
+    }
+}
+
+static void destruct_videocapture_poller(ErlNifEnv *env, void *args) {
+    evision_res<std::shared_ptr<evision_videocapture_poller>> * res = (evision_res<std::shared_ptr<evision_videocapture_poller>> *)args;
+    std::shared_ptr<evision_videocapture_poller> &poller = res->val;
+    if (poller) {
+        // this runs on a normal scheduler, instead of waiting for the thread to return from
+        // `waitAny`, the thread is detached and frees the poller when it exits
+        evision_videocapture_poller_signal_stop(poller.get());
+        std::lock_guard<std::mutex> lock(poller->join_mutex);
+        if (poller->thread.joinable()) {
+            poller->thread.detach();
+        }
+    }
+    poller.~shared_ptr();
+}
+
+static int evision_init_videocapture_pollers(ErlNifEnv *env) {
+    ErlNifResourceType * rt = enif_open_resource_type(env, "evision", "Evision.VideoCapture.Poller.t", destruct_videocapture_poller, ERL_NIF_RT_CREATE, NULL);
+    if (!rt) return 0;
+    evision_res<std::shared_ptr<evision_videocapture_poller>>::type = rt;
+    return 1;
+}
+
+static bool evision_get_videocapture_poller(ErlNifEnv *env, ERL_NIF_TERM term, evision_res<std::shared_ptr<evision_videocapture_poller>> *& res) {
+    return enif_get_resource(env, term, evision_res<std::shared_ptr<evision_videocapture_poller>>::type, (void **)&res) && res->val;
+}
+
+// @evision c: videoCapture_poller_new,evision_cv_videoCapture_poller_new,1,normal
+// @evision nif: def videoCapture_poller_new(_opts \\ []), do: :erlang.nif_error("videoCapture::poller_new not loaded")
+static ERL_NIF_TERM evision_cv_videoCapture_poller_new(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        std::vector<cv::Ptr<cv::VideoCapture>> ptr_streams;
+        ErlNifPid owner;
+
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "streams"), ptr_streams, ArgInfo("streams", 0))) {
+            ERL_NIF_TERM owner_term = evision_get_kw(env, erl_terms, "owner");
+            if (evision::nif::check_nil(env, owner_term)) {
+                enif_self(env, &owner);
+            } else if (!enif_get_local_pid(env, owner_term, &owner)) {
+                return evision::nif::error(env, "poller failed: expecting a local pid as the owner");
+            }
+
+            evision_res<std::shared_ptr<evision_videocapture_poller>> * res;
+            if (!alloc_resource(&res)) {
+                return evision::nif::error(env, "out of memory");
+            }
+            new (&res->val) std::shared_ptr<evision_videocapture_poller>(std::make_shared<evision_videocapture_poller>());
+            res->val->owner = owner;
+            res->val->ref_env = enif_alloc_env();
+            res->val->ref = enif_make_ref(res->val->ref_env);
+            res->val->streams.reserve(ptr_streams.size());
+            for (auto& ptr : ptr_streams) {
+                res->val->streams.emplace_back(*ptr.get());
+            }
+            // the thread shares the poller with the resource, so that either of them may go first
+            try {
+                res->val->thread = std::thread(evision_videocapture_poller_run, res->val);
+            } catch (const std::system_error &e) {
+                enif_release_resource(res);
+                return evision::nif::error(env, (std::string("poller failed: ") + e.what()).c_str());
+            }
+
+            ERL_NIF_TERM ret = enif_make_tuple2(env, enif_make_resource(env, res), enif_make_copy(env, res->val->ref));
+            enif_release_resource(res);
+            return ret;
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+// @evision c: videoCapture_poller_arm,evision_cv_videoCapture_poller_arm,1,normal
+// @evision nif: def videoCapture_poller_arm(_opts \\ []), do: :erlang.nif_error("videoCapture::poller_arm not loaded")
+static ERL_NIF_TERM evision_cv_videoCapture_poller_arm(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        evision_res<std::shared_ptr<evision_videocapture_poller>> * res;
+        int64 timeoutNs = 0;
+
+        if (evision_get_videocapture_poller(env, evision_get_kw(env, erl_terms, "poller"), res) &&
+            evision_to_safe(env, evision_get_kw(env, erl_terms, "timeoutNs"), timeoutNs, ArgInfo("timeoutNs", 0, true))) {
+            evision_videocapture_poller * poller = res->val.get();
+            {
+                std::lock_guard<std::mutex> lock(poller->mutex);
+                if (poller->stopped) {
+                    return evision::nif::error(env, "poller was stopped");
+                }
+                if (poller->armed) {
+                    return evision::nif::error(env, "poller is already armed");
+                }
+                poller->timeout_ns = timeoutNs;
+                poller->armed = true;
+            }
+            poller->armed_cv.notify_one();
+            return evision::nif::atom_ok;
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+// @evision c: videoCapture_poller_stop,evision_cv_videoCapture_poller_stop,1,io
+// @evision nif: def videoCapture_poller_stop(_opts \\ []), do: :erlang.nif_error("videoCapture::poller_stop not loaded")
+static ERL_NIF_TERM evision_cv_videoCapture_poller_stop(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    evision_res<std::shared_ptr<evision_videocapture_poller>> * res;
+    if (!evision_get_videocapture_poller(env, evision_get_kw(env, erl_terms, "poller"), res)) {
+        return enif_make_badarg(env);
+    }
+    evision_videocapture_poller_stop(res->val.get());
+    return evision::nif::atom_ok;
+}
+
 #endif //  EVISION_VIDEOCAPTURE_H
 
 #endif //  HAVE_OPENCV_VIDEO
@@ -0,0 +1,248 @@
+#ifdef HAVE_OPENCV_VIDEO
+
+// @evision enable_with: video
+
+#ifndef EVISION_VIDEOCAPTURE_STREAM_H
+#define EVISION_VIDEOCAPTURE_STREAM_H
+
+#include <condition_variable>
+#include <deque>
+#include <memory>
+#include <mutex>
+#include <system_error>
+#include <thread>
+
+enum evision_stream_mode {
+    // the decode thread waits for the consumer when the buffer is full
+    EVISION_STREAM_BLOCK,
+    // the oldest buffered frame is dropped to make room for a new frame
+    EVISION_STREAM_DROP_OLDEST,
+    // new frames are dropped while the buffer is full
+    EVISION_STREAM_DROP_NEWEST,
+};
+
+/// A thread decoding frames of a `cv::VideoCapture` into a bounded buffer
+///
+/// The stream is shared by its resource and its decode thread, so that the resource
+/// destructor does not have to wait for a pending `read` of the thread to return.
+struct evision_videocapture_stream {
+    cv::Ptr<cv::VideoCapture> cap;
+    std::thread thread;
+    // held while joining `thread`, as the stream may be stopped by several processes at once
+    std::mutex join_mutex;
+
+    std::mutex mutex;
+    // signalled when a frame is taken from the buffer or the stream is stopped
+    std::condition_variable not_full;
+    // signalled when a frame is added to the buffer or decoding ends
+    std::condition_variable not_empty;
+    std::deque<cv::Mat> frames;
+    size_t capacity;
+    evision_stream_mode mode;
+    // number of frames grabbed without decoding after each decoded frame
+    int skip;
+
+    bool stopped = false;
+    bool eof = false;
+    std::string error;
+    uint64_t dropped = 0;
+};
+
+static void evision_videocapture_stream_run(std::shared_ptr<evision_videocapture_stream> stream) {
+    while (true) {
+        cv::Mat frame;
+        bool ok = false;
+        try {
+            ok = stream->cap->read(frame);
+            // skipped frames are only grabbed, an error here shows up on the next read
+            for (int i = 0; ok && i < stream->skip; i++) {
+                if (!stream->cap->grab()) break;
+            }
+        } catch (const std::exception &e) {
+            std::lock_guard<std::mutex> lock(stream->mutex);
+            stream->error = e.what();
+            ok = false;
+        }
+
+        std::unique_lock<std::mutex> lock(stream->mutex);
+        if (!ok || frame.empty()) {
+            stream->eof = true;
+            stream->not_empty.notify_all();
+            return;
+        }
+
+        if (stream->frames.size() >= stream->capacity) {
+            if (stream->mode == EVISION_STREAM_BLOCK) {
+                stream->not_full.wait(lock, [&stream] {
+                    return stream->stopped || stream->frames.size() < stream->capacity;
+                });
+            } else if (stream->mode == EVISION_STREAM_DROP_OLDEST) {
+                stream->frames.pop_front();
+                stream->dropped++;
+            } else {
+                stream->dropped++;
+                continue;
+            }
+        }
+        if (stream->stopped) return;
+
+        stream->frames.push_back(frame);
+        stream->not_empty.notify_one();
+    }
+}
+
+/// Ask the decode thread to stop, it exits once its pending `read` returns
+static void evision_videocapture_stream_signal_stop(evision_videocapture_stream * stream) {
+    {
+        std::lock_guard<std::mutex> lock(stream->mutex);
+        stream->stopped = true;
+        stream->frames.clear();
+    }
+    stream->not_full.notify_all();
+    stream->not_empty.notify_all();
+}
+
+static void evision_videocapture_stream_stop(evision_videocapture_stream * stream) {
+    evision_videocapture_stream_signal_stop(stream);
+    std::lock_guard<std::mutex> lock(stream->join_mutex);
+    if (stream->thread.joinable()) {
+        stream->thread.join();
+    }
+}
+
+static void destruct_videocapture_stream(ErlNifEnv *env, void *args) {
+    evision_res<std::shared_ptr<evision_videocapture_stream>> * res = (evision_res<std::shared_ptr<evision_videocapture_stream>> *)args;
+    std::shared_ptr<evision_videocapture_stream> &stream = res->val;
+    if (stream) {
+        // this runs on a normal scheduler, a read from a network camera may not return for a long time.
+        // the thread holds its own reference to the stream (and the capture), so it is detached instead
+        evision_videocapture_stream_signal_stop(stream.get());
+        std::lock_guard<std::mutex> lock(stream->join_mutex);
+        if (stream->thread.joinable()) {
+            stream->thread.detach();
+        }
+    }
+    stream.~shared_ptr();
+}
+
+static int evision_init_videocapture_streams(ErlNifEnv *env) {
+    ErlNifResourceType * rt = enif_open_resource_type(env, "evision", "Evision.VideoCapture.Stream.t", destruct_videocapture_stream, ERL_NIF_RT_CREATE, NULL);
+    if (!rt) return 0;
+    evision_res<std::shared_ptr<evision_videocapture_stream>>::type = rt;
+    return 1;
+}
+
+// @evision c: videoCapture_stream_start,evision_cv_videoCapture_stream_start,1,normal
+// @evision nif: def videoCapture_stream_start(_opts \\ []), do: :erlang.nif_error("videoCapture::stream_start not loaded")
+static ERL_NIF_TERM evision_cv_videoCapture_stream_start(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    using namespace cv;
+    ERL_NIF_TERM error_term = 0;
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    {
+        Ptr<VideoCapture> cap;
+        int buffer = 0;
+        std::string mode;
+        int skip = 0;
+
+        if (evision_to_safe(env, evision_get_kw(env, erl_terms, "cap"), cap, ArgInfo("cap", 0)) &&
+            evision_to_safe(env, evision_get_kw(env, erl_terms, "buffer"), buffer, ArgInfo("buffer", 0)) &&
+            evision_to_safe(env, evision_get_kw(env, erl_terms, "mode"), mode, ArgInfo("mode", 0)) &&
+            evision_to_safe(env, evision_get_kw(env, erl_terms, "skip"), skip, ArgInfo("skip", 0))) {
+            evision_stream_mode stream_mode;
+            if (mode == "block") stream_mode = EVISION_STREAM_BLOCK;
+            else if (mode == "drop_oldest") stream_mode = EVISION_STREAM_DROP_OLDEST;
+            else if (mode == "drop_newest") stream_mode = EVISION_STREAM_DROP_NEWEST;
+            else {
+                return evision::nif::error(env, "stream failed: invalid mode. Valid values are :block, :drop_oldest and :drop_newest");
+            }
+            if (buffer < 1 || skip < 0) {
+                return evision::nif::error(env, "stream failed: buffer should be positive and skip should not be negative");
+            }
+            if (cap.empty() || !cap->isOpened()) {
+                return evision::nif::error(env, "stream failed: the video capture is not opened");
+            }
+
+            evision_res<std::shared_ptr<evision_videocapture_stream>> * res;
+            if (!alloc_resource(&res)) {
+                return evision::nif::error(env, "out of memory");
+            }
+            new (&res->val) std::shared_ptr<evision_videocapture_stream>(std::make_shared<evision_videocapture_stream>());
+            res->val->cap = cap;
+            res->val->capacity = (size_t)buffer;
+            res->val->mode = stream_mode;
+            res->val->skip = skip;
+            // the thread shares the stream with the resource, so that either of them may go first
+            try {
+                res->val->thread = std::thread(evision_videocapture_stream_run, res->val);
+            } catch (const std::system_error &e) {
+                enif_release_resource(res);
+                return evision::nif::error(env, (std::string("stream failed: ") + e.what()).c_str());
+            }
+
+            ERL_NIF_TERM ret = enif_make_resource(env, res);
+            enif_release_resource(res);
+            return ret;
+        }
+    }
+
+    if (error_term != 0) return error_term;
+    else return enif_make_badarg(env);
+}
+
+// @evision c: videoCapture_stream_next,evision_cv_videoCapture_stream_next,1,io
+// @evision nif: def videoCapture_stream_next(_opts \\ []), do: :erlang.nif_error("videoCapture::stream_next not loaded")
+static ERL_NIF_TERM evision_cv_videoCapture_stream_next(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    evision_res<std::shared_ptr<evision_videocapture_stream>> * res;
+    if (!enif_get_resource(env, evision_get_kw(env, erl_terms, "stream"), evision_res<std::shared_ptr<evision_videocapture_stream>>::type, (void **)&res) || !res->val) {
+        return enif_make_badarg(env);
+    }
+
+    evision_videocapture_stream * stream = res->val.get();
+    cv::Mat frame;
+    {
+        std::unique_lock<std::mutex> lock(stream->mutex);
+        stream->not_empty.wait(lock, [stream] {
+            return !stream->frames.empty() || stream->eof || stream->stopped;
+        });
+        if (stream->frames.empty()) {
+            if (!stream->error.empty()) return evision::nif::error(env, stream->error.c_str());
+            return evision::nif::atom(env, "eof");
+        }
+        frame = stream->frames.front();
+        stream->frames.pop_front();
+    }
+    stream->not_full.notify_one();
+    return evision_from(env, frame);
+}
+
+// @evision c: videoCapture_stream_stop,evision_cv_videoCapture_stream_stop,1,io
+// @evision nif: def videoCapture_stream_stop(_opts \\ []), do: :erlang.nif_error("videoCapture::stream_stop not loaded")
+static ERL_NIF_TERM evision_cv_videoCapture_stream_stop(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[]) {
+    std::map<std::string, ERL_NIF_TERM> erl_terms;
+    int nif_opts_index = 0;
+    evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
+
+    evision_res<std::shared_ptr<evision_videocapture_stream>> * res;
+    if (!enif_get_resource(env, evision_get_kw(env, erl_terms, "stream"), evision_res<std::shared_ptr<evision_videocapture_stream>>::type, (void **)&res) || !res->val) {
+        return enif_make_badarg(env);
+    }
+
+    evision_videocapture_stream_stop(res->val.get());
+    uint64_t dropped;
+    {
+        std::lock_guard<std::mutex> lock(res->val->mutex);
+        dropped = res->val->dropped;
+    }
+    return enif_make_tuple2(env, evision::nif::atom_ok, enif_make_uint64(env, dropped));
+}
+
+#endif //  EVISION_VIDEOCAPTURE_STREAM_H
+
+#endif //  HAVE_OPENCV_VIDEO
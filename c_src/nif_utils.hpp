@@ -19,12 +19,35 @@ namespace evision
       }
     }
 
+    // Atoms used on hot paths, interned once by `init_atoms` in `on_load`.
+    //
+    // Atoms are not bound to any environment, so these terms can be returned
+    // from (and compared against terms passed to) any NIF call.
+    static ERL_NIF_TERM atom_nil;
+    static ERL_NIF_TERM atom_ok;
+    static ERL_NIF_TERM atom_error;
+    static ERL_NIF_TERM atom_true;
+    static ERL_NIF_TERM atom_false;
+    static ERL_NIF_TERM atom_ref;
+    static ERL_NIF_TERM atom_class;
+
+    int init_atoms(ErlNifEnv *env)
+    {
+      atom_nil = enif_make_atom(env, "nil");
+      atom_ok = enif_make_atom(env, "ok");
+      atom_error = enif_make_atom(env, "error");
+      atom_true = enif_make_atom(env, "true");
+      atom_false = enif_make_atom(env, "false");
+      atom_ref = enif_make_atom(env, "ref");
+      atom_class = enif_make_atom(env, "class");
+      return true;
+    }
+
     // Status helpers
 
     // Helper for returning `{:error, msg}` from NIF.
     ERL_NIF_TERM error(ErlNifEnv *env, const char *msg)
     {
-      ERL_NIF_TERM atom_error = atom(env, "error");
       ERL_NIF_TERM reason;
       unsigned char * ptr;
       size_t len = strlen(msg);
@@ -40,7 +63,7 @@ namespace evision
     // Helper for returning `{:ok, term}` from NIF.
     ERL_NIF_TERM ok(ErlNifEnv *env)
     {
-      return atom(env, "ok");
+      return atom_ok;
     }
 
     // Helper for returning `:ok` from NIF.
@@ -107,10 +130,7 @@ namespace evision
 
     ERL_NIF_TERM make(ErlNifEnv *env, bool var)
     {
-      if (var)
-        return atom(env, "true");
-
-      return atom(env, "false");
+      return var ? atom_true : atom_false;
     }
 
     ERL_NIF_TERM make(ErlNifEnv *env, long var)
@@ -260,21 +280,16 @@ namespace evision
 
     // Check if :nil
     int check_nil(ErlNifEnv *env, ERL_NIF_TERM term) {
-        std::string atom_str;
-        if (get_atom(env, term, atom_str) && atom_str == "nil") {
-            return true;
-        }
-        return false;
+        return term == atom_nil;
     }
 
     // Boolean
 
     int get(ErlNifEnv *env, ERL_NIF_TERM term, bool *var)
     {
-      std::string bool_atom;
-      if (!get_atom(env, term, bool_atom))
+      if (!enif_is_atom(env, term))
         return 0;
-      *var = (bool_atom == "true");
+      *var = (term == atom_true);
       return 1;
     }
 
@@ -4,6 +4,6 @@ defmodule Evision.Application do
 
   def start(_type, _args) do
     if Code.ensure_loaded?(Kino), do: Evision.SmartCell.register_smartcells(Evision.SmartCell.Zoo)
-    Supervisor.start_link([], strategy: :one_for_one)
+    Supervisor.start_link([Evision.Internal.MemoryWatcher], strategy: :one_for_one)
   end
 end
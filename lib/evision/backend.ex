@@ -314,17 +314,107 @@ defmodule Evision.Backend do
   end
 
   @impl true
-  def pad(_out, tensor, _constant, config) do
-    case tensor.shape do
-      {} ->
-        tensor
-      {_} ->
-        [{_edge_low, _edge_high, _interior}] = config
-      _ ->
-        permutation = for i <- 0..(Nx.rank(tensor) - 2), do: i
-        _permutation = [Nx.rank(tensor) - 1 | permutation]
+  @spec pad(Nx.Tensor.t(), Nx.Tensor.t(), Nx.Tensor.t(), list()) :: Nx.Tensor.t()
+  def pad(out, %T{shape: {}} = tensor, _pad_value, []) do
+    to_out(from_nx(tensor), out)
+  end
+
+  def pad(%T{type: type} = out, %T{shape: shape} = tensor, pad_value, config) do
+    tensor
+    |> from_nx()
+    |> cast_to(type)
+    |> Evision.Mat.pad(shape, to_number(pad_value), config)
+    |> reject_error()
+    |> to_out(out)
+  end
+
+  @impl true
+  @spec slice(Nx.Tensor.t(), Nx.Tensor.t(), list(), list(), list()) :: Nx.Tensor.t()
+  def slice(out, %T{shape: {}} = tensor, [], [], []) do
+    to_out(from_nx(tensor), out)
+  end
+
+  def slice(out, %T{shape: shape} = tensor, start_indices, lengths, strides) do
+    start_indices = clamp_start_indices(start_indices, shape, lengths)
+
+    Evision.Mat.slice(from_nx(tensor), shape, start_indices, lengths, strides)
+    |> reject_error()
+    |> to_out(out)
+  end
+
+  @impl true
+  @spec put_slice(Nx.Tensor.t(), Nx.Tensor.t(), list(), Nx.Tensor.t()) :: Nx.Tensor.t()
+  def put_slice(%T{type: type} = out, %T{shape: {}}, [], slice) do
+    slice
+    |> from_nx()
+    |> cast_to(type)
+    |> to_out(out)
+  end
+
+  def put_slice(%T{type: type} = out, %T{shape: shape} = tensor, start_indices, %T{shape: slice_shape} = slice) do
+    start_indices = clamp_start_indices(start_indices, shape, Tuple.to_list(slice_shape))
+    mat = cast_to(from_nx(tensor), type)
+    slice = cast_to(from_nx(slice), type)
+
+    Evision.Mat.put_slice(mat, shape, start_indices, slice, slice_shape)
+    |> reject_error()
+    |> to_out(out)
+  end
+
+  defp clamp_start_indices(start_indices, shape, lengths) do
+    [Tuple.to_list(shape), start_indices, lengths]
+    |> Enum.zip_with(fn [dim, start, length] ->
+      start
+      |> to_number()
+      |> trunc()
+      |> max(0)
+      |> min(dim - length)
+    end)
+  end
+
+  @impl true
+  @spec concatenate(Nx.Tensor.t(), [Nx.Tensor.t()], non_neg_integer()) :: Nx.Tensor.t()
+  def concatenate(%T{type: type} = out, tensors, axis) do
+    tensors
+    |> Enum.map(fn %T{shape: shape} = tensor -> {cast_to(from_nx(tensor), type), shape} end)
+    |> Evision.Mat.concatenate(axis)
+    |> reject_error()
+    |> to_out(out)
+  end
+
+  @impl true
+  @spec gather(Nx.Tensor.t(), Nx.Tensor.t(), Nx.Tensor.t()) :: Nx.Tensor.t()
+  def gather(out, %T{shape: shape} = tensor, indices) do
+    Evision.Mat.gather(from_nx(tensor), shape, from_nx(indices))
+    |> reject_error()
+    |> to_out(out)
+  end
+
+  ## Reductions
+
+  for {fun, op} <- [sum: :sum, product: :product, reduce_max: :max, reduce_min: :min, all: :all, any: :any] do
+    @impl true
+    @spec unquote(fun)(Nx.Tensor.t(), Nx.Tensor.t(), Keyword.t()) :: Nx.Tensor.t()
+    def unquote(fun)(%T{} = out, %T{shape: shape} = tensor, opts) do
+      axes = opts[:axes] || Nx.axes(shape)
+
+      Evision.Mat.reduce(from_nx(tensor), nd_shape(shape), axes, unquote(op))
+      |> reject_error()
+      |> to_out(out)
+    end
+  end
+
+  for {fun, op} <- [argmax: :max, argmin: :min] do
+    @impl true
+    @spec unquote(fun)(Nx.Tensor.t(), Nx.Tensor.t(), Keyword.t()) :: Nx.Tensor.t()
+    def unquote(fun)(%T{} = out, %T{shape: shape} = tensor, opts) do
+      Evision.Mat.arg_reduce(from_nx(tensor), nd_shape(shape), unquote(op),
+        axis: opts[:axis],
+        last_index: opts[:tie_break] == :high
+      )
+      |> reject_error()
+      |> to_out(out)
     end
-    raise RuntimeError, "not implemented yet"
   end
 
   @impl true
@@ -741,6 +831,46 @@ defmodule Evision.Backend do
     |> to_nx(out)
   end
 
+  for op <- [
+        :log1p,
+        :sigmoid,
+        :sin,
+        :cos,
+        :tan,
+        :sinh,
+        :cosh,
+        :tanh,
+        :asin,
+        :acos,
+        :atan,
+        :asinh,
+        :acosh,
+        :atanh,
+        :sqrt,
+        :rsqrt,
+        :cbrt,
+        :erf,
+        :erfc
+      ] do
+    @impl true
+    @spec unquote(op)(Nx.Tensor.t(), Nx.Tensor.t()) :: Nx.Tensor.t()
+    def unquote(op)(%T{} = out, tensor) do
+      Evision.Mat.elementwise_math(from_nx(tensor), unquote(op))
+      |> reject_error()
+      |> to_out(out)
+    end
+  end
+
+  @impl true
+  @spec power(Nx.Tensor.t(), Nx.Tensor.t(), Nx.Tensor.t()) :: Nx.Tensor.t()
+  def power(%T{type: type, shape: out_shape} = out, l, r) do
+    {l, r} = enforce_same_shape(l, r, out_shape)
+
+    Evision.Mat.pow(cast_to(from_nx(l), type), from_nx(r))
+    |> reject_error()
+    |> to_out(out)
+  end
+
   @doc false
   def from_nx(%T{data: %EB{ref: mat_ref}}), do: mat_ref
   def from_nx(%T{} = tensor) do
@@ -755,6 +885,32 @@ defmodule Evision.Backend do
     %{t | type: type, data: %__MODULE__{ref: check_shape_and_type(mat_ref, shape, type)}}
   end
 
+  # results of the native callbacks are computed with the shape of the input tensors,
+  # reshape them to the expected output shape and type
+  @spec to_out(Evision.Mat.t(), Nx.Tensor.t()) :: Nx.Tensor.t()
+  defp to_out(mat, %T{shape: shape, type: type} = out) do
+    mat
+    |> Evision.Mat.reshape(nd_shape(shape))
+    |> reject_error()
+    |> cast_to(type)
+    |> to_nx(out)
+  end
+
+  @spec cast_to(Evision.Mat.t(), Nx.Type.t()) :: Evision.Mat.t()
+  defp cast_to(mat, type) do
+    case Evision.Mat.type(mat) do
+      ^type ->
+        mat
+
+      _ ->
+        Evision.Mat.as_type(mat, type)
+        |> reject_error()
+    end
+  end
+
+  defp nd_shape({}), do: {1}
+  defp nd_shape(shape), do: shape
+
   @spec to_number(number() | Nx.Tensor.t()) :: number()
   defp to_number(n) when is_number(n), do: n
   defp to_number(%T{} = t) do
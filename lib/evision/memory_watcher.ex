@@ -0,0 +1,32 @@
+defmodule Evision.Internal.MemoryWatcher do
+  @moduledoc false
+  # Runs a garbage collection of all processes when the data held by
+  # `Evision.Mat` resources goes above the high-water mark set by
+  # `Evision.Mat.set_memory_high_water/2`.
+  #
+  # The VM only sees the size of the resource struct of an `Evision.Mat`, so
+  # processes holding large matrices would otherwise feel no memory pressure.
+  use GenServer
+
+  def start_link(opts) do
+    GenServer.start_link(__MODULE__, opts, name: __MODULE__)
+  end
+
+  @impl true
+  def init(_opts) do
+    {:ok, nil}
+  end
+
+  @impl true
+  def handle_info({:evision_memory_high_water, _live_bytes}, state) do
+    for pid <- Process.list(), pid != self() do
+      :erlang.garbage_collect(pid)
+    end
+
+    {:noreply, state}
+  end
+
+  def handle_info(_msg, state) do
+    {:noreply, state}
+  end
+end
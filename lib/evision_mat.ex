@@ -230,7 +230,7 @@ defmodule Evision.Mat do
   @doc """
   Extracts a rectangular submatrix.
 
-  The submatrix data is copied.
+  The submatrix data is copied unless `view: true` is given.
 
   #### Variant 1
   ##### Positional Arguments
@@ -247,9 +247,16 @@ defmodule Evision.Mat do
 
     Start and end column of the extracted submatrix. The upper boundary is not included.
 
+  ##### Keyword Arguments
+
+  - **view**. `boolean`, default to `false`.
+
+    When `true`, the extracted submatrix shares the data with `mat` instead of copying it,
+    and `mat` is kept alive as long as the submatrix is.
+
   ##### Return
 
-  Extracted submatrix (data is copied).
+  Extracted submatrix (data is copied unless `view: true`).
 
   #### Variant 2
   ##### Positional Arguments
@@ -266,27 +273,38 @@ defmodule Evision.Mat do
 
     Start and end column of the extracted submatrix. The upper boundary is not included.
 
+  ##### Keyword Arguments
+
+  - **view**. `boolean`, default to `false`.
+
+    When `true`, the extracted submatrix shares the data with `mat` instead of copying it,
+    and `mat` is kept alive as long as the submatrix is.
+
   ##### Return
 
-  Extracted submatrix (data is copied).
+  Extracted submatrix (data is copied unless `view: true`).
 
   """
-  @spec roi(maybe_mat_in(), {integer(), integer()} | :all, {integer(), integer()} | :all) ::
-          maybe_mat_out()
-  def roi(mat, rowRange, colRange)
-      when (is_tuple(rowRange) or rowRange == :all) and (is_tuple(colRange) or colRange == :all) do
+  @spec roi(
+          maybe_mat_in(),
+          {integer(), integer()} | :all | Range.t(),
+          {integer(), integer()} | :all | Range.t(),
+          Keyword.t()
+        ) :: maybe_mat_out()
+  def roi(mat, rowRange, colRange, opts)
+      when (is_tuple(rowRange) or rowRange == :all) and (is_tuple(colRange) or colRange == :all) and
+             is_list(opts) do
     mat = __from_struct__(mat)
 
-    :evision_nif.mat_roi(mat: mat, rowRange: rowRange, colRange: colRange)
+    :evision_nif.mat_roi(mat: mat, rowRange: rowRange, colRange: colRange, view: __roi_view__(opts))
     |> Evision.Internal.Structurise.to_struct()
   end
 
-  @spec roi(maybe_mat_in(), Range.t(), Range.t()) :: maybe_mat_out()
-  def roi(mat, firstRow..lastRow//1, firstCol..lastCol//1) do
-    roi(mat, {firstRow, lastRow}, {firstCol, lastCol})
+  def roi(mat, firstRow..lastRow//1, firstCol..lastCol//1, opts) when is_list(opts) do
+    roi(mat, {firstRow, lastRow}, {firstCol, lastCol}, opts)
   end
 
-  def roi(_, _.._//_, _.._//_) do
+  def roi(_, _.._//_, _.._//_, _) do
     raise ArgumentError, "Evision.Mat.roi does not support step size other than 1."
   end
 
@@ -304,9 +322,16 @@ defmodule Evision.Mat do
 
     The rect that specifies `{x, y, width, height}`.
 
+  ##### Keyword Arguments
+
+  - **view**. `boolean`, default to `false`.
+
+    When `true`, the extracted submatrix shares the data with `mat` instead of copying it,
+    and `mat` is kept alive as long as the submatrix is.
+
   ##### Return
 
-  Extracted submatrix specified as a rectangle. (data is copied)
+  Extracted submatrix specified as a rectangle. (data is copied unless `view: true`)
 
   #### Variant 2
   ##### Positional Arguments
@@ -319,29 +344,111 @@ defmodule Evision.Mat do
 
     Array of selected ranges along each array dimension.
 
+  ##### Keyword Arguments
+
+  - **view**. `boolean`, default to `false`.
+
+    When `true`, the extracted submatrix shares the data with `mat` instead of copying it,
+    and `mat` is kept alive as long as the submatrix is. Note that selecting a subset of
+    the channels of a 2D image always copies the data.
+
   ##### Return
 
-  Extracted submatrix. (data is copied)
+  Extracted submatrix. (data is copied unless `view: true`)
+
+  #### Variant 3
+  ##### Positional Arguments
+
+  - **mat**. `maybe_mat_in()`
+
+    The matrix.
+
+  - **rowRange**. `{int, int} | :all | Range.t(step: 1)`.
+
+    Start and end row of the extracted submatrix. The upper boundary is not included.
+
+  - **colRange**. `{int, int} | :all | Range.t(step: 1)`.
+
+    Start and end column of the extracted submatrix. The upper boundary is not included.
+
+  ##### Return
+
+  Extracted submatrix (data is copied).
 
   """
-  @spec roi(maybe_mat_in(), {integer(), integer(), integer(), integer()}) :: maybe_mat_out()
-  def roi(mat, rect = {_, _, _, _}) when is_tuple(rect) do
+  @spec roi(
+          maybe_mat_in(),
+          {integer(), integer(), integer(), integer()}
+          | [{integer(), integer()} | Range.t() | :all]
+          | {integer(), integer()}
+          | :all
+          | Range.t(),
+          Keyword.t() | {integer(), integer()} | :all | Range.t()
+        ) :: maybe_mat_out()
+  def roi(mat, rect = {_, _, _, _}, opts) when is_list(opts) do
     mat = __from_struct__(mat)
 
-    :evision_nif.mat_roi(mat: mat, rect: rect)
+    :evision_nif.mat_roi(mat: mat, rect: rect, view: __roi_view__(opts))
     |> Evision.Internal.Structurise.to_struct()
   end
 
-  @spec roi(maybe_mat_in(), [{integer(), integer()} | Range.t() | :all]) :: maybe_mat_out()
-  def roi(mat, ranges) when is_list(ranges) do
+  def roi(mat, ranges, opts) when is_list(ranges) and is_list(opts) do
     shape = mat.shape
     mat = __from_struct__(mat)
     ranges = __standardise_range_list__(ranges, shape, true)
 
-    :evision_nif.mat_roi(mat: mat, ranges: ranges)
+    :evision_nif.mat_roi(mat: mat, ranges: ranges, view: __roi_view__(opts))
     |> Evision.Internal.Structurise.to_struct()
   end
 
+  def roi(mat, rowRange, colRange) do
+    roi(mat, rowRange, colRange, [])
+  end
+
+  @doc """
+  Extracts a rectangular submatrix.
+
+  #### Variant 1
+  ##### Positional Arguments
+
+  - **mat**. `maybe_mat_in()`
+
+    The matrix.
+
+  - **rect**. `{int, int, int, int}`
+
+    The rect that specifies `{x, y, width, height}`.
+
+  ##### Return
+
+  Extracted submatrix specified as a rectangle. (data is copied)
+
+  #### Variant 2
+  ##### Positional Arguments
+
+  - **mat**. `maybe_mat_in()`
+
+    The matrix.
+
+  - **ranges**. `[{int, int} | :all]`
+
+    Array of selected ranges along each array dimension.
+
+  ##### Return
+
+  Extracted submatrix. (data is copied)
+
+  """
+  @spec roi(
+          maybe_mat_in(),
+          {integer(), integer(), integer(), integer()} | [{integer(), integer()} | Range.t() | :all]
+        ) :: maybe_mat_out()
+  def roi(mat, rect_or_ranges) when is_tuple(rect_or_ranges) or is_list(rect_or_ranges) do
+    roi(mat, rect_or_ranges, [])
+  end
+
+  defp __roi_view__(opts), do: opts[:view] == true
+
   @spec update_roi(maybe_mat_in(), [{integer(), integer()} | Range.t() | :all], maybe_mat_in()) ::
           maybe_mat_out()
   def update_roi(mat, ranges, with_mat) do
@@ -1200,6 +1307,275 @@ defmodule Evision.Mat do
     |> Evision.Internal.Structurise.to_struct()
   end
 
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Reduce `axes` of `mat` with `op`, treating `mat` as a matrix of shape `as_shape`.
+
+  `op` is one of `:sum`, `:product`, `:max`, `:min`, `:all` and `:any`. Reduced axes are kept with size 1.
+  """
+  @spec reduce(maybe_mat_in(), tuple(), [non_neg_integer()], atom()) :: maybe_mat_out()
+  def reduce(mat, as_shape, axes, op) when is_tuple(as_shape) and is_list(axes) and is_atom(op) do
+    mat = __from_struct__(mat)
+
+    :evision_nif.mat_reduce(img: mat, shape: Tuple.to_list(as_shape), axes: axes, op: op)
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Indices of the maximum (`op: :max`) or minimum (`op: :min`) values along `axis`,
+  treating `mat` as a matrix of shape `as_shape`.
+
+  ##### Keyword Arguments
+  - **axis**: `non_neg_integer() | nil`
+
+    The axis to reduce. Defaults to `nil`, which returns the index in the flattened matrix.
+
+  - **last_index**: `boolean()`
+
+    Return the last index instead of the first one when there are multiple maximum (or minimum) values.
+    Defaults to `false`.
+  """
+  @spec arg_reduce(maybe_mat_in(), tuple(), atom(), Keyword.t()) :: maybe_mat_out()
+  def arg_reduce(mat, as_shape, op, opts \\ []) when is_tuple(as_shape) and op in [:max, :min] and is_list(opts) do
+    mat = __from_struct__(mat)
+
+    :evision_nif.mat_arg_reduce(
+      img: mat,
+      shape: Tuple.to_list(as_shape),
+      axis: opts[:axis] || -1,
+      op: op,
+      last_index: opts[:last_index] == true
+    )
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Slice `lengths` elements along each axis starting at `start_indices`, with a step of `strides`,
+  treating `mat` as a matrix of shape `as_shape`.
+
+  The resulting matrix is continuous.
+  """
+  @spec slice(maybe_mat_in(), tuple(), [non_neg_integer()], [pos_integer()], [pos_integer()]) :: maybe_mat_out()
+  def slice(mat, as_shape, start_indices, lengths, strides)
+      when is_tuple(as_shape) and is_list(start_indices) and is_list(lengths) and is_list(strides) do
+    mat = __from_struct__(mat)
+
+    :evision_nif.mat_slice(
+      img: mat,
+      shape: Tuple.to_list(as_shape),
+      start: start_indices,
+      lengths: lengths,
+      strides: strides
+    )
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Return a copy of `mat` with `slice` written at `start_indices`,
+  treating `mat` as a matrix of shape `as_shape` and `slice` as a matrix of shape `slice_shape`.
+  """
+  @spec put_slice(maybe_mat_in(), tuple(), [non_neg_integer()], maybe_mat_in(), tuple()) :: maybe_mat_out()
+  def put_slice(mat, as_shape, start_indices, slice, slice_shape)
+      when is_tuple(as_shape) and is_list(start_indices) and is_tuple(slice_shape) do
+    mat = __from_struct__(mat)
+    slice = __from_struct__(slice)
+
+    :evision_nif.mat_put_slice(
+      img: mat,
+      shape: Tuple.to_list(as_shape),
+      start: start_indices,
+      slice: slice,
+      slice_shape: Tuple.to_list(slice_shape)
+    )
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Concatenate a list of `{mat, shape}` along `axis`.
+
+  All matrices should have the same type, and their shapes should only differ in `axis`.
+  """
+  @spec concatenate([{maybe_mat_in(), tuple()}], non_neg_integer()) :: maybe_mat_out()
+  def concatenate(mats_with_shape, axis) when is_list(mats_with_shape) and is_integer(axis) do
+    {mats, shapes} =
+      mats_with_shape
+      |> Enum.map(fn {mat, shape} -> {__from_struct__(mat), Tuple.to_list(shape)} end)
+      |> Enum.unzip()
+
+    :evision_nif.mat_concatenate(mats: mats, shapes: shapes, axis: axis)
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Gather elements from `mat`, treating `mat` as a matrix of shape `as_shape`.
+
+  `indices` is read as rows of `tuple_size(as_shape)` coordinates, and the result is
+  a matrix with one element per row.
+  """
+  @spec gather(maybe_mat_in(), tuple(), maybe_mat_in()) :: maybe_mat_out()
+  def gather(mat, as_shape, indices) when is_tuple(as_shape) do
+    mat = __from_struct__(mat)
+    indices = __from_struct__(indices)
+
+    :evision_nif.mat_gather(img: mat, shape: Tuple.to_list(as_shape), indices: indices)
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Pad `mat` with `value`, treating `mat` as a matrix of shape `as_shape`.
+
+  `config` is a list of `{edge_low, edge_high, interior}`, one for each axis, as in `Nx.pad/3`.
+  """
+  @spec pad(maybe_mat_in(), tuple(), number(), [{integer(), integer(), non_neg_integer()}]) :: maybe_mat_out()
+  def pad(mat, as_shape, value, config) when is_tuple(as_shape) and is_number(value) and is_list(config) do
+    mat = __from_struct__(mat)
+
+    :evision_nif.mat_pad(
+      img: mat,
+      shape: Tuple.to_list(as_shape),
+      value: value,
+      lo: Enum.map(config, &elem(&1, 0)),
+      hi: Enum.map(config, &elem(&1, 1)),
+      interior: Enum.map(config, &elem(&1, 2))
+    )
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Compute `op` on each element of `mat`.
+
+  `op` is one of `:log1p`, `:sigmoid`, `:sin`, `:cos`, `:tan`, `:sinh`, `:cosh`, `:tanh`,
+  `:asin`, `:acos`, `:atan`, `:asinh`, `:acosh`, `:atanh`, `:sqrt`, `:rsqrt`, `:cbrt`, `:erf` and `:erfc`.
+  The result is a `{:f, 32}` matrix if `mat` is `{:f, 32}`, otherwise it is `{:f, 64}`.
+  """
+  @spec elementwise_math(maybe_mat_in(), atom()) :: maybe_mat_out()
+  def elementwise_math(mat, op) when is_atom(op) do
+    mat = __from_struct__(mat)
+
+    :evision_nif.mat_elementwise_math(img: mat, op: op)
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Raise each element of `base` to the power of the corresponding element of `exponent`.
+
+  The result has the same type as `base`.
+  """
+  @spec pow(maybe_mat_in(), maybe_mat_in()) :: maybe_mat_out()
+  def pow(base, exponent) do
+    base = __from_struct__(base)
+    exponent = __from_struct__(exponent)
+
+    :evision_nif.mat_pow(l: base, r: exponent)
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  @fused_unary_ops [:negate, :abs, :exp, :log, :sqrt]
+  @fused_binary_ops [:add, :subtract, :multiply, :divide, :min, :max, :pow]
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Evaluate an element-wise expression with one NIF call.
+
+  The expression is evaluated block by block in a single pass over memory (in parallel),
+  so no intermediate matrix is allocated for the sub-expressions.
+
+  ##### Positional Arguments
+  - **expr**: `term()`
+
+    A nested tuple of the following operations, whose leaves are `Evision.Mat`, `Nx.Tensor` or numbers:
+
+    - `{op, x}` where `op` is one of `:negate`, `:abs`, `:exp`, `:log` and `:sqrt`.
+    - `{op, x, y}` where `op` is one of `:add`, `:subtract`, `:multiply`, `:divide`, `:min`, `:max` and `:pow`.
+    - `{:clip, x, lower, upper}`
+
+    All matrices should have the same number of elements, or have only one element, in which case
+    the element is used for all elements of the other matrices.
+
+  ##### Keyword Arguments
+  - **type**: `mat_type()`
+
+    Type of the result. Defaults to the type of the first matrix in `expr`.
+
+  ##### Return
+  A matrix with the shape of the first matrix in `expr` that has more than one element.
+
+  ### Example
+
+      # clip((img - mean) * inv_std, 0, 1)
+      Evision.Mat.fused_elementwise(
+        {:clip, {:multiply, {:subtract, img, mean}, inv_std}, 0, 1},
+        type: :f32
+      )
+
+  """
+  @spec fused_elementwise(term(), Keyword.t()) :: maybe_mat_out()
+  def fused_elementwise(expr, opts \\ []) when is_list(opts) do
+    {instructions, inputs, _} = __compile_fused__(expr, {[], [], %{}})
+    {ops, args} = Enum.unzip(Enum.reverse(instructions))
+    inputs = Enum.reverse(inputs)
+
+    {t, l} =
+      case {opts[:type], inputs} do
+        {nil, [first | _]} -> type(first)
+        {nil, []} -> {:f, 64}
+        {type, _} -> check_unsupported_type(type)
+      end
+
+    :evision_nif.mat_fused_elementwise(inputs: inputs, ops: ops, args: args, t: t, l: l)
+    |> Evision.Internal.Structurise.to_struct()
+  end
+
+  defp __compile_fused__(number, {instructions, inputs, indices}) when is_number(number) do
+    {[{:const, number} | instructions], inputs, indices}
+  end
+
+  defp __compile_fused__({:clip, x, lower, upper}, acc) do
+    {instructions, inputs, indices} =
+      Enum.reduce([x, lower, upper], acc, &__compile_fused__/2)
+
+    {[{:clip, 0} | instructions], inputs, indices}
+  end
+
+  defp __compile_fused__({op, x}, acc) when op in @fused_unary_ops do
+    {instructions, inputs, indices} = __compile_fused__(x, acc)
+    {[{op, 0} | instructions], inputs, indices}
+  end
+
+  defp __compile_fused__({op, x, y}, acc) when op in @fused_binary_ops do
+    {instructions, inputs, indices} =
+      Enum.reduce([x, y], acc, &__compile_fused__/2)
+
+    {[{op, 0} | instructions], inputs, indices}
+  end
+
+  defp __compile_fused__(mat, {instructions, inputs, indices})
+       when is_struct(mat, T) or is_struct(mat, Nx.Tensor) or is_reference(mat) do
+    mat = __from_struct__(mat)
+
+    # the same matrix is only passed to the NIF once, no matter how many times it appears
+    case indices do
+      %{^mat => index} ->
+        {[{:input, index} | instructions], inputs, indices}
+
+      _ ->
+        index = map_size(indices)
+        {[{:input, index} | instructions], [mat | inputs], Map.put(indices, mat, index)}
+    end
+  end
+
+  defp __compile_fused__(expr, _acc) do
+    raise ArgumentError, "unsupported element-wise expression: #{inspect(expr)}"
+  end
+
   @doc """
   Transform an `Evision.Mat` to `Nx.tensor`.
 
@@ -1216,6 +1592,9 @@ defmodule Evision.Mat do
   If the input `Evision.Mat` represents a 2D image, the resulting tensor
   will have shape `{height, width, channels}`.
 
+  When `backend` is `Evision.Backend`, the resulting tensor shares the same
+  underlying data with the input `Evision.Mat`, i.e., no data is copied.
+
   ### Example
 
   ```elixir
@@ -1229,7 +1608,24 @@ defmodule Evision.Mat do
 
   """
   @spec to_nx(maybe_mat_in(), module()) :: Nx.Tensor.t() | {:error, String.t()}
-  def to_nx(mat, backend \\ Evision.Backend) when is_struct(mat, Evision.Mat) do
+  def to_nx(mat, backend \\ Evision.Backend)
+
+  def to_nx(%T{shape: shape} = mat, Evision.Backend) when tuple_size(shape) > 0 do
+    case channel_as_last_dim(mat) do
+      %T{} = mat ->
+        Evision.Backend.to_nx(mat, %Nx.Tensor{
+          data: nil,
+          type: mat.type,
+          shape: shape,
+          names: List.duplicate(nil, tuple_size(shape))
+        })
+
+      {:error, reason} ->
+        {:error, reason}
+    end
+  end
+
+  def to_nx(mat, backend) when is_struct(mat, Evision.Mat) do
     mat = __from_struct__(mat)
 
     with mat_type <- Evision.Mat.type(mat),
@@ -1264,8 +1660,20 @@ defmodule Evision.Mat do
   ##### Return
   An `Evision.Mat` that has the same shape and type.
   (except for `:s64`, `:u32` and `:u64`, please see more details at https://github.com/cocoa-xu/evision/issues/48).
+
+  If the tensor is on `Evision.Backend`, the underlying `Evision.Mat` is returned without copying any data.
+  Otherwise, the resulting `Evision.Mat` references the binary returned by `Nx.to_binary/1`.
   """
   @spec from_nx(Nx.t()) :: Evision.Mat.t() | {:error, String.t()}
+  def from_nx(%Nx.Tensor{data: %Evision.Backend{ref: mat}, shape: shape}) when tuple_size(shape) > 0 do
+    # the ref can have a different shape from the tensor, e.g., after `Nx.squeeze/2`
+    if mat.shape == shape do
+      mat
+    else
+      Evision.Mat.as_shape(mat, shape)
+    end
+  end
+
   def from_nx(t) when is_struct(t, Nx.Tensor) do
     case Nx.shape(t) do
       {} ->
@@ -1296,7 +1704,13 @@ defmodule Evision.Mat do
 
       shape ->
         if Tuple.product(shape) == Tuple.product(as_shape) do
-          Evision.Mat.from_binary_by_shape(Nx.to_binary(t), Nx.type(t), as_shape)
+          case t.data do
+            %Evision.Backend{ref: mat} ->
+              Evision.Mat.as_shape(mat, as_shape)
+
+            _ ->
+              Evision.Mat.from_binary_by_shape(Nx.to_binary(t), Nx.type(t), as_shape)
+          end
         else
           {:error,
            "cannot convert tensor(#{inspect(shape)}) to mat as shape #{inspect(as_shape)}"}
@@ -1538,8 +1952,9 @@ defmodule Evision.Mat do
     as_type(mat, check_unsupported_type(type))
   end
 
-  def as_type(mat, {t, l}) when is_atom(t) and l > 0 do
+  def as_type(mat, {t, l} = type) when is_atom(t) and l > 0 do
     mat = __from_struct__(mat)
+    {t, l} = check_unsupported_type(type)
 
     :evision_nif.mat_as_type(img: mat, t: t, l: l)
     |> Evision.Internal.Structurise.to_struct()
@@ -1730,6 +2145,14 @@ defmodule Evision.Mat do
   - otherwise, a new Evision.Mat that has dims=`[dims | channels]` will be returned
   """
   @spec channel_as_last_dim(maybe_mat_in()) :: maybe_mat_out()
+  def channel_as_last_dim(%T{dims: dims, shape: shape} = mat) when dims == tuple_size(shape) do
+    mat
+  end
+
+  def channel_as_last_dim(%T{shape: shape} = mat) do
+    Evision.Mat.as_shape(mat, shape)
+  end
+
   def channel_as_last_dim(mat) when is_struct(mat) do
     mat = Evision.Internal.Structurise.from_struct(mat)
     channel_as_last_dim(mat)
@@ -1890,6 +2313,89 @@ defmodule Evision.Mat do
     |> Evision.Internal.Structurise.to_struct()
   end
 
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Set the allocator used for the data of new matrices.
+
+  ##### Positional Arguments
+  - **allocator**: `:pooled | :default`
+
+    - `:pooled`: data is allocated with `enif_alloc`. Freed buffers are kept by size class and
+      reused by later matrices of a similar size, e.g., frames of a video.
+    - `:default`: OpenCV's default allocator. Idle buffers kept by the pool are freed.
+
+  ##### Keyword Arguments
+  - **max_cached_bytes**: `non_neg_integer()`
+
+    Upper bound of the total size of idle buffers kept by the pool. Defaults to 256 MiB.
+
+  ##### Return
+  `:ok`
+  """
+  @spec set_allocator(:pooled | :default, Keyword.t()) :: :ok | {:error, String.t()}
+  def set_allocator(allocator, opts \\ [])
+      when allocator in [:pooled, :default] and is_list(opts) do
+    :evision_nif.mat_set_allocator(
+      allocator: allocator,
+      max_cached_bytes: opts[:max_cached_bytes]
+    )
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Get the memory used by the data of live `Evision.Mat` resources.
+
+  The VM only sees the size of the resource struct of each `Evision.Mat`, so this
+  memory does not show up in `:erlang.memory/0`.
+
+  ##### Return
+  A map with the following keys:
+
+  - **live_bytes**: the sum of `total * elemSize` of all live `Evision.Mat` resources.
+    Matrices that share data, e.g., ROIs, are counted once per resource.
+  - **live_mats**: the number of live `Evision.Mat` resources.
+  - **peak_bytes**: the largest value of `live_bytes` so far.
+  - **high_water_mark**: the mark set by `set_memory_high_water/2`, or `nil`.
+  - **pool_cached_bytes**: idle buffers kept by the `:pooled` allocator, see `set_allocator/2`.
+  """
+  @spec memory_stats() :: %{
+          live_bytes: non_neg_integer(),
+          live_mats: non_neg_integer(),
+          peak_bytes: non_neg_integer(),
+          high_water_mark: non_neg_integer() | nil,
+          pool_cached_bytes: non_neg_integer()
+        }
+  def memory_stats() do
+    :evision_nif.mat_memory_stats()
+  end
+
+  @doc namespace: :"cv.Mat"
+  @doc """
+  Garbage collect all processes when the data held by `Evision.Mat` resources goes above `bytes`.
+
+  ##### Positional Arguments
+  - **bytes**: `pos_integer() | nil`
+
+    The high-water mark in bytes, see `memory_stats/0`. `nil` disables it.
+
+  ##### Keyword Arguments
+  - **notify**: `pid()`
+
+    Process that receives `{:evision_memory_high_water, live_bytes}` instead of
+    the default watcher, which garbage collects all processes.
+    The message is sent once when live bytes go above the mark, and again only after
+    they went back below it.
+
+  ##### Return
+  `:ok`
+  """
+  @spec set_memory_high_water(pos_integer() | nil, Keyword.t()) :: :ok | {:error, String.t()}
+  def set_memory_high_water(bytes, opts \\ [])
+      when (is_nil(bytes) or (is_integer(bytes) and bytes > 0)) and is_list(opts) do
+    pid = opts[:notify] || Process.whereis(Evision.Internal.MemoryWatcher)
+    :evision_nif.mat_set_memory_high_water(bytes: bytes, pid: pid)
+  end
+
   @spec to_batched(maybe_mat_in(), non_neg_integer(), Keyword.t()) :: maybe_mat_out()
   def to_batched(mat, batch_size, opts)
       when is_integer(batch_size) and batch_size >= 1 and is_list(opts) do
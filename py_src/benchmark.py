@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark `BeamWrapperGenerator.gen` on the header snapshot in test/testdata/gen2.
+
+Each run generates the bindings into a new temporary directory and reports the wall time
+of every step of `gen` (see `BeamWrapperGenerator.begin_phase`), plus the time spent
+rendering inline docs and writing files, which happen across several steps. Peak memory
+is measured with `tracemalloc` in a separate run so that tracing does not skew the timings.
+
+    python3 py_src/benchmark.py --repeat 5
+    python3 py_src/benchmark.py --profile gen2.pstats --profile_limit 40
+
+The headers are resolved against `--fixtures`, one path per line in `headers.txt`.
+"""
+
+import argparse
+import cProfile
+import pstats
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from func_variant import FuncVariant
+from gen2 import BeamWrapperGenerator
+
+
+py_src_dir = Path(__file__).resolve().parent
+default_fixtures_dir = py_src_dir.parent / 'test' / 'testdata' / 'gen2'
+default_modules = ['calib3d', 'core', 'features2d', 'flann', 'highgui', 'imgcodecs', 'imgproc', 'ml', 'photo',
+                   'stitching', 'ts', 'video', 'videoio', 'dnn']
+
+
+class PhaseRecorder(object):
+    """
+    Records the wall time, and optionally the peak of traced memory, of each step of `gen`.
+
+    Steps are reported by `BeamWrapperGenerator.begin_phase`, a step ends when the next one
+    begins or when `finish` is called.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.current = None
+        self.started_at = 0
+        self.wall_times = {}
+        self.peak_bytes = {}
+
+    def begin(self, name):
+        now = time.perf_counter()
+        if self.current is not None:
+            self.wall_times[self.current] = self.wall_times.get(self.current, 0) + now - self.started_at
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                self.peak_bytes[self.current] = max(self.peak_bytes.get(self.current, 0), peak)
+                tracemalloc.reset_peak()
+        self.current = name
+        self.started_at = time.perf_counter()
+
+    def finish(self):
+        self.begin(None)
+
+
+class CumulativeTimer(object):
+    """
+    Wraps a method of a class to add up the wall time spent in it.
+
+    Nested calls, e.g., recursive ones, are only counted once.
+    """
+
+    def __init__(self, cls, method_name):
+        self.cls = cls
+        self.method_name = method_name
+        self.method = getattr(cls, method_name)
+        self.total = 0
+        self.depth = 0
+
+    def __enter__(self):
+        method = self.method
+        timer = self
+
+        def timed(*args, **kwargs):
+            timer.depth += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timer.depth -= 1
+                if timer.depth == 0:
+                    timer.total += time.perf_counter() - start
+
+        setattr(self.cls, self.method_name, timed)
+        return self
+
+    def __exit__(self, *exc_info):
+        setattr(self.cls, self.method_name, self.method)
+        return False
+
+
+def load_headers(fixtures_dir):
+    with open(fixtures_dir / 'headers.txt', 'rt') as f:
+        return [str(fixtures_dir / line.strip()) for line in f if len(line.strip()) > 0]
+
+
+def run_once(args, srcfiles, recorder=None, profiler=None):
+    """
+    Generate the bindings of `srcfiles` into a temporary directory.
+
+    Returns the wall time of each step, the time spent rendering docs and writing files,
+    and the peak of traced memory of each step if `recorder` traces memory.
+    """
+    if recorder is None:
+        recorder = PhaseRecorder()
+    with tempfile.TemporaryDirectory(prefix='evision-gen2-') as tmpdir:
+        c_src = Path(tmpdir) / 'c_src'
+        elixir_gen = Path(tmpdir) / 'lib'
+        erlang_gen = Path(tmpdir) / 'src'
+        # `gen` reads the annotations of hand-written NIFs from `c_src/modules`
+        shutil.copytree(py_src_dir.parent / 'c_src' / 'modules', c_src / 'modules')
+        elixir_gen.mkdir()
+        erlang_gen.mkdir()
+
+        generator = BeamWrapperGenerator(args.modules, args.lang, '', None, args.jobs)
+        generator.phase_hook = recorder.begin
+        with CumulativeTimer(FuncVariant, 'inline_docs') as docs_timer, \
+                CumulativeTimer(BeamWrapperGenerator, 'write_if_changed') as write_timer:
+            if profiler is not None:
+                profiler.enable()
+            generator.gen(srcfiles, str(c_src), str(elixir_gen), str(erlang_gen))
+            recorder.finish()
+            if profiler is not None:
+                profiler.disable()
+    return {
+        'wall_times': recorder.wall_times,
+        'docs': docs_timer.total,
+        'write_files': write_timer.total,
+        'peak_bytes': recorder.peak_bytes,
+    }
+
+
+def max_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def report(runs, memory_run):
+    phases = list(runs[0]['wall_times'].keys())
+    rows = [(phase, [run['wall_times'][phase] for run in runs], memory_run['peak_bytes'].get(phase)) for phase in phases]
+    rows.append(('total', [sum(run['wall_times'].values()) for run in runs], max(memory_run['peak_bytes'].values())))
+    rows.append(('  rendering docs', [run['docs'] for run in runs], None))
+    rows.append(('  writing files', [run['write_files'] for run in runs], None))
+
+    print(f"{'phase':<18} {'min (s)':>10} {'median (s)':>12} {'peak (MiB)':>12}")
+    for name, times, peak in rows:
+        peak = '-' if peak is None else f'{peak / 1024 / 1024:.1f}'
+        print(f'{name:<18} {min(times):>10.3f} {statistics.median(times):>12.3f} {peak:>12}')
+    max_rss = max_rss_bytes()
+    if max_rss is not None:
+        print(f'max RSS: {max_rss / 1024 / 1024:.1f} MiB')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the code generator on a fixed header snapshot")
+    parser.add_argument("--fixtures", type=str, default=str(default_fixtures_dir), help="Path to the dir of the header snapshot and its headers.txt")
+    parser.add_argument("--lang", type=str, default='elixir,erlang', help="Comma-seperated values. erlang,elixir")
+    parser.add_argument("--modules", type=str, default='', help="Comma-seperated values.")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of processes used to parse headers")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs")
+    parser.add_argument("--profile", type=str, default='', help="Path to write the pstats of an extra run under cProfile to. Profiling is disabled if empty")
+    parser.add_argument("--profile_limit", type=int, default=30, help="Number of functions printed from the profile, sorted by cumulative time")
+    args = parser.parse_args()
+
+    args.lang = [l.lower().strip() for l in args.lang.split(",")]
+    args.modules = args.modules.split(",") if len(args.modules) > 0 else default_modules
+    srcfiles = load_headers(Path(args.fixtures).resolve())
+
+    runs = [run_once(args, srcfiles) for _ in range(max(args.repeat, 1))]
+
+    tracemalloc.start()
+    memory_run = run_once(args, srcfiles, PhaseRecorder(trace_memory=True))
+    tracemalloc.stop()
+
+    print(f'{len(srcfiles)} headers from {args.fixtures}, {len(runs)} runs')
+    report(runs, memory_run)
+
+    if len(args.profile) > 0:
+        profiler = cProfile.Profile()
+        run_once(args, srcfiles, profiler=profiler)
+        profiler.dump_stats(args.profile)
+        print(f'\nprofile written to {args.profile}')
+        pstats.Stats(args.profile).sort_stats('cumulative').print_stats(args.profile_limit)
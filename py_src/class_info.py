@@ -93,7 +93,7 @@ class ClassInfo(object):
     def gen_map_code(self, codegen):
         all_classes = codegen.classes
         code = "static bool evision_to(ErlNifEnv *env, ERL_NIF_TERM src, %s& dst, const ArgInfo& info)\n{\n    ERL_NIF_TERM tmp;\n    bool ok;\n" % (self.cname)
-        code += "".join([ET.gen_template_set_prop_from_map.substitute(propname=p.name,proptype=p.tp) for p in self.props])
+        code += "".join([ET.gen_template_set_prop_from_map.substitute(propname=p.name,proptype=p.tp,kw_index=codegen.get_kw_index(p.name)) for p in self.props])
         if self.base:
             code += "\n    return evision_to_safe(env, src, (%s&)dst, info); // gen_template_set_prop_from_map!\n}\n" % all_classes[self.base].cname
         else:
@@ -125,11 +125,7 @@ class ClassInfo(object):
                     base_class = codegen.classes[current_class.base]
                     for base_method_name in base_class.methods:
                         if base_method_name not in methods:
-                            base_method = base_class.methods[base_method_name].__deepcopy__()
-                            base_method.classname = self.name
-                            for v in base_method.variants:
-                                v.classname = self.name
-                            methods[base_method_name] = base_method
+                            methods[base_method_name] = base_class.methods[base_method_name].as_inherited(self.name)
                         else:
                             # print(self.cname, "overrides base method:", base_method_name)
                             _ = 0
@@ -221,6 +217,7 @@ class ClassInfo(object):
                         getset_code.write(ET.gen_template_set_prop_cv_ptr.substitute(
                             name=self.name,
                             member=pname,
+                            kw_index=codegen.get_kw_index(pname),
                             membertype=p.tp,
                             access=access_op,
                             cname=self.cname,
@@ -110,3 +110,62 @@ class ErlEnumExpressionGenerator(ast.NodeVisitor):
             else:
                 print(type(node), "not implemented yet")
                 sys.exit(1)
+
+
+enum_type_values = {
+    'CV_8U': 0, 'CV_8S': 1, 'CV_16U': 2, 'CV_16S': 3,
+    'CV_32S': 4, 'CV_32F': 5, 'CV_64F': 6, 'CV_16F': 7,
+}
+
+
+def evaluate_enum_expression(node, values):
+    """
+    Evaluate the expression of an enum value to a number at generation time.
+
+    `values` maps the names of the constants generated so far to their values.
+    Returns None if the expression refers to an unknown name or uses an unsupported operator.
+    """
+    if type(node) is ast.Expression:
+        return evaluate_enum_expression(node.body, values)
+    elif type(node) is ast.Constant:
+        if node.value in ['I', 'Y', 'U', 'V', 'N']:
+            return ord(node.value)
+        if type(node.value) in (int, float):
+            return node.value
+        return None
+    elif type(node) is ast.Name:
+        if node.id[:3] == 'CV_':
+            return enum_type_values.get(node.id, None)
+        return values.get(node.id, None)
+    elif type(node) is ast.UnaryOp:
+        operand = evaluate_enum_expression(node.operand, values)
+        if operand is None:
+            return None
+        if type(node.op) is ast.USub:
+            return -operand
+        if type(node.op) is ast.Invert and type(operand) is int:
+            return ~operand
+        return None
+    elif type(node) is ast.BinOp:
+        lhs = evaluate_enum_expression(node.left, values)
+        rhs = evaluate_enum_expression(node.right, values)
+        if lhs is None or rhs is None:
+            return None
+        op = type(node.op)
+        if op is ast.Add:
+            return lhs + rhs
+        elif op is ast.Sub:
+            return lhs - rhs
+        elif op is ast.Mult:
+            return lhs * rhs
+        elif type(lhs) is not int or type(rhs) is not int:
+            return None
+        elif op is ast.LShift:
+            return lhs << rhs
+        elif op is ast.RShift:
+            return lhs >> rhs
+        elif op is ast.BitAnd:
+            return lhs & rhs
+        elif op is ast.BitOr:
+            return lhs | rhs
+    return None
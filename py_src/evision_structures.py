@@ -64,6 +64,129 @@ videocapture_struct_elixir = '  @typedoc """\n' + \
   def __to_struct__(pass_through) do
     Evision.Internal.Structurise.to_struct(pass_through)
   end
+
+""" + \
+  '  @doc """\n' + \
+"""  Stream frames of a video capture.
+
+  Frames are decoded by a native thread into a buffer of at most `:buffer` frames,
+  in parallel with the consumer of the stream. The capture should not be used
+  by other calls while it is being streamed.
+
+  ##### Keyword Arguments
+  - **buffer**: `pos_integer()`
+
+    Maximum number of decoded frames waiting to be consumed. Defaults to `4`.
+
+  - **mode**: `:block | :drop_oldest | :drop_newest`
+
+    What the decode thread does when the buffer is full.
+
+    - `:block` (default): wait until the consumer takes a frame, i.e., back-pressure.
+    - `:drop_oldest`: drop the oldest buffered frame, which keeps the latest frames of a live source.
+    - `:drop_newest`: drop the new frame.
+
+  - **skip**: `non_neg_integer()`
+
+    Number of frames grabbed without decoding after each decoded frame. Defaults to `0`.
+
+  ##### Return
+  A `Stream` of `Evision.Mat`. It halts at the end of the video, and the decode thread is
+  stopped when the stream is done or halted.
+
+  ### Example
+
+      cap = Evision.VideoCapture.videoCapture("video.mp4")
+
+      cap
+      |> Evision.VideoCapture.stream(buffer: 8)
+      |> Stream.map(&Evision.cvtColor(&1, Evision.Constant.cv_COLOR_BGR2GRAY()))
+      |> Enum.count()
+
+""" + \
+  '  """\n' + \
+"""  @spec stream(t(), Keyword.t()) :: Enumerable.t()
+  def stream(cap = %T{}, opts \\\\ []) when is_list(opts) do
+    buffer = opts[:buffer] || 4
+    mode = opts[:mode] || :block
+    skip = opts[:skip] || 0
+
+    Stream.resource(
+      fn ->
+        case :evision_nif.videoCapture_stream_start(cap: cap.ref, buffer: buffer, mode: mode, skip: skip) do
+          {:error, msg} -> raise RuntimeError, msg
+          stream -> stream
+        end
+      end,
+      fn stream ->
+        case :evision_nif.videoCapture_stream_next(stream: stream) do
+          :eof -> {:halt, stream}
+          {:error, msg} -> raise RuntimeError, msg
+          frame -> {[Evision.Internal.Structurise.to_struct(frame)], stream}
+        end
+      end,
+      fn stream -> :evision_nif.videoCapture_stream_stop(stream: stream) end
+    )
+  end
+
+""" + \
+  '  @doc """\n' + \
+"""  Create a poller that waits on a fixed set of video captures without blocking a scheduler.
+
+  Returns `{poller, ref}`. Each call to `poll/2` makes the poller wait once for any of the
+  captures to be ready, after which the owner process receives
+  `{:evision_videocapture_ready, ref, ready_indices}`. `ready_indices` is empty on timeout.
+
+  Frames should be retrieved from the ready captures before calling `poll/2` again.
+
+  ##### Keyword Arguments
+
+  - **owner**: `pid()`.
+
+    The process to notify, defaults to the calling process.
+
+  ### Example
+
+      {poller, ref} = Evision.VideoCapture.poller(cameras)
+      :ok = Evision.VideoCapture.poll(poller, 100_000_000)
+
+      receive do
+        {:evision_videocapture_ready, ^ref, ready} ->
+          Enum.map(ready, &Evision.VideoCapture.retrieve(Enum.at(cameras, &1)))
+      end
+
+""" + \
+  '  """\n' + \
+"""  @spec poller([t()], Keyword.t()) :: {reference(), reference()} | {:error, String.t()}
+  def poller(caps, opts \\\\ []) when is_list(caps) and is_list(opts) do
+    streams = Enum.map(caps, fn %T{ref: ref} -> ref end)
+    :evision_nif.videoCapture_poller_new(streams: streams, owner: opts[:owner])
+  end
+
+""" + \
+  '  @doc """\n' + \
+"""  Make `poller` wait once for any of its captures to be ready, for at most `timeout_ns` nanoseconds.
+
+  The owner of the poller is notified with `{:evision_videocapture_ready, ref, ready_indices}`.
+  A timeout of `0` waits until a capture is ready or the poller is stopped.
+
+""" + \
+  '  """\n' + \
+"""  @spec poll(reference(), integer()) :: :ok | {:error, String.t()}
+  def poll(poller, timeout_ns) when is_integer(timeout_ns) do
+    :evision_nif.videoCapture_poller_arm(poller: poller, timeoutNs: timeout_ns)
+  end
+
+""" + \
+  '  @doc """\n' + \
+"""  Stop `poller`, no more messages are sent after it returns.
+
+""" + \
+  '  """\n' + \
+"""  @spec stop_poller(reference()) :: :ok
+  def stop_poller(poller) do
+    :evision_nif.videoCapture_poller_stop(poller: poller)
+  end
 """
 
 videocapture_struct_erlang = """
@@ -73,6 +196,35 @@ videocapture_struct_erlang = """
   };
 '__to_struct__'(Any) ->
     evision_internal_structurise:to_struct(Any).
+
+stream_start(#evision_videocapture{ref = Ref}, Opts) when is_list(Opts) ->
+    evision_nif:videoCapture_stream_start([
+        {cap, Ref},
+        {buffer, proplists:get_value(buffer, Opts, 4)},
+        {mode, proplists:get_value(mode, Opts, block)},
+        {skip, proplists:get_value(skip, Opts, 0)}
+    ]).
+
+stream_next(Stream) ->
+    evision_internal_structurise:to_struct(evision_nif:videoCapture_stream_next([{stream, Stream}])).
+
+stream_stop(Stream) ->
+    evision_nif:videoCapture_stream_stop([{stream, Stream}]).
+
+poller(Caps) ->
+    poller(Caps, []).
+
+poller(Caps, Opts) when is_list(Caps), is_list(Opts) ->
+    evision_nif:videoCapture_poller_new([
+        {streams, [Ref || #evision_videocapture{ref = Ref} <- Caps]},
+        {owner, proplists:get_value(owner, Opts, nil)}
+    ]).
+
+poll(Poller, TimeoutNs) when is_integer(TimeoutNs) ->
+    evision_nif:videoCapture_poller_arm([{poller, Poller}, {timeoutNs, TimeoutNs}]).
+
+stop_poller(Poller) ->
+    evision_nif:videoCapture_poller_stop([{poller, Poller}]).
 """
 
 gpumat_struct_elixir = '  @typedoc """\n' + \
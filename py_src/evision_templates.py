@@ -242,21 +242,21 @@ code_ret_as_binary = """if (retval) {
                     return evision::nif::error(env, \"out of memory\");
                 }
             } else {
-                return evision::nif::atom(env, \"false\");
+                return evision::nif::atom_false;
             }"""
 
 code_ret_1_tuple_except_bool = """if (retval) {
                 // code_ret_1_tuple_except_bool
                 return %s;
             } else {
-                return evision::nif::atom(env, \"false\");
+                return evision::nif::atom_false;
             }"""
 
 code_ret_2_to_10_tuple_except_bool = """if (retval) {
                 // code_ret_2_to_10_tuple_except_bool
                 return enif_make_tuple%d(env, %s);
             } else {
-                return evision::nif::atom(env, \"false\");
+                return evision::nif::atom_false;
             }"""
 
 code_ret_ge_10_tuple_except_bool = """ERL_NIF_TERM arr[] = {%s};
@@ -264,7 +264,7 @@ code_ret_ge_10_tuple_except_bool = """ERL_NIF_TERM arr[] = {%s};
             if (retval) {
                 return enif_make_tuple_from_array(env, arr, %d);
             } else {
-                return evision::nif::atom(env, \"false\");
+                return evision::nif::atom_false;
             }"""
 
 code_ret_lt_10_tuple = "return enif_make_tuple%d(env, %s)"
@@ -322,6 +322,44 @@ enabled_modules_code = Template("""
   end
 """)
 
+# constants whose value is known when generating the bindings.
+# `Evision.Constant.cv/1` expands to the value at compile time, and the `cv_*`
+# functions are kept so that existing code keeps working.
+constant_literals_elixir = Template("""
+  @constants %{${constants}
+  }
+
+  @doc \"\"\"
+  Get the value of the constant `name`, e.g., `Evision.Constant.value(:COLOR_BGR2GRAY)`.
+  \"\"\"
+  @spec value(atom()) :: number()
+  def value(name) when is_atom(name), do: Map.fetch!(@constants, name)
+
+  @doc \"\"\"
+  Expands to the value of the constant `name` at compile time.
+
+  Unlike `cv_*` functions, this costs nothing at runtime.
+
+      require Evision.Constant
+      Evision.cvtColor(mat, Evision.Constant.cv(:COLOR_BGR2GRAY))
+
+  \"\"\"
+  defmacro cv(name) when is_atom(name), do: Map.fetch!(@constants, name)
+
+  for {name, value} <- @constants do
+    def unquote(:"cv_#{name}")(), do: unquote(value)
+  end
+
+""")
+
+# template for `evision_constant:value/1`
+constant_literals_erlang = Template("""
+value(Name) when is_atom(Name) ->
+    maps:get(Name, #{${constants}
+    }).
+
+""")
+
 # template for `evision:enabled_modules/0`
 enabled_modules_code_erlang = Template("""
 enabled_modules() ->
@@ -368,6 +406,30 @@ gen_template_simple_call_constructor = Template("""new (&(self->val)) ${cname}${
 
 gen_template_parse_args = Template("if( $code_cvt )")
 
+gen_template_parse_kw = Template("""    using namespace ${namespace};
+    int error_flag = false;
+    ERL_NIF_TERM error_term = 0;
+${code_kw_table}    size_t num_kw_args = 0;
+    const int nif_opts_index = ${nif_opts_index};
+    if (nif_opts_index < argc) {
+        evision_parse_kw(env, argv[nif_opts_index], kw_table, num_kw, kw_args, num_kw_args);
+    }
+""")
+
+gen_template_kw_table = Template("""    static const size_t kw_table[${num_kw}] = {${kw_table}};
+    const size_t num_kw = ${num_kw};
+    ERL_NIF_TERM kw_args[${num_kw}];
+""")
+
+gen_template_kw_kinds = """    int kw_kinds[num_kw];
+    evision_term_kinds(env, kw_args, num_kw, kw_kinds);
+"""
+
+gen_template_empty_kw_table = """    const size_t * kw_table = nullptr;
+    const size_t num_kw = 0;
+    ERL_NIF_TERM * kw_args = nullptr;
+"""
+
 gen_template_func_body = Template("""$code_decl
     $code_parse
     {
@@ -429,9 +491,9 @@ template<> bool evision_to(ErlNifEnv *env, ERL_NIF_TERM src, ${cname}& dst, cons
 """)
 
 gen_template_set_prop_from_map = Template("""
-    if( enif_get_map_value(env, src, evision::nif::atom(env, "$propname"), &tmp) )
+    if( enif_get_map_value(env, src, evision_kw_atoms[$kw_index], &tmp) )
     {
-        ok = evision_to_safe(env, tmp, dst.$propname, ArgInfo("$propname", false));
+        ok = evision_to_safe(env, tmp, dst.$propname, ArgInfo("$propname", false, false, true));
         if(!ok) return false;
     }""")
 
@@ -501,7 +563,7 @@ static ERL_NIF_TERM evision_${name}_set_${member}(ErlNifEnv *env, int argc, cons
         return failmsgp(env, "cannot get `${storage_name}` from `self`: mismatched type or invalid resource?");
     }
 
-    if (evision_to_safe(env, argv[1], self_ptr->${member}, ArgInfo("${member}", false))) {
+    if (evision_to_safe(env, argv[1], self_ptr->${member}, ArgInfo("${member}", false, false, true))) {
         bool success;
         return evision_from_as_map<${storage_name}>(env, *self_ptr, self, "Elixir.Evision.${elixir_module_name}", success);
     }
@@ -522,10 +584,12 @@ static ERL_NIF_TERM evision_${name}_set_${member}(ErlNifEnv *env, int argc, cons
 
     ${storage_name} &_self_ = *self_ptr;
 
-    std::map<std::string, ERL_NIF_TERM> erl_terms;
-    evision::nif::parse_arg(env, 1, argv, erl_terms);
+    static const size_t kw_table[1] = {${kw_index}};
+    ERL_NIF_TERM kw_args[1];
+    size_t num_kw_args = 0;
+    evision_parse_kw(env, argv[1], kw_table, 1, kw_args, num_kw_args);
 
-    if (evision_to_safe(env, evision_get_kw(env, erl_terms, "${member}"), _self_${access}${member}, ArgInfo("${member}", false))) {
+    if (evision_to_safe(env, kw_args[0], _self_${access}${member}, ArgInfo("${member}", false, false, true))) {
         bool success;
         return evision_from_as_map<${storage_name}>(env, _self_, self, "Elixir.Evision.${elixir_module_name}", success);
     }
@@ -548,7 +612,7 @@ static ERL_NIF_TERM evision_${name}_set_${member}(ErlNifEnv *env, int argc, cons
         return failmsgp(env, "Incorrect type of object (must be '${name}' or its derivative)");
     }
 
-    if (evision_to_safe(env, argv[1], _self_algo_${access}${member}, ArgInfo("${member}", false))) {
+    if (evision_to_safe(env, argv[1], _self_algo_${access}${member}, ArgInfo("${member}", false, false, true))) {
         bool success;
         return evision_from_as_map<${storage_name}>(env, *self_ptr, self, "Elixir.Evision.${elixir_module_name}", success);
     }
@@ -568,3 +632,40 @@ gen_template_overloaded_function_call = Template("""
 ${variant}
     }
 """)
+
+gen_template_batch_func_body = Template("""$code_decl
+    if ($code_cvt)
+    {
+        error_flag = false;
+        const int batch_size = static_cast<int>(${mat_in}.size());
+        std::vector<Mat> ${mat_out}(batch_size);
+        ${code_retval_decl}std::vector<std::string> batch_errors(batch_size);
+        // each item reports its own error, so that no exception crosses the threads of `parallel_for_`
+        ERRWRAP2(cv::parallel_for_(cv::Range(0, batch_size), [&](const cv::Range& batch_range) {
+            for (int batch_index = batch_range.start; batch_index < batch_range.end; batch_index++) {
+                try {
+                    ${code_fcall};
+                } catch (const cv::Exception &e) {
+                    batch_errors[batch_index] = e.msg;
+                } catch (const std::exception &e) {
+                    batch_errors[batch_index] = e.what();
+                } catch (...) {
+                    batch_errors[batch_index] = "Unknown C++ exception from OpenCV code";
+                }
+            }
+        }), env, error_flag, error_term);
+        if (!error_flag) {
+            for (int batch_index = 0; batch_index < batch_size; batch_index++) {
+                if (!batch_errors[batch_index].empty()) {
+                    return evision::nif::error(env, batch_errors[batch_index].c_str());
+                }
+            }
+            $code_ret;
+        }
+    }
+
+    if (error_flag != false) return error_term;
+    else return enif_make_badarg(env);
+}
+
+""")
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 
-def evision_elixir_fixes(): 
+def evision_elixir_fixes():
     return [
         """
     @spec imdecode(binary(), integer()) :: Evision.Mat.maybe_mat_out()
@@ -15,7 +15,52 @@ def evision_elixir_fixes():
         :evision_nif.imdecode(positional)
         |> Evision.Internal.Structurise.to_struct()
     end
-"""
+""",
+        '''
+    @doc """
+    Encode an image into a binary, like `Evision.imencode/2,3`.
+
+    The image is encoded into a scratch buffer kept by each scheduler thread and copied once
+    into a binary of the exact size, which makes it suitable for serving frames, e.g., MJPEG.
+
+    ##### Keyword Arguments
+
+    - **quality**: `integer()`.
+
+      Quality of `.jpg`, `.jpeg`, `.jpe` and `.webp` images.
+
+    - **params**: `[integer()]`.
+
+      Format-specific parameters, see `Evision.imencode/3`.
+
+    """
+    @spec imencode_binary(String.t(), Evision.Mat.maybe_mat_in(), Keyword.t()) :: binary() | {:error, String.t()}
+    def imencode_binary(ext, img, opts \\\\ []) when is_binary(ext) and is_list(opts)
+    do
+        :evision_nif.imencode_binary(
+            ext: ext,
+            img: Evision.Internal.Structurise.from_struct(img),
+            quality: opts[:quality],
+            params: opts[:params]
+        )
+    end
+
+    @doc """
+    Encode images into binaries in parallel with `cv::parallel_for_`, see `imencode_binary/3`.
+
+    Returns a list of binaries in the order of `imgs`, or the first error.
+    """
+    @spec imencode_binary_batch(String.t(), [Evision.Mat.maybe_mat_in()], Keyword.t()) :: [binary()] | {:error, String.t()}
+    def imencode_binary_batch(ext, imgs, opts \\\\ []) when is_binary(ext) and is_list(imgs) and is_list(opts)
+    do
+        :evision_nif.imencode_binary_batch(
+            ext: ext,
+            imgs: Enum.map(imgs, &Evision.Internal.Structurise.from_struct/1),
+            quality: opts[:quality],
+            params: opts[:params]
+        )
+    end
+'''
     ]
 
 
@@ -25,5 +70,28 @@ def evision_erlang_fixes():
 imdecode(Buf, Flags) ->
   Ret = evision_nif:imdecode([{buf, Buf}, {flags, Flags}]),
   evision_internal_structurise:to_struct(Ret).
+""",
+        """
+imencode_binary(Ext, Img) ->
+  imencode_binary(Ext, Img, []).
+
+imencode_binary(Ext, Img, Opts) when is_list(Opts) ->
+  evision_nif:imencode_binary([
+    {ext, Ext},
+    {img, evision_internal_structurise:from_struct(Img)},
+    {quality, proplists:get_value(quality, Opts, nil)},
+    {params, proplists:get_value(params, Opts, nil)}
+  ]).
+
+imencode_binary_batch(Ext, Imgs) ->
+  imencode_binary_batch(Ext, Imgs, []).
+
+imencode_binary_batch(Ext, Imgs, Opts) when is_list(Imgs), is_list(Opts) ->
+  evision_nif:imencode_binary_batch([
+    {ext, Ext},
+    {imgs, [evision_internal_structurise:from_struct(Img) || Img <- Imgs]},
+    {quality, proplists:get_value(quality, Opts, nil)},
+    {params, proplists:get_value(params, Opts, nil)}
+  ]).
 """
     ]
@@ -31,6 +31,16 @@ class FuncInfo(object):
         copy_info.variants = copy.deepcopy(self.variants)
         return copy_info
 
+    def as_inherited(self, classname):
+        """
+        This method as a method of the derived class `classname`.
+
+        The variants are views over the variants of this method, see `FuncVariant.as_inherited`.
+        """
+        inherited = FuncInfo(classname, self.name, self.cname, self.isconstructor, self.namespace, self.is_static)
+        inherited.variants = [v.as_inherited(classname) for v in self.variants]
+        return inherited
+
     def add_variant(self, decl, isphantom=False):
         self.variants.append(FuncVariant(self.classname, self.name, decl, self.isconstructor, isphantom=isphantom))
 
@@ -56,6 +66,40 @@ class FuncInfo(object):
         erl_name, full_fname = self.get_wrapper_name(add_cv)
         return "static ERL_NIF_TERM %s(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[])" % (full_fname,), erl_name, full_fname
 
+    def is_cheap(self):
+        """
+        Getters, setters and metadata queries whose inputs and outputs are all small and fixed-size
+        can run on a normal scheduler, as they finish well within a timeslice.
+
+        Only property accessors of an instance qualify. Free functions and static methods with
+        the same names, e.g., `setNumThreads` and `ocl::setUseOpenCL`, change global state or
+        initialise a runtime.
+        """
+        if self.isconstructor or self.is_static or not self.classname:
+            return False
+        namespace = f'{self.namespace}.'
+        if any(namespace.startswith(f'{ns}.') for ns in non_cheap_namespaces()):
+            return False
+        if not cheap_func_name_re().match(self.name):
+            return False
+        small_types = small_fixed_size_types()
+        for v in self.variants:
+            if v.rettype and v.rettype not in small_types:
+                return False
+            for a in v.args:
+                if a.tp not in small_types:
+                    return False
+        return True
+
+    def get_nif_bound(self, fname):
+        if fname.endswith('_read') or fname.endswith('_load_static') or \
+                fname.endswith('_write') or fname.endswith('_save') or \
+                fname in io_bound_funcs():
+            return 'io'
+        if self.is_cheap():
+            return None
+        return 'cpu'
+
     def get_tab_entry(self):
         prototype_list = []
         docstring_list = []
@@ -101,14 +145,130 @@ class FuncInfo(object):
             return ""
         if fname in special_handling_funcs():
             return ""
-        if fname.endswith('_read') or fname.endswith('_load_static') or \
-                fname.endswith('_write') or fname.endswith('_save') or \
-                fname in io_bound_funcs():
+        bound = self.get_nif_bound(fname)
+        if bound == 'io':
             nif_function_decl = f'    F_IO({erl_name}, {fname}, {func_arity}),\n'
-        else:
+        elif bound == 'cpu':
             nif_function_decl = f'    F_CPU({erl_name}, {fname}, {func_arity}),\n'
+        else:
+            nif_function_decl = f'    F({erl_name}, {fname}, {func_arity}),\n'
         return nif_function_decl
 
+    def get_batch_wrapper_name(self):
+        erl_name, fname = self.get_wrapper_name(True)
+        return f'{erl_name}_batch', f'{fname}_batch'
+
+    def is_enum_type(self, codegen, tp):
+        tp_candidates = [tp, normalize_class_name(self.namespace + "." + tp), normalize_class_name(self.classname + "." + tp)]
+        return any(tp in codegen.enums.keys() for tp in tp_candidates)
+
+    def get_batch_variant(self, codegen):
+        """
+        The variant that the `_batch` NIF of this function runs on each matrix of a list, or `None`.
+
+        Only free functions listed in `batch_funcs()` are batched, and only if exactly one of their
+        variants takes one input `Mat`, writes one output `Mat`, otherwise takes small fixed-size
+        values or enums, and returns nothing or a number.
+        """
+        if self.classname or self.isconstructor:
+            return None
+        _, fname = self.get_wrapper_name(True)
+        if fname not in batch_funcs():
+            return None
+
+        candidates = []
+        small_types = small_fixed_size_types()
+        for v in self.variants:
+            if v.isphantom or v.rettype not in ['', 'int', 'float', 'double']:
+                continue
+            mats_in = [a for a in v.args if a.tp == 'Mat' and a.inputarg and not a.outputarg]
+            mats_out = [a for a in v.args if a.tp == 'Mat' and a.outputarg and not a.inputarg]
+            others = [a for a in v.args if a.tp != 'Mat']
+            if len(mats_in) == 1 and len(mats_out) == 1 and len(others) + 2 == len(v.args) and \
+                    all(a.inputarg and not a.outputarg and (a.tp in small_types or self.is_enum_type(codegen, a.tp)) for a in others):
+                candidates.append(v)
+        if len(candidates) != 1:
+            return None
+        return candidates[0]
+
+    def get_batch_tab_entry(self):
+        erl_name, fname = self.get_batch_wrapper_name()
+        return f'    F_CPU({erl_name}, {fname}, 1),\n'
+
+    def gen_batch_code(self, codegen):
+        """
+        The `_batch` NIF runs the batched variant on each matrix in the list given as the input
+        matrix, in parallel with `cv::parallel_for_`, and converts all other arguments only once.
+        """
+        v = self.get_batch_variant(codegen)
+        if v is None:
+            return ""
+        _, fname = self.get_batch_wrapper_name()
+
+        kw_slots = {}
+        code_decl = ""
+        code_cvt_list = []
+        code_args = []
+        mat_in = None
+        mat_out = None
+        if v.min_args > 0:
+            code_cvt_list.append(f"num_kw_args >= {v.min_args}")
+        for a in v.args:
+            if a.tp == 'Mat':
+                code_args.append(f"{a.name}[batch_index]")
+                if a.outputarg:
+                    mat_out = a.name
+                    continue
+                mat_in = a.name
+                code_decl += f"    std::vector<Mat> {a.name};\n"
+                defval = ""
+            else:
+                arg_type_info = simple_argtype_mapping.get(a.tp, ArgTypeInfo(a.tp, FormatStrings.object, "", True, False))
+                atype = arg_type_info.atype
+                defval = a.defval or arg_type_info.default_value or ""
+                if self.is_enum_type(codegen, a.tp):
+                    atype = f"std::underlying_type_t<{a.tp}>"
+                    defval = f"static_cast<{atype}>({a.defval or 0})"
+                    code_args.append(f"static_cast<{a.tp}>({a.name})")
+                else:
+                    code_args.append(a.name)
+                if defval:
+                    code_decl += f"    {atype} {a.name}={defval};\n"
+                else:
+                    code_decl += f"    {atype} {a.name};\n"
+
+            elixir_argname = self.map_elixir_argname(a.name)
+            if elixir_argname not in kw_slots:
+                kw_slots[elixir_argname] = len(kw_slots)
+            code_cvt_list.append("evision_to_safe(env, kw_args[%d], %s, %s)" % (kw_slots[elixir_argname], a.name, a.crepr(defval)))
+
+        code_fcall = f"{self.cname}({', '.join(code_args)})"
+        code_retval_decl = ""
+        if v.rettype:
+            code_retval_decl = f"std::vector<{v.rettype}> retval(batch_size);\n        "
+            code_fcall = f"retval[batch_index] = {code_fcall}"
+            code_ret = f"return enif_make_tuple2(env, evision_from(env, retval), evision_from(env, {mat_out}))"
+        else:
+            code_ret = f"return evision_from(env, {mat_out})"
+
+        code_kw_table = ET.gen_template_kw_table.substitute(
+            num_kw=len(kw_slots),
+            kw_table=", ".join([codegen.get_kw_index(kw) for kw in kw_slots]))
+        code = "static ERL_NIF_TERM %s(ErlNifEnv *env, int argc, const ERL_NIF_TERM argv[])\n{\n" % (fname,)
+        code += ET.gen_template_parse_kw.substitute(
+            namespace=self.namespace.replace('.', '::'),
+            code_kw_table=code_kw_table,
+            nif_opts_index=0)
+        code += ET.gen_template_batch_func_body.substitute(
+            code_decl=code_decl,
+            code_cvt=" && \n        ".join(code_cvt_list),
+            mat_in=mat_in,
+            mat_out=mat_out,
+            code_retval_decl=code_retval_decl,
+            code_fcall=code_fcall,
+            code_ret=code_ret)
+        return code
+
     def map_elixir_argname(self, argname, ignore_upper_starting=False):
         name = ""
         if argname in reserved_keywords():
@@ -145,17 +305,9 @@ class FuncInfo(object):
             return ""
         if fname in special_handling_funcs():
             return ""
-        code = "%s\n{\n" % (proto,)
-        code += f"""    using namespace {self.namespace.replace('.', '::')};
-    int error_flag = false;
-    ERL_NIF_TERM error_term = 0;
-    std::map<std::string, ERL_NIF_TERM> erl_terms;
-    const int nif_opts_index = {opt_arg_index};
-    if (nif_opts_index < argc) {{
-        evision::nif::parse_arg(env, nif_opts_index, argv, erl_terms);
-    }}
-    const size_t num_kw_args = erl_terms.size();
-"""
+        # keyword argument name => slot index in `kw_args`
+        kw_slots = {}
+        code = ""
 
         selfinfo = None
         ismethod = self.classname != "" and not self.isconstructor
@@ -223,10 +375,17 @@ class FuncInfo(object):
             if umat_ones.get(c, None) is not None:
                 sorted_variants.extend([f[0] for f in umat_ones[c]])
 
+        # overloaded functions classify their keyword arguments once, and each variant checks
+        # the kinds of its arguments before converting any of them, so that a variant that
+        # cannot match is skipped without converting (and possibly copying) any argument
+        is_overloaded = len(sorted_variants) > 1
+        uses_kw_kinds = False
+
         for v in sorted_variants:
             code_decl = ""
             code_ret = ""
             code_cvt_list = []
+            code_check_list = []
 
             code_args = "("
             all_cargs = []
@@ -304,12 +463,19 @@ class FuncInfo(object):
                 if a.py_inputarg:
                     parse_name = "erl_term_" + a.name
                     elixir_argname = self.map_elixir_argname(a.name)
-                    erl_term = "evision_get_kw(env, erl_terms, \"%s\")" % (elixir_argname,)
+                    if elixir_argname not in kw_slots:
+                        kw_slots[elixir_argname] = len(kw_slots)
+                    erl_term = "kw_args[%d]" % (kw_slots[elixir_argname],)
                     self_offset = 0
                     if self.classname and not self.is_static and not self.isconstructor:
                         self_offset = 1
                     if a_index + self_offset < opt_arg_index:
                         erl_term = "argv[%d]" % (a_index + opt_arg_index,)
+                    elif is_overloaded:
+                        term_kinds = accepted_term_kinds(a.tp, arg_type_info.is_enum, len(a.defval) > 0)
+                        if term_kinds is not None:
+                            code_check_list.append("(kw_kinds[%d] & (%s))" % (
+                                kw_slots[elixir_argname], " | ".join("EVISION_TERM_" + k for k in term_kinds)))
                     if a.tp == 'char':
                         code_cvt_list.append("convert_to_char(env, %s, &%s, %s)" % (erl_term, a.name, a.crepr(defval)))
                     elif a.tp == 'c_string':
@@ -408,19 +574,24 @@ class FuncInfo(object):
                 arg_type_info = simple_argtype_mapping.get(tp, default_info)
                 all_cargs.append(arg_type_info)
 
+            if len(code_check_list) > 0:
+                uses_kw_kinds = True
+                num_checks_before = 1 if min_kw_count > 0 else 0
+                code_cvt_list = code_cvt_list[:num_checks_before] + code_check_list + code_cvt_list[num_checks_before:]
+
             if v.args and v.py_arglist:
                 # form the argument parse code that:
                 #   - declares the list of keyword parameters
-                #   - calls evision::nif::parse_arg
+                #   - looks up the keyword arguments resolved by evision_parse_kw
                 #   - converts complex arguments from ERL_NIF_TERM's to native OpenCV types
                 code_parse = ET.gen_template_parse_args.substitute(
                     kw_list=", ".join(['"' + aname + '"' for aname, argno, argtype in v.py_arglist]),
                     code_cvt="{}".format(" && \n        ".join(code_cvt_list)))
             else:
-                code_parse = "if((argc - nif_opts_index == 1) && erl_terms.size() == 0)"
+                code_parse = "if((argc - nif_opts_index == 1) && num_kw_args == 0)"
 
             if len(v.py_outlist) == 0:
-                code_ret = "return evision::nif::atom(env, \"ok\")"
+                code_ret = "return evision::nif::atom_ok"
 
                 if not v.isphantom and ismethod and not self.is_static:
                     module_name = get_elixir_module_name(selfinfo.cname)
@@ -436,9 +607,9 @@ class FuncInfo(object):
                     aname, _ = v.py_outlist[0]
                     if v.rettype == 'bool':
                         code_ret = f"if ({aname}) {{\n" \
-                        '                return evision::nif::atom(env, "true");\n' \
+                        '                return evision::nif::atom_true;\n' \
                         '            } else {\n' \
-                        '                return evision::nif::atom(env, "false");\n'\
+                        '                return evision::nif::atom_false;\n'\
                         '            }'
                     else:
                         if self.should_return_self():
@@ -501,6 +672,19 @@ class FuncInfo(object):
         def_ret = "if (error_flag != false) return error_term;\n    else return enif_make_badarg(env);"
         code += "\n    %s\n}\n\n" % def_ret
 
+        if len(kw_slots) > 0:
+            code_kw_table = ET.gen_template_kw_table.substitute(
+                num_kw=len(kw_slots),
+                kw_table=", ".join([codegen.get_kw_index(kw) for kw in kw_slots]))
+        else:
+            code_kw_table = ET.gen_template_empty_kw_table
+        if uses_kw_kinds:
+            code = ET.gen_template_kw_kinds + code
+        code = "%s\n{\n" % (proto,) + ET.gen_template_parse_kw.substitute(
+            namespace=self.namespace.replace('.', '::'),
+            code_kw_table=code_kw_table,
+            nif_opts_index=opt_arg_index) + code
+
         cname = self.cname
         classinfo = None
         #dump = False
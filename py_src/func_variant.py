@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
 from io import StringIO
 from typing import Tuple
 from helper import handle_ptr, forbidden_arg_types, ignored_arg_types, map_argtype_to_guard, map_argname, map_argtype_to_type, handle_inline_math_escaping, map_argtype_in_docs, map_argtype_in_spec, is_struct
@@ -36,6 +37,8 @@ class FuncVariant(object):
                     self.array_counters[c] = [ainfo.name]
             self.args.append(ainfo)
         self.init_pyproto()
+        # docstring rendered by `render_docstring_elixir`, shared with the views over this variant
+        self.rendered_docstrings = {}
 
     def init_pyproto(self):
         # string representation of argument list, with '[', ']' symbols denoting optional arguments, e.g.
@@ -134,6 +137,35 @@ class FuncVariant(object):
     def min_args(self):
         return len(self.py_arglist) - self.py_noptargs
 
+    def as_batch(self):
+        """
+        A copy of this variant as seen by its `_batch` NIF: input and output `Mat` arguments
+        become lists of matrices, output matrices can no longer be passed in, and the return
+        value (if any) becomes a list.
+        """
+        batch = copy.deepcopy(self)
+        # the docstring lists the optional arguments, which are different
+        batch.rendered_docstrings = {}
+        out_mats = []
+        for a in batch.args:
+            if a.tp == 'Mat':
+                a.tp = 'vector_Mat'
+                if not a.inputarg:
+                    out_mats.append(a.name)
+        batch.py_arglist = [(aname, argno, 'vector_Mat' if argtype == 'Mat' else argtype)
+                            for aname, argno, argtype in self.py_arglist if aname not in out_mats]
+        # output matrices are always optional arguments
+        batch.py_noptargs -= len(self.py_arglist) - len(batch.py_arglist)
+        if batch.rettype:
+            batch.rettype = f'vector_{batch.rettype}'
+        return batch
+
+    def as_inherited(self, classname: str, **overrides):
+        """
+        A view over this variant as a method of the derived class `classname`, see `InheritedFuncVariant`.
+        """
+        return InheritedFuncVariant(self, classname=classname, **overrides)
+
     def function_guard(self, kind: str):
         return list(filter(lambda x: x != '', [map_argtype_to_guard(kind, map_argname(kind, argname), argtype, classname=self.classname) for argname, _, argtype in self.py_arglist[:self.pos_end]]))
 
@@ -209,7 +241,20 @@ class FuncVariant(object):
     def inline_docs_erlang(self, is_instance_method: bool, module_name: str) -> str:
         return ''
 
-    def inline_docs_elixir(self, is_instance_method: bool, module_name: str) -> str:
+    def render_docstring_elixir(self):
+        """
+        Render the docstring of this variant, which does not depend on the class or module it is in.
+
+        Returns the rendered docstring and the descriptions of the parameters by their Elixir names.
+        The result is kept for later calls, including calls on views over this variant.
+        """
+        rendered = self.rendered_docstrings.get('elixir', None)
+        if rendered is None:
+            rendered = self.__render_docstring_elixir__()
+            self.rendered_docstrings['elixir'] = rendered
+        return rendered
+
+    def __render_docstring_elixir__(self):
         global inline_docs_code_type_re
         parameter_info = {}
         doc_string = "\n".join('  {}'.format(line.strip()) for line in self.docstring.split("\n")).strip()
@@ -365,6 +410,10 @@ class FuncVariant(object):
             function_brief = self.name
         inline_doc = inline_doc1.replace('@doc """', function_brief)
         inline_doc = handle_inline_math_escaping(inline_doc)
+        return inline_doc, parameter_info
+
+    def inline_docs_elixir(self, is_instance_method: bool, module_name: str) -> str:
+        inline_doc, parameter_info = self.render_docstring_elixir()
         parameter_info_doc = StringIO()
 
         out_args = [o[0] for o in self.py_outlist]
@@ -798,3 +847,25 @@ class FuncVariant(object):
                 func_args_with_opts = f'{self_arg}, {func_args_with_opts}'
 
         return func_args, func_args_with_opts
+
+
+class InheritedFuncVariant(FuncVariant):
+    """
+    A variant of a base class method as seen by a derived class.
+
+    Attributes given to the constructor, e.g., `classname`, and attributes set on the view are
+    its own, everything else is read from the base variant, so that the parsed arguments and
+    the rendered docstring are shared instead of being copied for every derived class.
+    """
+
+    def __init__(self, variant: FuncVariant, **overrides):
+        self.base_variant = variant
+        for name, value in overrides.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name):
+        # only called for attributes not set on the view
+        variant = self.__dict__.get('base_variant', None)
+        if variant is None or name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(variant, name)
@@ -9,20 +9,22 @@ from pathlib import Path
 import argparse
 
 import hdr_parser
+from header_cache import HeaderCache
 import re
-from erl_enum_expression_generator import ErlEnumExpressionGenerator
+from erl_enum_expression_generator import ErlEnumExpressionGenerator, evaluate_enum_expression
 import evision_templates as ET
 import evision_structures as ES
 from helper import *
 from namespace import Namespace
 from func_info import FuncInfo
 from class_info import ClassInfo
+import module_generator
 from module_generator import ModuleGenerator
 from fixes import evision_elixir_fixes, evision_erlang_fixes
+from manifest import Manifest
 from pathlib import Path
 import os
 from os import makedirs
-from shutil import rmtree
 
 
 if sys.version_info[0] >= 3:
@@ -32,8 +34,15 @@ else:
 
 
 class BeamWrapperGenerator(object):
-    def __init__(self, enabled_modules, langs, win_dll):
+    def __init__(self, enabled_modules, langs, win_dll, cache_dir=None, jobs=1, manifest=None):
         self.clear()
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        # only functions and constants allowed by the manifest are generated if it is not None
+        self.manifest = manifest
+        # called with the name of each step of `gen` when it starts, see benchmark.py
+        self.phase_hook = None
+        self.const_ref_re = re.compile(r'\bcv_(\w+)\(\)')
         self.argname_prefix_re = re.compile(r'^[_]*')
         self.inline_docs_code_type_re = re.compile(r'@code{.(.*)}')
         self.inline_docs_inline_math_re = re.compile(r'(?:.*?)\\\\f[$\[](.*?)\\\\f[$\]]', re.MULTILINE|re.DOTALL)
@@ -53,12 +62,32 @@ class BeamWrapperGenerator(object):
         self.enum_names = {}
         self.enum_names_io = StringIO()
         self.enum_names_io_erlang = StringIO()
+        # erl_const_name => (val, val_erlang, value), value is None if it cannot be computed here
+        self.const_defs = {}
+        # erl_const_name => value, for all constants whose value is known
+        self.const_values = {}
+        # (erl_const_name, value) of the written constants whose value is known,
+        # they are generated as literals in a map instead of expressions
+        self.const_literals = []
+        self.written_consts = set()
+        # signatures and NIFs already generated are tracked by module_generator,
+        # reset them so that `gen` can run more than once in the same process
+        module_generator.unique_signatures.clear()
+        module_generator.nif_declared.clear()
+        # constants used by written constants but not defined yet
+        self.pending_consts = set()
         self.code_include = StringIO()
         self.code_enums = StringIO()
         self.code_types = StringIO()
         self.code_funcs = StringIO()
         self.code_ns_reg = StringIO()
 
+        # keyword argument names used by the generated functions
+        self.kw_names = set()
+
+        # absolute paths of all files written (or left untouched because they were up to date) by `save`
+        self.generated_files = set()
+
         # lib/generated/evision_nif.ex
         self.evision_nif = StringIO()
 
@@ -80,6 +109,9 @@ class BeamWrapperGenerator(object):
 
         self.evision_ex = ModuleGenerator("Evision")
         self.evision_elixir.write('defmodule Evision do\n')
+        # generated modules are not needed to compile other modules, so they are
+        # only loaded when first called instead of right after being compiled
+        self.evision_elixir.write('  @compile {:autoload, false}\n')
         self.evision_elixir.write('  import Kernel, except: [apply: 2, apply: 3, min: 2, max: 2]\n\n')
         self.evision_elixir.write('  @doc false\n')
         self.evision_elixir.write('  def __to_struct__(any), do: Evision.Internal.Structurise.to_struct(any)\n\n')
@@ -149,12 +181,57 @@ class BeamWrapperGenerator(object):
         return namespace, classes, chunks[-1]
 
 
+    def write_const(self, erl_const_name):
+        if erl_const_name in self.written_consts:
+            return
+        self.written_consts.add(erl_const_name)
+        val, val_erlang, value = self.const_defs[erl_const_name]
+        if value is not None:
+            self.const_literals.append((erl_const_name, value))
+            return
+
+        # constants that this one is defined with are kept even if the manifest leaves them out
+        for dep in self.const_ref_re.findall(f'{val} {val_erlang}'):
+            if dep in self.const_defs:
+                self.write_const(dep)
+            else:
+                self.pending_consts.add(dep)
+
+        self.enum_names_io.write(f"  def cv_{erl_const_name}, do: {val}\n")
+        self.enum_names_io_erlang.write(f"cv_{erl_const_name}() ->\n    {val_erlang}.\n")
+
+    def emit_const(self, cname, erl_const_name, val, val_erlang, value):
+        self.const_defs[erl_const_name] = (val, val_erlang, value)
+        if value is not None:
+            self.const_values[erl_const_name] = value
+        if self.manifest is None or self.manifest.allows(cname) or erl_const_name in self.pending_consts:
+            self.write_const(erl_const_name)
+
+    @staticmethod
+    def format_const_value(value):
+        # `1e-05` and `1.0e+20` are not valid float literals in Elixir
+        if type(value) is float:
+            mantissa, _, exponent = repr(value).partition('e')
+            if '.' not in mantissa:
+                mantissa = f'{mantissa}.0'
+            return f'{mantissa}e{exponent.lstrip("+")}' if exponent else mantissa
+        return str(value)
+
+    def gen_const_literals(self):
+        elixir = ",".join([f"\n    {name}: {self.format_const_value(value)}" for name, value in self.const_literals])
+        erlang = ",".join([f"\n        '{name}' => {self.format_const_value(value)}" for name, value in self.const_literals])
+        hrl = "".join([f"-define(cv_{name}, {self.format_const_value(value)}).\n" for name, value in self.const_literals])
+        return ET.constant_literals_elixir.substitute(constants=elixir), \
+            ET.constant_literals_erlang.substitute(constants=erlang), \
+            hrl
+
     def add_const(self, name, decl):
         (module_name, erl_const_name) = name.split('.')[-2:]
         val = decl[1]
         skip_this = False
         if val == "std::numeric_limits<uint8_t>::max()":
             val_erlang = 255
+            value = 255
         else:
             val_tree = ast.parse(val, mode='eval')
             val_gen = ErlEnumExpressionGenerator()
@@ -162,6 +239,9 @@ class BeamWrapperGenerator(object):
             skip_this = val_gen.skip_this
             val = val_gen.expression
             val_erlang = val_gen.expression_erlang
+            value = evaluate_enum_expression(val_tree, self.const_values)
+            if type(value) is float and (value != value or value in (float('inf'), float('-inf'))):
+                value = None
 
         if not skip_this:
             erl_const_name = map_argname('elixir', erl_const_name, ignore_upper_starting=True)
@@ -169,15 +249,13 @@ class BeamWrapperGenerator(object):
                 val = f'cv_{val}()'
             if self.enum_names.get(erl_const_name, None) is None:
                 self.enum_names[erl_const_name] = val
-                self.enum_names_io.write(f"  def cv_{erl_const_name}, do: {val}\n")
-                self.enum_names_io_erlang.write(f"cv_{erl_const_name}() ->\n    {val_erlang}.\n")
+                self.emit_const(name, erl_const_name, val, val_erlang, value)
             else:
                 if self.enum_names[erl_const_name] != val:
                     erl_const_name = map_argname('elixir', f'{module_name}_{erl_const_name}', ignore_upper_starting=True)
                     if self.enum_names.get(erl_const_name, None) is None:
                         self.enum_names[erl_const_name] = val
-                        self.enum_names_io.write(f"  def cv_{erl_const_name}, do: {val}\n")
-                        self.enum_names_io_erlang.write(f"cv_{erl_const_name}() ->\n    {val_erlang}.\n")
+                        self.emit_const(name, erl_const_name, val, val_erlang, value)
                     else:
                         raise "duplicated constant name"
 
@@ -210,6 +288,14 @@ class BeamWrapperGenerator(object):
             name = decl[0]
             self.add_const(name.replace("const ", "").strip(), decl)
 
+    def is_func_allowed(self, decl):
+        if self.manifest is None:
+            return True
+        # mappable declarations are part of the conversion of their class, not functions
+        if any(m.startswith("/mappable=") for m in decl[2]):
+            return True
+        return self.manifest.allows(decl[0])
+
     def add_func(self, decl):
         namespace, classes, barename = self.split_decl_name(decl[0])
         cname = "::".join(namespace+classes+[barename])
@@ -295,19 +381,27 @@ class BeamWrapperGenerator(object):
                 for line in f:
                     line = line.strip()
                     if line.startswith("// @evision c: "):
+                        # erl_name, func_name, arity[, bound]
+                        # `bound` is one of `cpu`, `io` and `normal`
                         parts = line[len("// @evision c: "):].split(',')
-                        if len(parts) != 3:
+                        if len(parts) not in [3, 4]:
                             raise Exception(f'Invalid comment: {line}')
                         erl_name = parts[0].strip()
                         func_name = parts[1].strip()
                         func_arity = parts[2].strip()
+                        bound = parts[3].strip() if len(parts) == 4 else None
 
-                        if func_name.endswith('_read') or func_name.endswith('_load_static') or \
-                                func_name.endswith('_write') or func_name.endswith('_save') or \
-                                func_name in io_bound_funcs():
+                        if bound == 'io' or (bound is None and (
+                                func_name.endswith('_read') or func_name.endswith('_load_static') or
+                                func_name.endswith('_write') or func_name.endswith('_save') or
+                                func_name in io_bound_funcs())):
                             self.code_ns_reg.write(f'    F_IO({erl_name}, {func_name}, {func_arity}),\n')
-                        else:
+                        elif bound == 'normal':
+                            self.code_ns_reg.write(f'    F({erl_name}, {func_name}, {func_arity}),\n')
+                        elif bound is None or bound == 'cpu':
                             self.code_ns_reg.write(f'    F_CPU({erl_name}, {func_name}, {func_arity}),\n')
+                        else:
+                            raise Exception(f'Invalid nif function bound type `{bound}`: {line}')
                         if int(func_arity) > 0:
                             self.evision_nif_erlang.write(f'{erl_name}(_opts) ->\n    not_loaded(?LINE).\n')
                         else:
@@ -328,6 +422,14 @@ class BeamWrapperGenerator(object):
                     module_file_generator.gen_ns_method(wname, name, func, namespace_list=None)
                 self.code_ns_reg.write(func.get_tab_entry())
 
+                batch_variant = func.get_batch_variant(self)
+                if batch_variant is not None:
+                    if wname == 'cv':
+                        self.evision_ex.gen_ns_batch_method(wname, func, batch_variant.as_batch())
+                    else:
+                        module_file_generator.gen_ns_batch_method(wname, func, batch_variant.as_batch())
+                    self.code_ns_reg.write(func.get_batch_tab_entry())
+
         modules_dir = Path(self.output_path) / 'modules'
         for module_text in modules_dir.glob('*.h'):
             self.handle_custom_file(module_text)
@@ -335,6 +437,23 @@ class BeamWrapperGenerator(object):
         for module_text in backend_dir.glob('*.h'):
             self.handle_custom_file(module_text)
 
+    def get_kw_index(self, kw_name):
+        self.kw_names.add(kw_name)
+        return f"evision_kw_{kw_name}"
+
+    def gen_kw_table(self):
+        kw_names = sorted(self.kw_names)
+        code = StringIO()
+        code.write("enum {\n")
+        for kw_name in kw_names:
+            code.write(f"    evision_kw_{kw_name},\n")
+        code.write("    evision_kw_count\n};\n\n")
+        code.write("static const char * evision_kw_names[evision_kw_count] = {\n")
+        for kw_name in kw_names:
+            code.write(f'    "{kw_name}",\n')
+        code.write("};\n")
+        return code
+
     def gen_enum_reg(self, enum_name):
         name_seg = enum_name.split(".")
         if len(name_seg) >= 2 and name_seg[-1] == name_seg[-2]:
@@ -349,25 +468,47 @@ class BeamWrapperGenerator(object):
         code += "CV_ERL_FROM_ENUM({0});\nCV_ERL_TO_ENUM({0});\n\n".format(wname)
         self.code_enums.write(code)
 
+    def write_if_changed(self, filepath, content):
+        """
+        Only touch the file when its content changes so that mix, rebar and the C++ compiler
+        won't rebuild files that are already up to date.
+        """
+        self.generated_files.add(str(filepath.resolve()))
+        if filepath.exists():
+            with open(filepath, "rt", encoding='utf-8') as f:
+                if f.read() == content:
+                    return
+        with open(filepath, "wt", encoding='utf-8') as f:
+            f.write(content)
+
     def save(self, path, name, buf):
         outdir_path = path
         outdir = Path(outdir_path)
         if not outdir.exists():
             outdir.mkdir(parents=True, exist_ok=True)
-        with open(f"{outdir_path}/{name}", "wt", encoding='utf-8') as f:
-            if name.endswith(".h"):
-                f.write("#include <erl_nif.h>\n")
-                f.write('#include "nif_utils.hpp"\n')
-                f.write('using namespace evision::nif;\n')
-            if type(buf) == str:
-                f.write(buf)
-            else:
-                f.write(buf.getvalue())
+        content = ""
+        if name.endswith(".h"):
+            content += "#include <erl_nif.h>\n"
+            content += '#include "nif_utils.hpp"\n'
+            content += 'using namespace evision::nif;\n'
+        if type(buf) == str:
+            content += buf
+        else:
+            content += buf.getvalue()
+        self.write_if_changed(outdir / name, content)
 
     def save_json(self, path, name, value):
         import json
-        with open(path + "/" + name, "wt", encoding='utf-8') as f:
-            json.dump(value, f)
+        self.write_if_changed(Path(path) / name, json.dumps(value))
+
+    def remove_stale_files(self, path):
+        """
+        Remove generated files in `path` that were not written in this run,
+        e.g., modules that are no longer enabled.
+        """
+        for filepath in Path(path).iterdir():
+            if filepath.is_file() and str(filepath.resolve()) not in self.generated_files:
+                filepath.unlink()
 
     def get_module_writer(self, module_name, wname, name, is_ns):
         elixir_module_name = make_elixir_module_names(module_name=module_name)
@@ -392,6 +533,7 @@ class BeamWrapperGenerator(object):
         else:
             module_file_generator = ModuleGenerator(elixir_module_name)
             module_file_generator.write_elixir(f'defmodule Evision.{elixir_module_name} do\n')
+            module_file_generator.write_elixir('  @compile {:autoload, false}\n')
             if elixir_module_name not in ['Flann', 'Segmentation', 'ML']:
                 module_file_generator.write_elixir('  import Kernel, except: [apply: 2, apply: 3]\n\n')
 
@@ -526,9 +668,9 @@ class BeamWrapperGenerator(object):
             for component in components:
                 self.code_funcs.write(f"""    keys[index] = evision::nif::atom(env, "{component}");
 #ifdef HAVE_OPENCV_{component.upper()}
-    values[index] = evision::nif::atom(env, "true");
+    values[index] = evision::nif::atom_true;
 #else
-    values[index] = evision::nif::atom(env, "false");
+    values[index] = evision::nif::atom_false;
 #endif
     index++;
 """)
@@ -546,10 +688,16 @@ class BeamWrapperGenerator(object):
         self.evision_nif.write(f'  def enabled_modules, do: :erlang.nif_error("enabled_modules not loaded")\n')
         self.evision_nif_erlang.write(f'enabled_modules() ->\n    not_loaded(?LINE).\n')
 
+    def begin_phase(self, name):
+        if self.phase_hook is not None:
+            self.phase_hook(name)
+
     def gen(self, srcfiles, output_path, erl_output_path, erlang_output_path):
+        self.begin_phase('parse')
         self.output_path = output_path
         self.clear()
         self.parser = hdr_parser.CppHeaderParser(generate_umat_decls=True, generate_gpumat_decls=True)
+        header_cache = HeaderCache(self.parser, self.cache_dir)
 
         self.evision_nif.write('defmodule :evision_nif do\n{}\n'.format(ET.gen_evision_nif_load_nif %(self.win_dll, )))
         self.evision_nif_erlang.write('-module(evision_nif).\n-compile(nowarn_export_all).\n-compile([export_all]).\n\n{}\n{}\n'.format(ET.gen_evision_nif_load_nif_erlang % (self.win_dll,), ET.gen_cv_types_erlang))
@@ -558,8 +706,12 @@ class BeamWrapperGenerator(object):
         self.gen_enabled_modules()
 
         # step 1: scan the headers and build more descriptive maps of classes, consts, functions
-        for hdr in srcfiles:
-            decls = self.parser.parse(hdr)
+        # headers are parsed in parallel, but their declarations (and namespaces) are still
+        # processed in the order of `srcfiles`, exactly like parsing them one at a time
+        parsed_headers = header_cache.parse_all(srcfiles, self.jobs)
+        self.begin_phase('collect')
+        for hdr, (decls, namespaces) in zip(srcfiles, parsed_headers):
+            self.parser.namespaces.update(namespaces)
             if len(decls) == 0:
                 continue
 
@@ -589,7 +741,8 @@ class BeamWrapperGenerator(object):
                     self.add_enum(name.rsplit(" ", 1)[1], decl)
                 else:
                     # function
-                    self.add_func(decl)
+                    if self.is_func_allowed(decl):
+                        self.add_func(decl)
 
         # step 1.5 check if all base classes exist
         for name, classinfo in self.classes.items():
@@ -626,6 +779,7 @@ class BeamWrapperGenerator(object):
             process_isalgorithm(classinfo)
 
         # step 2: generate code for the classes and their methods
+        self.begin_phase('classes')
         classlist = list(self.classes.items())
         classlist.sort()
         for name, classinfo in classlist:
@@ -658,6 +812,7 @@ class BeamWrapperGenerator(object):
             self.code_type_publish.write(classinfo.gen_def(self, self.evision_modules, self.evision_erlang_hrl))
 
         # step 3: generate the code for all the global functions
+        self.begin_phase('functions')
         for ns_name, ns in sorted(self.namespaces.items()):
             if ns_name.split('.')[0] != 'cv':
                 continue
@@ -666,15 +821,18 @@ class BeamWrapperGenerator(object):
                     continue
                 code = func.gen_code(self)
                 self.code_funcs.write(code)
+                self.code_funcs.write(func.gen_batch_code(self))
         self.gen_namespace()
 
         # step 4: generate the code for enum types
+        self.begin_phase('enums')
         enumlist = list(self.enums.values())
         enumlist.sort()
         for name in enumlist:
             self.gen_enum_reg(name)
 
         # step 5: generate the code for constants
+        self.begin_phase('constants')
         constlist = list(self.consts.items())
         constlist.sort()
         for name, constinfo in constlist:
@@ -701,11 +859,13 @@ class BeamWrapperGenerator(object):
             )
 
         # That's it. Now save all the files
+        self.begin_phase('save')
         self.save(output_path, "evision_generated_include.h", self.code_include)
         self.save(output_path, "evision_generated_funcs.h", self.code_funcs)
         self.save(output_path, "evision_generated_enums.h", self.code_enums)
         self.save(output_path, "evision_generated_types.h", self.code_type_publish)
         self.save(output_path, "evision_generated_types_content.h", self.code_types)
+        self.save(output_path, "evision_generated_kw.h", self.gen_kw_table())
 
         # write all module files
         for name in self.evision_modules:
@@ -724,6 +884,7 @@ class BeamWrapperGenerator(object):
             self.code_ns_reg.write(module_file_generator.get_erl_nif_func_entry())
 
         
+        const_literals_elixir, const_literals_erlang, const_literals_hrl = self.gen_const_literals()
         if 'elixir' in self.langs:
             # 'evision_nif.ex'
             self.evision_nif.write(self.evision_ex.get_nif_declaration('elixir'))
@@ -731,6 +892,7 @@ class BeamWrapperGenerator(object):
             self.save(erl_output_path, "evision_nif.ex", self.evision_nif)
 
             # 'evision_constant.ex'
+            self.evision_constant_elixir.write(const_literals_elixir)
             self.evision_constant_elixir.write(self.enum_names_io.getvalue())
             self.evision_constant_elixir.write('\nend\n')
             self.save(erl_output_path, "evision_constant.ex", self.evision_constant_elixir)
@@ -751,10 +913,16 @@ class BeamWrapperGenerator(object):
             self.save(erlang_output_path, "evision.erl", self.evision_erlang)            
 
             # 'evision_constant.erl'
+            self.evision_constant_erlang.write(const_literals_erlang)
+            for name, value in self.const_literals:
+                self.evision_constant_erlang.write(f"cv_{name}() ->\n    {self.format_const_value(value)}.\n")
             self.evision_constant_erlang.write(self.enum_names_io_erlang.getvalue())
             self.evision_constant_erlang.write('\n')
             self.save(erlang_output_path, "evision_constant.erl", self.evision_constant_erlang)
 
+            # 'evision_constant.hrl', `?cv_NAME` expands to the value of the constant at compile time
+            self.save(erlang_output_path, "evision_constant.hrl", const_literals_hrl)
+
             # 'evision.hrl'
             self.save(erlang_output_path, "evision.hrl", self.evision_erlang_hrl)
 
@@ -771,6 +939,9 @@ if __name__ == "__main__":
     parser.add_argument("--lang", type=str, help="Comma-seperated values. erlang,elixir")
     parser.add_argument("--modules", type=str, default='', help="Comma-seperated values.")
     parser.add_argument("--win_dll", type=str, default='', help="Path to OpenCV libs on Windows")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Number of processes used to parse headers")
+    parser.add_argument("--cache_dir", type=str, default='', help="Path to the cache dir of parsed headers. Caching is disabled if empty")
+    parser.add_argument("--manifest", type=str, default='', help="Path to a manifest of the functions and constants to generate. Everything is generated if empty")
     args = parser.parse_args()
 
     srcfiles = hdr_parser.opencv_hdr_list
@@ -795,11 +966,14 @@ if __name__ == "__main__":
                        'stitching', 'ts', 'video', 'videoio', 'dnn']
     if len(args.modules) > 0:
         enabled_modules = args.modules.split(",")
-    generator = BeamWrapperGenerator(enabled_modules, lang, args.win_dll)
-    rmtree(elixir_dstdir)
-    rmtree(erlang_dstdir)
-    makedirs(elixir_dstdir)
-    makedirs(erlang_dstdir)
+    manifest = None
+    if len(args.manifest) > 0:
+        manifest = Manifest.load(args.manifest)
+    generator = BeamWrapperGenerator(enabled_modules, lang, args.win_dll, args.cache_dir, args.jobs, manifest)
+    makedirs(elixir_dstdir, exist_ok=True)
+    makedirs(erlang_dstdir, exist_ok=True)
     generator.gen(srcfiles, dstdir, elixir_dstdir, erlang_dstdir)
+    generator.remove_stale_files(elixir_dstdir)
+    generator.remove_stale_files(erlang_dstdir)
     # for n in generator.namespaces:
     #     print(f'"{n}": &(&1[:namespace] == :"{n}"),')
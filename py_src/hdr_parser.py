@@ -31,6 +31,24 @@ where the list of modifiers is yet another nested list of strings
 original_return_type is None if the original_return_type is the same as return_value_type
 """
 
+# tokens that end, open or close a statement, or start a string literal or a comment
+stmt_token_re = re.compile(r';|"|\{|\}|//|/\*')
+# the end of a string literal or an escaped character in it
+string_token_re = re.compile(r'\\|"')
+# separators of the words of an argument type
+arg_token_re = re.compile(r'[ &*<>,]')
+empty_init_re = re.compile(r'=\s*\{\s*\}')
+# G-API specific aliases, all of them contain "GAPI"
+gapi_aliases = [
+    ("GAPI_EXPORTS", "CV_EXPORTS"),
+    ("GAPI_EXPORTS_W", "CV_EXPORTS_W"),
+    ("GAPI_EXPORTS_W_SIMPLE","CV_EXPORTS_W_SIMPLE"),
+    ("GAPI_WRAP", "CV_WRAP"),
+    ("GAPI_PROP", "CV_PROP"),
+    ("GAPI_PROP_RW", "CV_PROP_RW"),
+    ('defined(GAPI_STANDALONE)', '0'),
+]
+
 class CppHeaderParser(object):
 
     def __init__(self, generate_umat_decls=False, generate_gpumat_decls=False):
@@ -44,6 +62,8 @@ class CppHeaderParser(object):
         self.CLASS_DECL = 4
 
         self.namespaces = set()
+        # token list => compiled regex matching any of the tokens, see `find_next_token`
+        self.token_res = {}
 
     def batch_replace(self, s, pairs):
         for before, after in pairs:
@@ -123,26 +143,28 @@ class CppHeaderParser(object):
         arg_str = arg_str.strip()
         word_start = 0
         word_list = []
-        npos = -1
 
         #print self.lineno, ":\t", arg_str
 
         # pass 1: split argument type into tokens
-        while 1:
-            npos += 1
-            t, npos = self.find_next_token(arg_str, [" ", "&", "*", "<", ">", ","], npos)
+        for m in arg_token_re.finditer(arg_str):
+            npos = m.start()
+            t = m.group(0)
             w = arg_str[word_start:npos].strip()
             if w == "operator":
                 word_list.append("operator " + arg_str[npos:].strip())
                 break
             if w not in ["", "const"]:
                 word_list.append(w)
-            if t not in ["", " ", "&"]:
+            if t not in [" ", "&"]:
                 word_list.append(t)
-            if not t:
-                break
             word_start = npos+1
-            npos = word_start - 1
+        else:
+            w = arg_str[word_start:].strip()
+            if w == "operator":
+                word_list.append("operator ")
+            elif w not in ["", "const"]:
+                word_list.append(w)
 
         arg_type = ""
         arg_name = ""
@@ -783,16 +805,16 @@ class CppHeaderParser(object):
         Finds the next token from the 'tlist' in the input 's', starting from position 'p'.
         Returns the first occurred token and its position, or ("", len(s)) when no token is found
         """
-        token = ""
-        tpos = len(s)
-        for t in tlist:
-            pos = s.find(t, p)
-            if pos < 0:
-                continue
-            if pos < tpos:
-                tpos = pos
-                token = t
-        return token, tpos
+        tlist = tuple(tlist)
+        token_re = self.token_res.get(tlist, None)
+        if token_re is None:
+            # tokens are tried in the order of `tlist`, so the first one wins at the same position
+            token_re = re.compile("|".join(re.escape(t) for t in tlist))
+            self.token_res[tlist] = token_re
+        m = token_re.search(s, p)
+        if m is None:
+            return "", len(s)
+        return m.group(0), m.start()
 
     def parse(self, hname, wmode=True):
         """
@@ -829,15 +851,8 @@ class CppHeaderParser(object):
             l = l0.strip()
 
             # G-API specific aliases
-            l = self.batch_replace(l, [
-                    ("GAPI_EXPORTS", "CV_EXPORTS"),
-                    ("GAPI_EXPORTS_W", "CV_EXPORTS_W"),
-                    ("GAPI_EXPORTS_W_SIMPLE","CV_EXPORTS_W_SIMPLE"),
-                    ("GAPI_WRAP", "CV_WRAP"),
-                    ("GAPI_PROP", "CV_PROP"),
-                    ("GAPI_PROP_RW", "CV_PROP_RW"),
-                    ('defined(GAPI_STANDALONE)', '0'),
-                ])
+            if "GAPI" in l:
+                l = self.batch_replace(l, gapi_aliases)
 
             if state == SCAN and l.startswith("#"):
                 state = DIRECTIVE
@@ -897,30 +912,36 @@ class CppHeaderParser(object):
                 print("Error at %d: invalid state = %d" % (self.lineno, state))
                 sys.exit(-1)
 
+            # the line is scanned from left to right, `start` is where the unprocessed part begins
+            start = 0
             while 1:
                 # NB: Avoid parsing '{' for case:
                 # foo(Obj&& = {});
-                if re.search(r'=\s*\{\s*\}', l):
+                if empty_init_re.search(l, start):
                     token, pos = ';', len(l)
                 else:
-                    token, pos = self.find_next_token(l, [";", "\"", "{", "}", "//", "/*"])
+                    m = stmt_token_re.search(l, start)
+                    if m is None:
+                        token, pos = "", len(l)
+                    else:
+                        token, pos = m.group(0), m.start()
 
                 if not token:
-                    block_head += " " + l
+                    block_head += " " + l[start:]
                     block_head = block_head.strip()
                     if len(block_head) > 0 and block_head[-1] == ')' and block_head.startswith('CV_ENUM_FLAGS('):
-                        l = ''
+                        start = pos
                         token = ';'
                     else:
                         break
 
                 if token == "//":
-                    block_head += " " + l[:pos]
-                    l = ''
+                    block_head += " " + l[start:pos]
+                    start = len(l)
                     continue
 
                 if token == "/*":
-                    block_head += " " + l[:pos]
+                    block_head += " " + l[start:pos]
                     end_pos = l.find("*/", pos+2)
                     if len(l) > pos + 2 and l[pos+2] == "*":
                         # '/**', it's a docstring
@@ -934,25 +955,26 @@ class CppHeaderParser(object):
                     elif end_pos < 0:
                         state = COMMENT
                         break
-                    l = l[end_pos+2:]
+                    start = end_pos+2
                     continue
 
                 if token == "\"":
                     pos2 = pos + 1
                     while 1:
-                        t2, pos2 = self.find_next_token(l, ["\\", "\""], pos2)
-                        if t2 == "":
+                        m = string_token_re.search(l, pos2)
+                        if m is None:
                             print("Error at %d: no terminating '\"'" % (self.lineno,))
                             sys.exit(-1)
-                        if t2 == "\"":
+                        pos2 = m.start()
+                        if m.group(0) == "\"":
                             break
                         pos2 += 2
 
-                    block_head += " " + l[:pos2+1]
-                    l = l[pos2+1:]
+                    block_head += " " + l[start:pos2+1]
+                    start = pos2+1
                     continue
 
-                stmt = (block_head + " " + l[:pos]).strip()
+                stmt = (block_head + " " + l[start:pos]).strip()
                 stmt = " ".join(stmt.split()) # normalize the statement
                 #print(stmt)
                 stack_top = self.block_stack[-1]
@@ -1017,7 +1039,7 @@ class CppHeaderParser(object):
                         pos += 1
 
                 block_head = ""
-                l = l[pos+1:]
+                start = pos+1
 
         return decls
 
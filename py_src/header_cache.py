@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+import hdr_parser
+
+
+def parse_header(parser_options, hname):
+    """
+    Parse `hname` with a fresh `CppHeaderParser` so that it can run in a worker process.
+
+    Returns the declaration list and the namespaces declared in the header.
+    """
+    parser = hdr_parser.CppHeaderParser(*parser_options)
+    decls = parser.parse(hname)
+    return decls, parser.namespaces
+
+
+class HeaderCache(object):
+    """
+    Content-hash cache of the declaration lists returned by `CppHeaderParser.parse`.
+
+    Entries are keyed by the content of the header, the parser options and the source of
+    `hdr_parser.py`, so changing any of them invalidates the cached declarations.
+    """
+
+    def __init__(self, parser, cache_dir=None):
+        self.parser = parser
+        self.parser_options = (parser._generate_umat_decls, parser._generate_gpumat_decls)
+        self.cache_dir = None
+        if cache_dir is not None and len(cache_dir) > 0:
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        salt = hashlib.sha256()
+        with open(Path(__file__).parent / 'hdr_parser.py', 'rb') as f:
+            salt.update(f.read())
+        salt.update(repr(self.parser_options).encode('utf-8'))
+        self.salt = salt.digest()
+
+    def get_key(self, hname):
+        key = hashlib.sha256(self.salt)
+        key.update(hname.encode('utf-8'))
+        key.update(b'\0')
+        with open(hname, 'rb') as f:
+            key.update(f.read())
+        return key.hexdigest()
+
+    def get_entry(self, hname):
+        return self.cache_dir / f'{self.get_key(hname)}.pickle'
+
+    def load(self, hname):
+        if self.cache_dir is None:
+            return None
+        entry = self.get_entry(hname)
+        if not entry.exists():
+            return None
+        try:
+            with open(entry, 'rb') as f:
+                result = pickle.load(f)
+            self.hits += 1
+            return result
+        except Exception:
+            # corrupted or written by an incompatible python version, parse it again
+            return None
+
+    def store(self, hname, result):
+        self.misses += 1
+        if self.cache_dir is None:
+            return
+        entry = self.get_entry(hname)
+        tmp_entry = entry.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_entry, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_entry, entry)
+
+    def parse(self, hname):
+        """
+        Same as `CppHeaderParser.parse`, but returns the cached declarations (and
+        records the namespaces found in the header) when the header has not changed.
+        """
+        decls, namespaces = self.parse_all([hname])[0]
+        self.parser.namespaces.update(namespaces)
+        return decls
+
+    def parse_all(self, hnames, jobs=1):
+        """
+        Parse all headers in `hnames`, returning the declaration list and the namespaces declared
+        in each of them in the same order.
+
+        Headers that are not in the cache are parsed in a pool of `jobs` processes. As each header
+        is parsed independently of the others, the result is the same as parsing them one at a time.
+        """
+        results = [self.load(hname) for hname in hnames]
+        pending = [hname for hname, result in zip(hnames, results) if result is None]
+
+        if jobs is not None and jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+                parsed = list(executor.map(parse_header, repeat(self.parser_options), pending))
+        else:
+            parsed = [parse_header(self.parser_options, hname) for hname in pending]
+
+        parsed = iter(parsed)
+        for i, hname in enumerate(hnames):
+            if results[i] is None:
+                results[i] = next(parsed)
+                self.store(hname, results[i])
+        return results
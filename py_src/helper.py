@@ -95,6 +95,91 @@ def io_bound_funcs():
     ]
 
 
+def batch_funcs():
+    # functions that also get a `_batch` NIF, which runs the function on each matrix of a list
+    # in one NIF call. see `FuncInfo.get_batch_variant` for the signatures that can be batched
+    return [
+        "{}{}".format(evision_nif_prefix(), name) for name in [
+            'adaptiveThreshold',
+            'bilateralFilter',
+            'blur',
+            'boxFilter',
+            'canny',
+            'convertScaleAbs',
+            'cvtColor',
+            'equalizeHist',
+            'flip',
+            'gaussianBlur',
+            'laplacian',
+            'medianBlur',
+            'pyrDown',
+            'pyrUp',
+            'resize',
+            'rotate',
+            'scharr',
+            'sobel',
+            'threshold',
+        ]
+    ]
+
+
+def cheap_func_name_re():
+    # getters, setters and metadata queries, e.g., `getClipLimit`, `setClipLimit`, `isOpened`, `empty`
+    # only methods of an instance are matched against it, see `FuncInfo.is_cheap`
+    return re.compile(r'^((get|set|is|has)[A-Z_0-9].*|empty)$')
+
+
+def non_cheap_namespaces():
+    # accessors in these namespaces may initialise a runtime, e.g., OpenCL or CUDA, on first use
+    return ['cv.ocl', 'cv.cuda']
+
+
+def small_fixed_size_types():
+    return [
+        "bool", "char", "uchar", "schar", "int", "int64", "uint", "unsigned", "size_t", "float", "double",
+        "Point", "Point2i", "Point2f", "Point2d", "Point3i", "Point3f", "Point3d",
+        "Size", "Size2i", "Size2f", "Size2d",
+        "Rect", "Rect2i", "Rect2f", "Rect2d", "RotatedRect", "Range", "Scalar", "TermCriteria",
+        "Vec2b", "Vec3b", "Vec4b", "Vec2i", "Vec3i", "Vec4i", "Vec6i",
+        "Vec2f", "Vec3f", "Vec4f", "Vec6f", "Vec2d", "Vec3d", "Vec4d", "Vec6d",
+    ]
+
+
+def accepted_term_kinds(argtype: str, is_enum: bool = False, has_default: bool = False) -> Optional[list]:
+    """
+    Kinds of terms (`EVISION_TERM_*` in c_src/evision.cpp) that the converter of `argtype` may accept,
+    or `None` if it may accept any term.
+    """
+    if argtype == "uchar" and has_default:
+        # the converter of uchar falls back to the default value on any term
+        return None
+    if is_enum or argtype in ["int", "int64", "int64_t", "uint", "unsigned", "size_t", "uchar", "schar",
+                              "short", "ushort", "uint8_t", "uint32_t", "float", "double"]:
+        return ["NIL", "NUMBER"]
+    if argtype == "bool":
+        return ["NIL", "ATOM", "NUMBER"]
+    if argtype in ["String", "string", "std::string"]:
+        # `evision::nif::get(env, term, std::string&)` also accepts charlists
+        return ["NIL", "ATOM", "BINARY", "LIST"]
+    if argtype in ["Point", "Point2f", "Point2d", "Point3f", "Size", "Size2f", "Rect", "Rect2d"]:
+        return ["NIL", "TUPLE"]
+    if argtype == "Mat":
+        return ["NIL", "NUMBER", "TUPLE", "MAT"]
+    if argtype == "UMat":
+        return ["NIL", "UMAT"]
+    if argtype in ["cuda::GpuMat", "GpuMat"] and not has_default:
+        # class converters fall back to the default value on any term
+        return ["NIL", "OTHER"]
+    if argtype in ["vector_uchar", "vector_char"]:
+        return ["NIL", "LIST", "BINARY"]
+    if argtype == "vector_bool":
+        # `evision_to_generic_vec<bool>` accepts both tuples and lists
+        return ["NIL", "LIST", "TUPLE"]
+    if argtype.startswith("vector_"):
+        return ["NIL", "LIST"]
+    return None
+
+
 def pass_by_val_types(): 
     return ["Point*", "Point2f*", "Rect*", "String*", "double*", "float*", "int*"]
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from fnmatch import fnmatchcase
+
+
+def builtin_allowlist():
+    """
+    Names of the OpenCV functions and constants that evision's own modules call.
+
+    They are merged into every manifest, otherwise a build with a small manifest
+    would fail to compile, or fail at runtime, in these modules.
+    """
+    return [
+        # lib/evision/backend.ex
+        'cv::exp', 'cv::log', 'cv::max', 'cv::min', 'cv::randn', 'cv::randu',
+        # lib/evision_mat.ex
+        'cv::extractChannel', 'cv::imencode', 'cv::imread',
+        # src/evision_mat.erl
+        'cv::bitwise_not',
+        # lib/evision_highgui.ex, src/evision_highgui.erl
+        'cv::destroyAllWindows', 'cv::destroyWindow', 'cv::imshow', 'cv::waitKey',
+        # lib/zoo
+        'cv::addWeighted', 'cv::boxPoints', 'cv::circle', 'cv::cvtColor', 'cv::getPerspectiveTransform',
+        'cv::LUT', 'cv::merge', 'cv::polylines', 'cv::putText', 'cv::rectangle', 'cv::resize',
+        'cv::warpPerspective',
+        'cv::COLOR_BGR2RGB', 'cv::COLOR_RGB2BGR', 'cv::COLOR_RGB2GRAY', 'cv::FONT_HERSHEY_DUPLEX',
+        'cv::INTER_NEAREST',
+        'cv::FaceDetectorYN::create', 'cv::FaceDetectorYN::detect', 'cv::FaceDetectorYN::setInputSize',
+        'cv::FaceRecognizerSF::alignCrop', 'cv::FaceRecognizerSF::create', 'cv::FaceRecognizerSF::feature',
+        'cv::FaceRecognizerSF::match',
+        'cv::dnn::blobFromImage', 'cv::dnn::getAvailableTargets', 'cv::dnn::readNet',
+        'cv::dnn::Net::forward', 'cv::dnn::Net::setInput', 'cv::dnn::Net::setPreferableBackend',
+        'cv::dnn::Net::setPreferableTarget',
+        'cv::dnn::Model', 'cv::dnn::TextDetectionModel', 'cv::dnn::TextDetectionModel_DB',
+        'cv::dnn::DNN_BACKEND_*', 'cv::dnn::DNN_TARGET_*',
+        # lib/smartcell, the code generated by the smart cells also uses the constants of these classes
+        'cv::ml::DTrees', 'cv::ml::RTrees', 'cv::ml::StatModel', 'cv::ml::SVM', 'cv::ml::TrainData',
+        'cv::ml::COL_SAMPLE', 'cv::ml::ROW_SAMPLE',
+        'cv::TermCriteria::EPS', 'cv::TermCriteria::MAX_ITER',
+    ]
+
+
+class Manifest(object):
+    """
+    Names of the OpenCV functions and constants a deployment uses.
+
+    A manifest is a text file with one C++ name per line, e.g., `cv::imread`,
+    `cv::VideoCapture::read` or `cv::COLOR_BGR2GRAY`. Shell-style wildcards are
+    allowed (`cv::dnn::*`), and a class or namespace name allows everything in it,
+    so `cv::VideoCapture` keeps all methods of `cv::VideoCapture`. Dots can be used
+    instead of `::`. Empty lines and lines starting with `#` are ignored.
+
+    The names in `builtin_allowlist()` are added to every manifest loaded from a file.
+    """
+
+    def __init__(self, patterns):
+        self.names = set()
+        self.patterns = []
+        for pattern in patterns:
+            pattern = pattern.replace('.', '::')
+            if any(c in pattern for c in '*?['):
+                self.patterns.append(pattern)
+            else:
+                self.names.add(pattern)
+
+    @staticmethod
+    def load(path):
+        patterns = []
+        with open(path, 'rt') as f:
+            for line in f:
+                line = line.strip()
+                if len(line) > 0 and not line.startswith('#'):
+                    patterns.append(line)
+        return Manifest(builtin_allowlist() + patterns)
+
+    def allows(self, cname):
+        """
+        Whether the declaration `cname`, or the class or namespace it is in, is listed.
+        """
+        chunks = cname.replace('.', '::').split('::')
+        for i in range(len(chunks), 0, -1):
+            name = '::'.join(chunks[:i])
+            if name in self.names:
+                return True
+            for pattern in self.patterns:
+                if fnmatchcase(name, pattern):
+                    return True
+        return False
@@ -4,6 +4,7 @@
 import sys
 from string import Template
 from func_info import FuncInfo
+from func_variant import FuncVariant
 from class_prop import ClassProp
 from helper import *
 import evision_templates as ET
@@ -160,6 +161,91 @@ class ModuleGenerator(object):
     def gen_ns_method(self, full_qualified_name: str, name: str, func: FuncInfo, namespace_list: list):
         self._process_function(full_qualified_name, name=name, func=func, is_ns=True, is_constructor=False, namespace_list=namespace_list)
 
+    def gen_ns_batch_method(self, full_qualified_name: str, func: FuncInfo, batch_variant: FuncVariant):
+        """
+        Generate the binding code of the `_batch` NIF of `func`, where `batch_variant` is the variant
+        of `func` as seen by the batch NIF (see `FuncVariant.as_batch`).
+        """
+        nif_name, _ = func.get_batch_wrapper_name()
+        func_name = f'{func.name[:1].lower()}{func.name[1:]}'
+        module_func_name = f'{func_name}_batch'
+        mat_in = map_argname('elixir', next(aname for aname, _, argtype in batch_variant.py_arglist if argtype == 'vector_Mat'))
+        if batch_variant.rettype:
+            returns = f'  Returns `{{retvals, dsts}}`, the results of `{func_name}` on each matrix in `{mat_in}`, in the same order.'
+        else:
+            returns = f'  Returns the results of `{func_name}` on each matrix in `{mat_in}`, in the same order.'
+        inline_doc = (f'  Batched `{func_name}`.\n\n'
+                      f'  Runs `{func_name}` on each matrix in the list `{mat_in}` with one NIF call, in parallel with\n'
+                      '  `cv::parallel_for_`. All other arguments are converted once and shared by all matrices.\n\n'
+                      f'{returns}')
+
+        function_templates = {
+            "elixir": {
+                "nif_args": '_opts \\\\ []',
+                "nif_template": Template('  def ${nif_name}(${nif_args}), do: :erlang.nif_error("${nif_error_msg}")\n'),
+                "nif_error_msg": f"{full_qualified_name}::{module_func_name} not loaded"
+            },
+            "erlang": {
+                "nif_args": '_opts',
+                "nif_template": Template('${nif_name}(${nif_args}) ->\n    not_loaded(?LINE).\n'),
+            }
+        }
+        for kind, template in function_templates.items():
+            self.register_nif(kind, nif_name, template)
+
+            func_guard = batch_variant.function_guard(kind)
+            func_when_guard = when_guard(kind, func_guard)
+            module_func_args, module_func_args_with_opts = batch_variant.func_args(kind)
+            positional_args, positional_var = batch_variant.positional_args(kind)
+            function_spec = batch_variant.generate_spec(kind, module_func_name, False, include_opts=False)
+            function_spec_opts = batch_variant.generate_spec(kind, module_func_name, False, include_opts=True)
+
+            if module_func_args_with_opts:
+                func_args_with_opts = f'{positional_var}{batch_variant.opts_args(kind, in_func_body=True)}'
+                func_arity = len(module_func_args_with_opts.split(','))
+                function_code = StringIO()
+                if kind == 'elixir':
+                    function_code.write(f'  {function_spec_opts}\n'
+                        f'  def {module_func_name}({module_func_args_with_opts}) when {" and ".join(func_guard)} and (opts == nil or (is_list(opts) and is_tuple(hd(opts))))\n'
+                        '  do\n'
+                        f'    {positional_args}\n'
+                        f'    :evision_nif.{nif_name}({func_args_with_opts})\n'
+                        '     |> __to_struct__()\n'
+                        '  end\n')
+                    self.add_function_docs(kind, module_func_name, func_arity, inline_docs=inline_doc)
+                else:
+                    function_code.write(
+                        f'{module_func_name}({module_func_args_with_opts}) when {", ".join(func_guard)}, is_list(Options), is_tuple(hd(Options)), tuple_size(hd(Options)) == 2->\n'
+                        f'  {positional_args},\n'
+                        f'  Ret = evision_nif:{nif_name}({func_args_with_opts}),\n'
+                        "  '__to_struct__'(Ret).\n\n"
+                    )
+                    self.add_function_docs(kind, module_func_name, func_arity, inline_docs=inline_doc, typespec=function_spec_opts)
+                self.add_function(kind, module_func_name, func_arity,
+                    guards_count=3 + len(func_guard),
+                    generated_code=function_code.getvalue()
+                )
+
+            func_arity = len(module_func_args.split(','))
+            function_code = StringIO()
+            if kind == 'elixir':
+                function_code.write(f'  {function_spec}\n'
+                    f'  def {module_func_name}({module_func_args}){func_when_guard}do\n'
+                    f'    {positional_args}\n'
+                    f'    :evision_nif.{nif_name}({positional_var})\n'
+                    '    |> __to_struct__()\n'
+                    '  end\n')
+                self.add_function_docs(kind, module_func_name, func_arity, inline_doc)
+            else:
+                function_code.write(
+                    f'{module_func_name}({module_func_args}){func_when_guard}->\n'
+                    f'  {positional_args},\n'
+                    f'  Ret = evision_nif:{nif_name}({positional_var}),\n'
+                    "  '__to_struct__'(Ret).\n\n"
+                )
+                self.add_function_docs(kind, module_func_name, func_arity, inline_docs=inline_doc, typespec=function_spec)
+            self.add_function(kind, module_func_name, func_arity, guards_count=len(func_guard), generated_code=function_code.getvalue())
+
     def gen_property(self, full_qualified_name: str, class_name: str, property_name: str, property: ClassProp):
         # ======== step 1. generate property getter ========
         func_arity = 1
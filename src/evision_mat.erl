@@ -343,6 +343,25 @@ empty() ->
     Ret = evision_nif:mat_empty(),
     evision_internal_structurise:to_struct(Ret).
 
+set_allocator(Allocator) ->
+    set_allocator(Allocator, []).
+
+set_allocator(Allocator, Opts) when (Allocator == pooled orelse Allocator == default), is_list(Opts) ->
+    evision_nif:mat_set_allocator([{allocator, Allocator}, {max_cached_bytes, proplists:get_value(max_cached_bytes, Opts, nil)}]).
+
+memory_stats() ->
+    evision_nif:mat_memory_stats().
+
+set_memory_high_water(Bytes) ->
+    set_memory_high_water(Bytes, []).
+
+set_memory_high_water(Bytes, Opts) when (Bytes == nil orelse (is_integer(Bytes) andalso Bytes > 0)), is_list(Opts) ->
+    Pid = case proplists:get_value(notify, Opts) of
+        undefined -> whereis('Elixir.Evision.Internal.MemoryWatcher');
+        Notify -> Notify
+    end,
+    evision_nif:mat_set_memory_high_water([{bytes, Bytes}, {pid, Pid}]).
+
 to_binary(Mat) when is_tuple(Mat), tuple_size(Mat) > 0, element(1, Mat) == evision_mat ->
     MatRef = '__from_struct__'(Mat),
     Ret = evision_nif:mat_to_binary([{img, MatRef}]),
@@ -1,4 +1,100 @@
 defmodule Evision.Backend.Test do
   use ExUnit.Case
   doctest Evision.Backend
+
+  @tag :nx
+  test "Nx.to_batched" do
+    t = Nx.iota({5, 2, 3}, type: :f32, backend: Evision.Backend)
+    expected = Nx.iota({5, 2, 3}, type: :f32, backend: Nx.BinaryBackend)
+
+    for leftover <- [:repeat, :discard] do
+      batches = Enum.map(Nx.to_batched(t, 2, leftover: leftover), &Nx.to_binary/1)
+
+      assert batches ==
+               Enum.map(
+                 Nx.to_batched(expected, 2, leftover: leftover),
+                 &Nx.to_binary/1
+               )
+    end
+  end
+
+  @tag :nx
+  test "reductions" do
+    t = Nx.iota({2, 3, 4}, type: :f32, backend: Evision.Backend)
+    expected = Nx.iota({2, 3, 4}, type: :f32, backend: Nx.BinaryBackend)
+
+    for fun <- [:sum, :product, :reduce_max, :reduce_min, :all, :any],
+        opts <- [[], [axes: [1]], [axes: [0, 2], keep_axes: true]] do
+      assert Nx.to_flat_list(apply(Nx, fun, [t, opts])) ==
+               Nx.to_flat_list(apply(Nx, fun, [expected, opts]))
+    end
+
+    for fun <- [:argmax, :argmin], opts <- [[], [axis: 1], [axis: 2, tie_break: :high]] do
+      assert Nx.to_flat_list(apply(Nx, fun, [t, opts])) ==
+               Nx.to_flat_list(apply(Nx, fun, [expected, opts]))
+    end
+  end
+
+  @tag :nx
+  test "slice, put_slice, concatenate, gather and pad" do
+    t = Nx.iota({4, 5}, type: :f32, backend: Evision.Backend)
+    expected = Nx.iota({4, 5}, type: :f32, backend: Nx.BinaryBackend)
+
+    assert Nx.to_binary(Nx.slice(t, [1, 1], [3, 4], strides: [2, 3])) ==
+             Nx.to_binary(Nx.slice(expected, [1, 1], [3, 4], strides: [2, 3]))
+
+    slice = Nx.tensor([[-1.0, -2.0]], type: :f32)
+
+    assert Nx.to_binary(Nx.put_slice(t, [3, 4], slice)) ==
+             Nx.to_binary(Nx.put_slice(expected, [3, 4], slice))
+
+    assert Nx.to_binary(Nx.concatenate([t, t], axis: 1)) ==
+             Nx.to_binary(Nx.concatenate([expected, expected], axis: 1))
+
+    indices = Nx.tensor([[0, 0], [3, 4], [2, 1]])
+
+    assert Nx.to_binary(Nx.gather(t, indices)) ==
+             Nx.to_binary(Nx.gather(expected, indices))
+
+    config = [{1, -1, 1}, {-2, 2, 0}]
+
+    assert Nx.to_binary(Nx.pad(t, 0.5, config)) ==
+             Nx.to_binary(Nx.pad(expected, 0.5, config))
+  end
+
+  @tag :nx
+  test "element-wise math" do
+    t = Nx.tensor([0.1, 0.25, 0.5, 0.75], type: :f32, backend: Evision.Backend)
+    expected = Nx.tensor([0.1, 0.25, 0.5, 0.75], type: :f32, backend: Nx.BinaryBackend)
+
+    for fun <- [:log1p, :sigmoid, :sin, :cos, :tan, :asin, :atan, :tanh, :sqrt, :rsqrt, :cbrt, :erf] do
+      assert Nx.to_number(
+               Nx.all_close(
+                 Nx.backend_transfer(apply(Nx, fun, [t]), Nx.BinaryBackend),
+                 apply(Nx, fun, [expected])
+               )
+             ) == 1
+    end
+
+    assert Nx.to_number(
+             Nx.all_close(Nx.backend_transfer(Nx.power(t, 2), Nx.BinaryBackend), Nx.power(expected, 2))
+           ) == 1
+  end
+
+  @tag :nx
+  test "broadcast and element-wise ops on matrices larger than one chunk" do
+    t = Nx.iota({1, 2048, 1}, type: :f32, backend: Evision.Backend)
+    expected = Nx.iota({1, 2048, 1}, type: :f32, backend: Nx.BinaryBackend)
+
+    # 32 MiB, run in several chunks
+    shape = {4, 2048, 1024}
+    b = Nx.broadcast(t, shape)
+    assert Nx.shape(b) == shape
+    assert Nx.to_binary(b[[3, .., 1023]]) == Nx.to_binary(Nx.reshape(expected, {2048}))
+    assert Nx.to_binary(b[[0, 1000]]) == Nx.to_binary(Nx.broadcast(expected[[0, 1000]], {1024}))
+
+    assert Nx.to_binary(Nx.add(b, b)) == Nx.to_binary(Nx.broadcast(Nx.add(t, t), shape))
+    assert Nx.to_binary(Nx.multiply(b, 2)) == Nx.to_binary(Nx.broadcast(Nx.multiply(t, 2), shape))
+    assert Nx.to_binary(Nx.greater(b, 1000)) == Nx.to_binary(Nx.broadcast(Nx.greater(t, 1000), shape))
+  end
 end
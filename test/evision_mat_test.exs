@@ -42,6 +42,55 @@ defmodule Evision.Mat.Test do
     assert bin == mat_bin
   end
 
+  @tag :nx
+  test "convert between Evision.Mat and Nx.Tensor on Evision.Backend without copying" do
+    %Mat{} = mat = Evision.imread(Path.join([__DIR__, "testdata", "test.png"]))
+
+    t = Evision.Mat.to_nx(mat, Evision.Backend)
+    assert %Evision.Backend{ref: %Mat{} = tensor_mat} = t.data
+    assert Nx.shape(t) == mat.shape
+    assert tuple_size(mat.shape) == tensor_mat.dims
+    assert 1 == tensor_mat.channels
+
+    assert Nx.to_binary(t) == Nx.to_binary(Evision.Mat.to_nx(mat, Nx.BinaryBackend))
+    assert tensor_mat == Evision.Mat.from_nx(t)
+
+    %Mat{} = reshaped = Evision.Mat.from_nx(t, {Nx.size(t)})
+    assert Nx.to_binary(t) == Evision.Mat.to_binary(reshaped)
+  end
+
+  @tag :nx
+  test "from_nx keeps the shape of a squeezed tensor on Evision.Backend" do
+    t = Nx.tensor([[[1, 2, 3]]], type: :u8, backend: Evision.Backend)
+    squeezed = Nx.squeeze(t, axes: [0])
+    assert {1, 3} == Nx.shape(squeezed)
+
+    %Mat{} = mat = Evision.Mat.from_nx(squeezed)
+    assert {1, 3} == mat.shape
+    assert <<1, 2, 3>> == Evision.Mat.to_binary(mat)
+  end
+
+  @tag :nx
+  test "fused_elementwise" do
+    %Mat{} = img = Evision.imread(Path.join([__DIR__, "testdata", "test.png"]))
+    mean = Evision.Mat.number(100, :f32)
+
+    expr = {:clip, {:multiply, {:subtract, img, mean}, 1 / 64}, 0, 1}
+    %Mat{} = fused = Evision.Mat.fused_elementwise(expr, type: :f32)
+
+    assert fused.shape == img.shape
+    assert fused.type == {:f, 32}
+
+    expected =
+      img
+      |> Evision.Mat.to_nx(Nx.BinaryBackend)
+      |> Nx.subtract(100)
+      |> Nx.multiply(1 / 64)
+      |> Nx.clip(0, 1)
+
+    assert Nx.to_number(Nx.all_close(Evision.Mat.to_nx(fused, Nx.BinaryBackend), expected)) == 1
+  end
+
   @tag :nx
   test "convert from arbitrary tensor" do
     t = Nx.iota({2, 3, 2, 3, 2, 3}, type: {:s, 32})
@@ -87,6 +136,14 @@ defmodule Evision.Mat.Test do
     assert {441, 297, 3} = Evision.Mat.shape(bgr)
   end
 
+  @tag :nx
+  test "to_binary copies the data of a non-continuous view" do
+    mat = Evision.Mat.literal([[1, 2, 3], [4, 5, 6], [7, 8, 9]], :u8)
+    view = Evision.Mat.roi(mat, {0, 3}, {1, 3}, view: true)
+
+    assert <<2, 3, 5, 6, 8, 9>> == Evision.Mat.to_binary(view)
+  end
+
   @tag :nx
   test "update_roi" do
     image_tensor = Evision.Mat.literal([[[2, 2, 2]], [[2, 3, 4]], [[4, 5, 6]]], :u8)
@@ -181,4 +238,60 @@ defmodule Evision.Mat.Test do
                Evision.Mat.to_nx(Evision.Mat.update_roi(image_tensor, roi, patch_tensor))
              )
   end
+
+  test "pooled allocator reuses buffers of freed matrices" do
+    allocate_and_check = fn i ->
+      mat = Evision.Mat.full({480, 640, 3}, i, :u8)
+      assert Evision.Mat.shape(mat) == {480, 640, 3}
+      assert Evision.Mat.to_binary(mat) == :binary.copy(<<i>>, 480 * 640 * 3)
+      :ok
+    end
+
+    :ok = Evision.Mat.set_allocator(:pooled, max_cached_bytes: 16 * 1024 * 1024)
+
+    try do
+      size = 480 * 640 * 3
+      %{pool_cached_bytes: initial} = Evision.Mat.memory_stats()
+
+      # the matrix is freed when the garbage collector releases its resource
+      :ok = allocate_and_check.(1)
+      :erlang.garbage_collect()
+      %{pool_cached_bytes: cached} = Evision.Mat.memory_stats()
+      assert cached >= initial + size
+
+      # the next allocation of the same size takes the buffer out of the pool
+      mat = Evision.Mat.full({480, 640, 3}, 2, :u8)
+      %{pool_cached_bytes: reused} = Evision.Mat.memory_stats()
+      assert reused <= cached - size
+      assert Evision.Mat.to_binary(mat) == :binary.copy(<<2>>, size)
+    after
+      :ok = Evision.Mat.set_allocator(:default)
+    end
+
+    assert {:error, _} = :evision_nif.mat_set_allocator(allocator: :unknown)
+  end
+
+  test "memory_stats accounts the data of live matrices" do
+    %{live_bytes: before} = Evision.Mat.memory_stats()
+    mat = Evision.Mat.zeros({1024, 1024}, :f32)
+    %{live_bytes: live, live_mats: count, peak_bytes: peak} = Evision.Mat.memory_stats()
+    assert live >= before + 1024 * 1024 * 4
+    assert count >= 1
+    assert peak >= live
+    assert Evision.Mat.shape(mat) == {1024, 1024}
+  end
+
+  test "memory high-water mark notifies the given process" do
+    :ok = Evision.Mat.set_memory_high_water(1024, notify: self())
+
+    try do
+      _mat = Evision.Mat.zeros({64, 64}, :u8)
+      assert_receive {:evision_memory_high_water, live_bytes}
+      assert live_bytes > 1024
+    after
+      :ok = Evision.Mat.set_memory_high_water(nil)
+    end
+
+    assert %{high_water_mark: nil} = Evision.Mat.memory_stats()
+  end
 end
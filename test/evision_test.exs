@@ -7,6 +7,16 @@ defmodule Evision.Test do
     assert {:error, "empty matrix"} == Evision.imread("/dev/null")
   end
 
+  test "Evision.Constant.value and Evision.Constant.cv" do
+    require Evision.Constant
+
+    assert Evision.Constant.value(:COLOR_BGR2GRAY) == Evision.Constant.cv_COLOR_BGR2GRAY()
+    assert Evision.Constant.cv(:COLOR_BGR2GRAY) == Evision.Constant.cv_COLOR_BGR2GRAY()
+    assert Evision.Constant.cv(:IMREAD_ANYCOLOR) == 4
+
+    assert_raise KeyError, fn -> Evision.Constant.value(:NOT_AN_OPENCV_CONSTANT) end
+  end
+
   test "Evision.Mat.as_type" do
     %Mat{type: {:u, 8}} = mat = Evision.Mat.from_binary_by_shape(<<1, 2, 3, 4>>, {:u, 8}, {2, 2})
     %Mat{type: {:f, 32}} = mat = Evision.Mat.as_type(mat, {:f, 32})
@@ -31,6 +41,19 @@ defmodule Evision.Test do
     assert Evision.Mat.to_binary(cloned) == Evision.Mat.to_binary(mat)
   end
 
+  test "a Mat assigned to a property is not modified by in-place methods" do
+    state_post = <<1.0::float-size(32)-little, 2.0::float-size(32)-little>>
+    %Mat{} = state = Evision.Mat.from_binary(state_post, {:f, 32}, 2, 1, 1)
+
+    kf = Evision.KalmanFilter.kalmanFilter(2, 1)
+    kf = Evision.KalmanFilter.set_statePost(kf, state)
+
+    # `correct` writes the corrected state into `statePost`
+    measurement = Evision.Mat.from_binary(<<10.0::float-size(32)-little>>, {:f, 32}, 1, 1, 1)
+    %Mat{} = Evision.KalmanFilter.correct(kf, measurement)
+    assert Evision.Mat.to_binary(state) == state_post
+  end
+
   test "decode png from file w/o alpha channel" do
     %Mat{type: {:u, 8}, shape: {2, 3, 3}} =
       mat = Evision.imread(Path.join([__DIR__, "testdata", "test.png"]))
@@ -103,6 +126,21 @@ defmodule Evision.Test do
       Evision.imdecode(encoded, Evision.Constant.cv_IMREAD_ANYCOLOR())
   end
 
+  test "Evision.imencode_binary and Evision.imencode_binary_batch" do
+    mat = Evision.imread(Path.join([__DIR__, "testdata", "test.png"]))
+
+    assert Evision.imencode_binary(".png", mat) == Evision.imencode(".png", mat)
+
+    assert Evision.imencode_binary(".jpg", mat, quality: 50) ==
+             Evision.imencode(".jpg", mat, [Evision.Constant.cv_IMWRITE_JPEG_QUALITY(), 50])
+
+    {:error, "quality is only supported by .jpg, .jpeg, .jpe and .webp"} =
+      Evision.imencode_binary(".png", mat, quality: 50)
+
+    encoded = Evision.imencode_binary_batch(".jpg", [mat, mat, mat], quality: 80)
+    assert encoded == List.duplicate(Evision.imencode_binary(".jpg", mat, quality: 80), 3)
+  end
+
   test "Evision.resize" do
     mat = Evision.imread(Path.join([__DIR__, "testdata", "test.png"]))
 
@@ -113,6 +151,34 @@ defmodule Evision.Test do
       Evision.resize(mat, {resize_height, resize_width})
   end
 
+  test "Evision.resize_batch" do
+    mat = Evision.imread(Path.join([__DIR__, "testdata", "test.png"]))
+
+    resize_height = 4
+    resize_width = 6
+
+    [%Mat{shape: {^resize_width, ^resize_height, 3}} = first, %Mat{} = second] =
+      Evision.resize_batch([mat, mat], {resize_height, resize_width})
+
+    assert Evision.Mat.to_binary(first) == Evision.Mat.to_binary(second)
+
+    assert Evision.Mat.to_binary(first) ==
+             Evision.Mat.to_binary(Evision.resize(mat, {resize_height, resize_width}))
+
+    assert [] == Evision.resize_batch([], {resize_height, resize_width})
+  end
+
+  test "Evision.threshold_batch" do
+    mat = Evision.Mat.literal([[0, 100], [200, 255]], :u8)
+
+    {[retval, retval], [%Mat{} = dst, dst2]} =
+      Evision.threshold_batch([mat, mat], 127, 255, Evision.Constant.cv_THRESH_BINARY())
+
+    assert retval == 127
+    assert Evision.Mat.to_binary(dst) == <<0, 0, 255, 255>>
+    assert Evision.Mat.to_binary(dst2) == <<0, 0, 255, 255>>
+  end
+
   test "Evision.imwrite" do
     input_path = Path.join([__DIR__, "testdata", "test.png"])
     output_path = Path.join([__DIR__, "testdata", "imwrite_test.png"])
@@ -323,6 +389,33 @@ defmodule Evision.Test do
     } = Evision.Mat.roi(img, :all, {20, 200})
   end
 
+  test "Evision.Mat.roi with view: true" do
+    %Evision.Mat{} =
+      img = Evision.imread(Path.join([__DIR__, "testdata", "qr_detector_test.png"]))
+
+    copied = Evision.Mat.roi(img, {10, 10, 100, 200})
+    %Evision.Mat{shape: {200, 100, 3}} = view = Evision.Mat.roi(img, {10, 10, 100, 200}, view: true)
+    assert Evision.Mat.isSubmatrix(view)
+    assert Evision.Mat.to_binary(copied) == Evision.Mat.to_binary(view)
+
+    copied = Evision.Mat.roi(img, {10, 100}, {20, 200})
+    %Evision.Mat{shape: {90, 180, 3}} = view = Evision.Mat.roi(img, {10, 100}, {20, 200}, view: true)
+    assert Evision.Mat.to_binary(copied) == Evision.Mat.to_binary(view)
+    assert Evision.Mat.at(copied, 100) == Evision.Mat.at(view, 100)
+
+    copied = Evision.Mat.roi(img, [{10, 100}, {10, 100}])
+    %Evision.Mat{shape: {90, 90, 3}} = view = Evision.Mat.roi(img, [{10, 100}, {10, 100}], view: true)
+    assert Evision.Mat.to_binary(copied) == Evision.Mat.to_binary(view)
+
+    # the view is still valid after the parent is gone
+    view =
+      Evision.Mat.from_binary_by_shape(Evision.Mat.to_binary(img), {:u, 8}, img.shape)
+      |> Evision.Mat.roi([{10, 100}, {10, 100}], view: true)
+
+    :erlang.garbage_collect()
+    assert Evision.Mat.to_binary(copied) == Evision.Mat.to_binary(view)
+  end
+
   test "Evision.warpPerspective" do
     # Code translated from https://stackoverflow.com/a/64837860
     # read input
@@ -0,0 +1,75 @@
+defmodule Evision.Gen2Manifest.Test do
+  use ExUnit.Case
+
+  @moduletag timeout: 300_000
+
+  @fixtures_dir Path.join([__DIR__, "testdata", "gen2"])
+  @gen2 Path.join([__DIR__, "..", "py_src", "gen2.py"]) |> Path.expand()
+
+  defp generate(manifest) do
+    name = "evision-gen2-manifest-#{System.unique_integer([:positive])}"
+    tmp_dir = Path.join(System.tmp_dir!(), name)
+    c_src = Path.join(tmp_dir, "c_src")
+    elixir_gen = Path.join(tmp_dir, "lib")
+    erlang_gen = Path.join(tmp_dir, "src")
+    manifest_path = Path.join(tmp_dir, "evision.manifest")
+
+    # gen2.py reads the annotations of hand-written NIFs from `c_src/modules`
+    File.mkdir_p!(c_src)
+    File.cp_r!(Path.join([__DIR__, "..", "c_src", "modules"]), Path.join(c_src, "modules"))
+    File.write!(manifest_path, manifest)
+
+    # paths in headers.txt are relative to the fixtures dir
+    {output, status} =
+      System.cmd(
+        "python3",
+        [
+          @gen2,
+          "--headers=headers.txt",
+          "--lang=elixir,erlang",
+          "--jobs=1",
+          "--c_src=#{c_src}",
+          "--elixir_gen=#{elixir_gen}",
+          "--erlang_gen=#{erlang_gen}",
+          "--manifest=#{manifest_path}"
+        ],
+        cd: @fixtures_dir,
+        stderr_to_stdout: true
+      )
+
+    assert status == 0, output
+    tmp_dir
+  end
+
+  @tag :require_python
+  test "a minimal manifest keeps the functions and constants evision's own modules use" do
+    tmp_dir = generate("cv::GaussianBlur\n")
+
+    try do
+      evision = File.read!(Path.join([tmp_dir, "lib", "evision.ex"]))
+
+      # in the manifest
+      assert evision =~ "  def gaussianBlur("
+      # used by Evision.Mat and Evision.Zoo
+      for name <- ["imread", "imencode", "resize", "cvtColor", "merge", "addWeighted"] do
+        assert evision =~ "  def #{name}(", "#{name} is missing"
+      end
+
+      # left out by the manifest
+      refute evision =~ "  def threshold("
+
+      # used by the ML smart cells, including inherited methods
+      svm = File.read!(Path.join([tmp_dir, "lib", "evision_ml_svm.ex"]))
+      assert svm =~ "  def setKernel("
+      assert svm =~ "  def train("
+
+      constants = File.read!(Path.join([tmp_dir, "lib", "evision_constant.ex"]))
+
+      for name <- ["COLOR_RGB2BGR", "INTER_NEAREST", "ROW_SAMPLE", "C_SVC"] do
+        assert constants =~ "    #{name}: ", "#{name} is missing"
+      end
+    after
+      File.rm_rf!(tmp_dir)
+    end
+  end
+end
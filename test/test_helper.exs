@@ -75,6 +75,8 @@ ExUnit.configure(
     # (could set up a virtual camera, but let's leave that for now)
     require_ffmpeg: true,
     require_cuda: true,
+    # tests that run py_src/gen2.py
+    require_python: System.find_executable("python3") == nil,
     dnn: !compiled_modules.dnn,
     ml: !compiled_modules.ml,
     photo: !compiled_modules.photo,
@@ -25,4 +25,96 @@ defmodule Evision.VideoCapture.Test do
     video = Evision.VideoCapture.release(video)
     false = Evision.VideoCapture.read(video)
   end
+
+  @tag :video
+  @tag :require_ffmpeg
+  test "open a video file with a charlist filename" do
+    # the Erlang bindings pass strings as charlists to the overloaded NIF
+    path = Path.join([__DIR__, "testdata", "videocapture_test.mp4"])
+
+    %Evision.VideoCapture{isOpened: true} =
+      video =
+      :evision_nif.videoCapture_VideoCapture(filename: String.to_charlist(path))
+      |> Evision.VideoCapture.__to_struct__()
+
+    Evision.VideoCapture.release(video)
+  end
+
+  @tag :video
+  @tag :require_ffmpeg
+  test "stream frames of a video file" do
+    path = Path.join([__DIR__, "testdata", "videocapture_test.mp4"])
+
+    frames =
+      Evision.VideoCapture.videoCapture(path)
+      |> Evision.VideoCapture.stream(buffer: 2)
+      |> Enum.map(fn %Evision.Mat{shape: shape} -> shape end)
+
+    assert frames == List.duplicate({1080, 1920, 3}, 18)
+
+    # every other frame
+    count =
+      Evision.VideoCapture.videoCapture(path)
+      |> Evision.VideoCapture.stream(skip: 1)
+      |> Enum.count()
+
+    assert count == 9
+
+    # halting the stream stops the decode thread
+    [%Evision.Mat{}] =
+      Evision.VideoCapture.videoCapture(path)
+      |> Evision.VideoCapture.stream(mode: :drop_oldest)
+      |> Enum.take(1)
+  end
+
+  @tag :video
+  @tag :require_ffmpeg
+  test "stop a stream from several processes at once" do
+    path = Path.join([__DIR__, "testdata", "videocapture_test.mp4"])
+    video = Evision.VideoCapture.videoCapture(path)
+
+    stream =
+      :evision_nif.videoCapture_stream_start(cap: video.ref, buffer: 1, mode: :block, skip: 0)
+
+    results =
+      1..8
+      |> Enum.map(fn _ ->
+        Task.async(fn -> :evision_nif.videoCapture_stream_stop(stream: stream) end)
+      end)
+      |> Task.await_many()
+
+    assert Enum.all?(results, &match?({:ok, _}, &1))
+  end
+
+  @tag :video
+  @tag :require_ffmpeg
+  test "poll video captures without blocking the caller" do
+    path = Path.join([__DIR__, "testdata", "videocapture_test.mp4"])
+    caps = [Evision.VideoCapture.videoCapture(path), Evision.VideoCapture.videoCapture(path)]
+
+    {poller, ref} = Evision.VideoCapture.poller(caps)
+    assert is_reference(ref)
+    :ok = Evision.VideoCapture.poll(poller, 10_000_000)
+
+    # not every backend supports waitAny, the owner is notified either way
+    assert_receive {:evision_videocapture_ready, ^ref, result}, 5_000
+    assert is_list(result) or match?({:error, _}, result)
+
+    :ok = Evision.VideoCapture.stop_poller(poller)
+    {:error, "poller was stopped"} = Evision.VideoCapture.poll(poller, 10_000_000)
+  end
+
+  @tag :video
+  @tag :require_ffmpeg
+  test "stop a poller from several processes at once" do
+    path = Path.join([__DIR__, "testdata", "videocapture_test.mp4"])
+    {poller, _ref} = Evision.VideoCapture.poller([Evision.VideoCapture.videoCapture(path)])
+
+    results =
+      1..8
+      |> Enum.map(fn _ -> Task.async(fn -> Evision.VideoCapture.stop_poller(poller) end) end)
+      |> Task.await_many()
+
+    assert Enum.all?(results, &(&1 == :ok))
+  end
 end